@@ -1,736 +1,677 @@
-"""MCP Analysis Support Server."""
+"""MCP Analysis Support Server.
+
+各分析ツールがセッションごとに保持する状態は__slots__付きのクラスで表現し、
+多数のセッションが蓄積してもセッションあたりのメモリ使用量を抑える.
+"""
+
+from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List
+import json
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, TypeVar, cast
 import logging
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # orjsonは任意依存（未インストール時は標準jsonを使用）
+    HAS_ORJSON = False
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool
 from mcp.server.models import InitializationOptions
 
 from .tools.why_analysis import WhyAnalysis
-from .tools.mece import MECE
-from .tools.scamper import SCAMPER
-from .tools.rbs import RBS
-from .tools.mshell import MShell
+from .tools.mece import MECE, FRAMEWORKS
+from .tools.scamper import SCAMPER, TECHNIQUE_NAMES
+from .tools.rbs import RBS, RiskCategory
+from .tools.mshell import MShell, MShellElement
 
 
-# ロギング設定
-logging.basicConfig(level=logging.INFO)
+# ロギング設定（ログレベルはmain()で環境変数から設定する）
 logger = logging.getLogger(__name__)
 
 # サーバー初期化  
 server: Server = Server("analysis-support")
 
-# 分析ツール初期化
-why_analyzer = WhyAnalysis()
-mece_analyzer = MECE()
-scamper_analyzer = SCAMPER()
-rbs_analyzer = RBS()
-mshell_analyzer = MShell()
+# 分析ツール（初回利用時に生成する）
+_T = TypeVar("_T")
+_analyzers: dict[type, Any] = {}
 
-# MCPツール定義
-TOOLS = [
-    # 5Why分析ツール
-    Tool(
-        name="why_analysis_start",
-        description="5Why分析を開始して根本原因を特定する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "problem": {
-                    "type": "string",
-                    "description": "分析したい問題や現象"
-                },
-                "context": {
-                    "type": "string",
-                    "description": "問題の背景情報（オプション）"
-                }
-            },
-            "required": ["problem"]
-        }
+
+def _get_analyzer(cls: type[_T]) -> _T:
+    """分析ツールのインスタンスを取得する（未生成なら生成する）."""
+    analyzer = _analyzers.get(cls)
+    if analyzer is None:
+        analyzer = _analyzers[cls] = cls()
+    return cast(_T, analyzer)
+
+
+# 複数のツールで共通するスキーマ断片（読み取り専用として共有する）
+_STRING_ITEMS: dict[str, Any] = {"type": "string"}
+
+
+def _string(description: str) -> dict[str, Any]:
+    """文字列プロパティのスキーマを生成する."""
+    return {"type": "string", "description": description}
+
+
+def _string_list(description: str) -> dict[str, Any]:
+    """文字列リストプロパティのスキーマを生成する."""
+    return {"type": "array", "items": _STRING_ITEMS, "description": description}
+
+
+def _enum(description: str, values: list[str]) -> dict[str, Any]:
+    """列挙値プロパティのスキーマを生成する."""
+    return {"type": "string", "description": description, "enum": values}
+
+
+_WHY_ID_PROP = _string("分析ID")
+_SCAMPER_SESSION_ID_PROP = _string("SCAMPERセッションのID")
+_RBS_ID_PROP = _string("RBS分析のID")
+_MSHELL_ID_PROP = _string("m-SHELL分析のID")
+_SCAMPER_TOPIC_PROPS: dict[str, Any] = {
+    "topic": _string("創造的思考を適用したいトピックや課題"),
+    "current_situation": _string("現在の状況や問題の詳細"),
+    "context": _string("背景情報や制約条件（オプション）")
+}
+# 列挙値は各分析器の定義から一度だけ生成し、全スキーマで同じリストを参照する
+_MSHELL_ELEMENTS: list[str] = [element.value for element in MShellElement]
+_RISK_CATEGORIES: list[str] = [category.value for category in RiskCategory]
+_FRAMEWORKS: list[str] = ["auto", *FRAMEWORKS]
+
+# 専用フレームワーク分析ツール: ツール名 → (フレームワーク, 説明, トピックの説明)
+_FRAMEWORK_TOOLS: dict[str, tuple[str, str, str]] = {
+    "swot_analysis": (
+        "SWOT", "SWOT分析を直接実行する（強み・弱み・機会・脅威の分析）", "SWOT分析を行う対象・テーマ"
     ),
-    Tool(
-        name="why_analysis_add_answer",
-        description="5Why分析の質問に回答し、次のWhyを生成する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "分析ID"
-                },
-                "level": {
-                    "type": "integer",
-                    "description": "回答するWhyのレベル（0から4）"
-                },
-                "answer": {
-                    "type": "string",
-                    "description": "質問への回答"
-                }
-            },
-            "required": ["analysis_id", "level", "answer"]
-        }
+    "4p_analysis": (
+        "4P", "4P分析を直接実行する（Product・Price・Place・Promotionの分析）", "4P分析を行う商品・サービス"
     ),
-    Tool(
-        name="why_analysis_get",
-        description="5Why分析の現在の状況を取得する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "分析ID"
-                }
-            },
-            "required": ["analysis_id"]
-        }
+    "3c_analysis": (
+        "3C", "3C分析を直接実行する（Customer・Competitor・Companyの分析）", "3C分析を行うビジネス・市場"
     ),
-    Tool(
-        name="why_analysis_list",
-        description="すべての5Why分析の一覧を取得する",
-        inputSchema={
-            "type": "object",
-            "properties": {}
-        }
+    "timeline_analysis": (
+        "時系列", "時系列分析を直接実行する（過去・現在・未来の時間軸での分析）", "時系列分析を行う対象・テーマ"
+    ),
+    "internal_external_analysis": (
+        "内外", "内外分析を直接実行する（内部要因・外部要因の分析）", "内外分析を行う対象・組織・システム"
     ),
+}
+
+# ツール定義テーブル: (ツール名, 説明, プロパティ, 必須パラメータ)
+_TOOL_SPECS: tuple[tuple[str, str, dict[str, Any], tuple[str, ...]], ...] = (
+    # 5Why分析ツール
+    ("why_analysis_start", "5Why分析を開始して根本原因を特定する", {
+        "problem": _string("分析したい問題や現象"),
+        "context": _string("問題の背景情報（オプション）")
+    }, ("problem",)),
+    ("why_analysis_add_answer", "5Why分析の質問に回答し、次のWhyを生成する", {
+        "analysis_id": _WHY_ID_PROP,
+        "level": {"type": "integer", "description": "回答するWhyのレベル（0から4）"},
+        "answer": _string("質問への回答")
+    }, ("analysis_id", "level", "answer")),
+    ("why_analysis_get", "5Why分析の現在の状況を取得する", {
+        "analysis_id": _WHY_ID_PROP
+    }, ("analysis_id",)),
+    ("why_analysis_list", "すべての5Why分析の一覧を取得する", {}, ()),
     
     # MECE分析ツール
-    Tool(
-        name="mece_analyze_categories",
-        description="カテゴリのMECE分析を実行して重複や漏れを検証する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "分析対象のトピック"
-                },
-                "categories": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "分析するカテゴリのリスト"
-                }
-            },
-            "required": ["topic", "categories"]
-        }
-    ),
-    Tool(
-        name="mece_create_structure",
-        description="トピックに対するMECE構造を提案する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "構造を作成したいトピック"
-                },
-                "framework": {
-                    "type": "string",
-                    "description": "使用するフレームワーク",
-                    "enum": ["auto", "4P", "3C", "SWOT", "時系列", "内外"],
-                    "default": "auto"
-                }
-            },
-            "required": ["topic"]
-        }
-    ),
+    ("mece_analyze_categories", "カテゴリのMECE分析を実行して重複や漏れを検証する", {
+        "topic": _string("分析対象のトピック"),
+        "categories": _string_list("分析するカテゴリのリスト")
+    }, ("topic", "categories")),
+    ("mece_create_structure", "トピックに対するMECE構造を提案する", {
+        "topic": _string("構造を作成したいトピック"),
+        "framework": {**_enum("使用するフレームワーク", _FRAMEWORKS), "default": "auto"}
+    }, ("topic",)),
     
     # 専用フレームワーク分析ツール
-    Tool(
-        name="swot_analysis",
-        description="SWOT分析を直接実行する（強み・弱み・機会・脅威の分析）",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "SWOT分析を行う対象・テーマ"
-                }
-            },
-            "required": ["topic"]
-        }
-    ),
-    Tool(
-        name="4p_analysis",
-        description="4P分析を直接実行する（Product・Price・Place・Promotionの分析）",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "4P分析を行う商品・サービス"
-                }
-            },
-            "required": ["topic"]
-        }
-    ),
-    Tool(
-        name="3c_analysis",
-        description="3C分析を直接実行する（Customer・Competitor・Companyの分析）",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "3C分析を行うビジネス・市場"
-                }
-            },
-            "required": ["topic"]
-        }
-    ),
-    Tool(
-        name="timeline_analysis",
-        description="時系列分析を直接実行する（過去・現在・未来の時間軸での分析）",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "時系列分析を行う対象・テーマ"
-                }
-            },
-            "required": ["topic"]
-        }
-    ),
-    Tool(
-        name="internal_external_analysis",
-        description="内外分析を直接実行する（内部要因・外部要因の分析）",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "内外分析を行う対象・組織・システム"
-                }
-            },
-            "required": ["topic"]
-        }
+    *(
+        (name, description, {"topic": _string(topic_description)}, ("topic",))
+        for name, (_, description, topic_description) in _FRAMEWORK_TOOLS.items()
     ),
     
     # SCAMPER法ツール
-    Tool(
-        name="scamper_start_session",
-        description="SCAMPER創造的思考セッションを開始する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "創造的思考を適用したいトピックや課題"
+    ("scamper_start_session", "SCAMPER創造的思考セッションを開始する",
+     _SCAMPER_TOPIC_PROPS, ("topic", "current_situation")),
+    ("scamper_apply_technique", "指定されたSCAMPER技法でアイデアを生成する", {
+        "session_id": _SCAMPER_SESSION_ID_PROP,
+        "technique": _enum("適用するSCAMPER技法", TECHNIQUE_NAMES),
+        "ideas": _string_list("生成したアイデアのリスト"),
+        "explanations": _string_list("各アイデアの説明（オプション）")
+    }, ("session_id", "technique", "ideas")),
+    ("scamper_evaluate_ideas", "生成されたアイデアを実現可能性とインパクトで評価する", {
+        "session_id": _SCAMPER_SESSION_ID_PROP,
+        "idea_evaluations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "description": "アイデアID（指定時は文面より優先）"},
+                    "idea": {"type": "string"},
+                    "feasibility": {"type": "integer", "minimum": 0, "maximum": 10},
+                    "impact": {"type": "integer", "minimum": 0, "maximum": 10}
                 },
-                "current_situation": {
-                    "type": "string",
-                    "description": "現在の状況や問題の詳細"
-                },
-                "context": {
-                    "type": "string",
-                    "description": "背景情報や制約条件（オプション）"
-                }
+                "required": ["feasibility", "impact"],
+                "anyOf": [{"required": ["id"]}, {"required": ["idea"]}]
             },
-            "required": ["topic", "current_situation"]
+            "description": "アイデア評価のリスト"
         }
-    ),
-    Tool(
-        name="scamper_apply_technique",
-        description="指定されたSCAMPER技法でアイデアを生成する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "session_id": {
-                    "type": "string",
-                    "description": "SCAMPERセッションのID"
-                },
-                "technique": {
-                    "type": "string",
-                    "description": "適用するSCAMPER技法",
-                    "enum": ["substitute", "combine", "adapt", "modify", "put_to_other_use", "eliminate", "reverse", "代替", "結合", "応用", "変更", "転用", "除去", "逆転"]
-                },
-                "ideas": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "生成したアイデアのリスト"
+    }, ("session_id", "idea_evaluations")),
+    ("scamper_get_session", "SCAMPERセッションの現在の状況を取得する", {
+        "session_id": _SCAMPER_SESSION_ID_PROP
+    }, ("session_id",)),
+    ("scamper_list_sessions", "すべてのSCAMPERセッションの一覧を取得する", {}, ()),
+    ("scamper_generate_comprehensive", "全てのSCAMPER技法を適用して包括的なアイデアを生成する",
+     _SCAMPER_TOPIC_PROPS, ("topic", "current_situation")),
+    
+    # PMBOK RBSツール
+    ("rbs_create_structure", "プロジェクトのリスク分類構造を作成する", {
+        "project_name": _string("プロジェクト名"),
+        "project_type": _string("プロジェクトの種類"),
+        "context": _string("プロジェクトの背景情報（オプション）")
+    }, ("project_name", "project_type")),
+    ("rbs_identify_risks", "カテゴリ別リスク識別支援を実行する", {
+        "analysis_id": _RBS_ID_PROP,
+        "category": _enum("リスクカテゴリ", _RISK_CATEGORIES),
+        "subcategory": _string("リスクサブカテゴリ"),
+        "custom_risks": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "probability": {"type": "integer", "minimum": 1, "maximum": 5},
+                    "impact": {"type": "integer", "minimum": 1, "maximum": 5}
                 },
-                "explanations": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "各アイデアの説明（オプション）"
-                }
+                "required": ["name", "description"]
             },
-            "required": ["session_id", "technique", "ideas"]
+            "description": "識別したリスクのリスト"
         }
-    ),
-    Tool(
-        name="scamper_evaluate_ideas",
-        description="生成されたアイデアを実現可能性とインパクトで評価する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "session_id": {
-                    "type": "string",
-                    "description": "SCAMPERセッションのID"
+    }, ("analysis_id", "category", "subcategory", "custom_risks")),
+    ("rbs_evaluate_risks", "リスク評価マトリックスを生成する", {
+        "analysis_id": _RBS_ID_PROP
+    }, ("analysis_id",)),
+    ("rbs_get_analysis", "RBS分析の現在の状況を取得する", {
+        "analysis_id": _RBS_ID_PROP
+    }, ("analysis_id",)),
+    ("rbs_list_analyses", "すべてのRBS分析の一覧を取得する", {}, ()),
+    
+    # m-SHELLモデルツール
+    ("mshell_create_analysis", "m-SHELL分析を開始してヒューマンファクター分析を実行する", {
+        "system_name": _string("分析対象システムの名称"),
+        "analysis_purpose": _string("分析の目的・背景"),
+        "context": _string("分析の文脈・詳細情報（オプション）")
+    }, ("system_name", "analysis_purpose")),
+    ("mshell_analyze_element", "m-SHELLモデルの特定要素を分析する", {
+        "analysis_id": _MSHELL_ID_PROP,
+        "element": _enum("分析対象要素", _MSHELL_ELEMENTS),
+        "findings": _string_list("分析結果・発見事項のリスト"),
+        "severity": {
+            "type": "integer",
+            "description": "重要度（1:軽微, 2:中程度, 3:重要, 4:致命的）",
+            "minimum": 1,
+            "maximum": 4,
+            "default": 2
+        },
+        "recommendations": _string_list("改善推奨事項のリスト（オプション）")
+    }, ("analysis_id", "element", "findings")),
+    ("mshell_analyze_interface", "m-SHELL要素間のインターフェースを分析する", {
+        "analysis_id": _MSHELL_ID_PROP,
+        "element1": _enum("インターフェース分析対象要素1", _MSHELL_ELEMENTS),
+        "element2": _enum("インターフェース分析対象要素2", _MSHELL_ELEMENTS),
+        "issues": _string_list("インターフェース問題・課題のリスト"),
+        "quality_score": {
+            "type": "integer",
+            "description": "インターフェース品質スコア（1-10）",
+            "minimum": 1,
+            "maximum": 10,
+            "default": 5
+        }
+    }, ("analysis_id", "element1", "element2", "issues")),
+    ("mshell_evaluate_system", "m-SHELLシステム全体を評価する", {
+        "analysis_id": _MSHELL_ID_PROP
+    }, ("analysis_id",)),
+    ("mshell_get_analysis", "m-SHELL分析の現在の状況を取得する", {
+        "analysis_id": _MSHELL_ID_PROP,
+        "include_details": {
+            "type": "boolean",
+            "description": "要素・インターフェース分析の個別結果を含めるか（falseの場合は件数とサマリーのみ）",
+            "default": True
+        }
+    }, ("analysis_id",)),
+    ("mshell_list_analyses", "すべてのm-SHELL分析の一覧を取得する", {}, ()),
+    
+    # 一括実行ツール
+    ("batch_execute", "複数のツール呼び出しを1回のリクエストでまとめて実行する", {
+        "operations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "arguments": {"type": "object"}
                 },
-                "idea_evaluations": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "idea": {"type": "string"},
-                            "feasibility": {"type": "integer", "minimum": 0, "maximum": 10},
-                            "impact": {"type": "integer", "minimum": 0, "maximum": 10}
-                        },
-                        "required": ["idea", "feasibility", "impact"]
-                    },
-                    "description": "アイデア評価のリスト"
-                }
+                "required": ["name"]
             },
-            "required": ["session_id", "idea_evaluations"]
+            "description": "実行するツール呼び出しのリスト"
+        },
+        "max_concurrent": {
+            "type": "integer",
+            "description": "同時実行数の上限",
+            "minimum": 1,
+            "default": 4
+        },
+        "stop_on_error": {
+            "type": "boolean",
+            "description": "エラー発生時に以降の操作を中止するか",
+            "default": False
         }
+    }, ("operations",)),
+)
+
+
+def _object_schema(properties: dict[str, Any], required: tuple[str, ...]) -> dict[str, Any]:
+    """ツールのinputSchemaを生成する."""
+    schema: dict[str, Any] = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = list(required)
+    return schema
+
+
+# MCPツール定義（不変のタプルとして保持し、list_toolsでそのまま返す）
+TOOLS: tuple[Tool, ...] = tuple(
+    Tool(name=name, description=description, inputSchema=_object_schema(properties, required))
+    for name, description, properties, required in _TOOL_SPECS
+)
+
+
+# 有効なツール名の集合（未知のツール名をディスパッチ前に判定する）
+VALID_NAMES = frozenset(tool.name for tool in TOOLS)
+
+# ツールごとの引数バリデーター（起動時に一度だけ構築し、呼び出しごとに再利用する）
+VALIDATORS: dict[str, Draft202012Validator] = {
+    tool.name: Draft202012Validator(tool.inputSchema) for tool in TOOLS
+}
+
+
+class AnalysisError(Exception):
+    """ツール実行時の既知の失敗（メッセージはそのまま利用者に返す）."""
+
+
+def _arguments_error(name: str, arguments: dict[str, Any]) -> str | None:
+    """引数をinputSchemaで検証し、不正があればエラーメッセージを返す."""
+    error = best_match(VALIDATORS[name].iter_errors(arguments))
+    if error is None:
+        return None
+    if error.validator == "required" and not error.path:
+        missing = [key for key in error.validator_value if key not in arguments]
+        return f"❌ パラメータエラー: 必須パラメータ {', '.join(missing)} が指定されていません"
+    location = ".".join(str(part) for part in error.absolute_path) or "arguments"
+    return f"❌ パラメータエラー: {location}: {error.message}"
+
+
+@server.list_tools()
+async def list_tools() -> tuple[Tool, ...]:
+    """利用可能なツールのリストを返す."""
+    logger.debug("Listing %d available analysis tools", len(TOOLS))
+    return TOOLS
+
+
+def _framework_handler(framework: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """フレームワークを固定したMECE構造作成ハンドラーを生成する."""
+    return lambda a: _get_analyzer(MECE).create_mece_structure(a["topic"], framework)
+
+
+# ツール名 → 分析ハンドラーのディスパッチテーブル
+# 各ハンドラーは_run_toolによりワーカースレッド上で実行される
+DISPATCH: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    # 5Why分析ツール
+    "why_analysis_start": lambda a: _get_analyzer(WhyAnalysis).start_analysis(
+        a["problem"],
+        a.get("context")
     ),
-    Tool(
-        name="scamper_get_session",
-        description="SCAMPERセッションの現在の状況を取得する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "session_id": {
-                    "type": "string",
-                    "description": "SCAMPERセッションのID"
-                }
-            },
-            "required": ["session_id"]
-        }
+    "why_analysis_add_answer": lambda a: _get_analyzer(WhyAnalysis).add_answer(
+        a["analysis_id"],
+        a["level"],
+        a["answer"]
     ),
-    Tool(
-        name="scamper_list_sessions",
-        description="すべてのSCAMPERセッションの一覧を取得する",
-        inputSchema={
-            "type": "object",
-            "properties": {}
-        }
+    "why_analysis_get": lambda a: _get_analyzer(WhyAnalysis).get_analysis(a["analysis_id"]),
+    "why_analysis_list": lambda a: _get_analyzer(WhyAnalysis).list_analyses(),
+
+    # MECE分析ツール
+    "mece_analyze_categories": lambda a: _get_analyzer(MECE).analyze_categories(
+        a["topic"],
+        a["categories"]
     ),
-    Tool(
-        name="scamper_generate_comprehensive",
-        description="全てのSCAMPER技法を適用して包括的なアイデアを生成する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "創造的思考を適用したいトピックや課題"
-                },
-                "current_situation": {
-                    "type": "string",
-                    "description": "現在の状況や問題の詳細"
-                },
-                "context": {
-                    "type": "string",
-                    "description": "背景情報や制約条件（オプション）"
-                }
-            },
-            "required": ["topic", "current_situation"]
-        }
+    "mece_create_structure": lambda a: _get_analyzer(MECE).create_mece_structure(
+        a["topic"],
+        a.get("framework", "auto")
     ),
-    
-    # PMBOK RBSツール
-    Tool(
-        name="rbs_create_structure",
-        description="プロジェクトのリスク分類構造を作成する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "project_name": {
-                    "type": "string",
-                    "description": "プロジェクト名"
-                },
-                "project_type": {
-                    "type": "string",
-                    "description": "プロジェクトの種類"
-                },
-                "context": {
-                    "type": "string",
-                    "description": "プロジェクトの背景情報（オプション）"
-                }
-            },
-            "required": ["project_name", "project_type"]
-        }
+
+    # 専用フレームワーク分析ツール
+    **{
+        name: _framework_handler(framework)
+        for name, (framework, _, _) in _FRAMEWORK_TOOLS.items()
+    },
+
+    # SCAMPER法ツール
+    "scamper_start_session": lambda a: _get_analyzer(SCAMPER).start_session(
+        a["topic"],
+        a["current_situation"],
+        a.get("context", "")
     ),
-    Tool(
-        name="rbs_identify_risks",
-        description="カテゴリ別リスク識別支援を実行する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "RBS分析のID"
-                },
-                "category": {
-                    "type": "string",
-                    "description": "リスクカテゴリ",
-                    "enum": ["技術的リスク", "外部リスク", "組織リスク", "プロジェクト管理リスク"]
-                },
-                "subcategory": {
-                    "type": "string",
-                    "description": "リスクサブカテゴリ"
-                },
-                "custom_risks": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "description": {"type": "string"},
-                            "probability": {"type": "integer", "minimum": 1, "maximum": 5},
-                            "impact": {"type": "integer", "minimum": 1, "maximum": 5}
-                        },
-                        "required": ["name", "description"]
-                    },
-                    "description": "識別したリスクのリスト"
-                }
-            },
-            "required": ["analysis_id", "category", "subcategory", "custom_risks"]
-        }
+    "scamper_apply_technique": lambda a: _get_analyzer(SCAMPER).apply_technique(
+        a["session_id"],
+        a["technique"],
+        a["ideas"],
+        a.get("explanations")
     ),
-    Tool(
-        name="rbs_evaluate_risks",
-        description="リスク評価マトリックスを生成する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "RBS分析のID"
-                }
-            },
-            "required": ["analysis_id"]
-        }
+    "scamper_evaluate_ideas": lambda a: _get_analyzer(SCAMPER).evaluate_ideas(
+        a["session_id"],
+        a["idea_evaluations"]
     ),
-    Tool(
-        name="rbs_get_analysis",
-        description="RBS分析の現在の状況を取得する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "RBS分析のID"
-                }
-            },
-            "required": ["analysis_id"]
-        }
+    "scamper_get_session": lambda a: _get_analyzer(SCAMPER).get_session(a["session_id"]),
+    "scamper_list_sessions": lambda a: _get_analyzer(SCAMPER).list_sessions(),
+    "scamper_generate_comprehensive": lambda a: _get_analyzer(SCAMPER).generate_comprehensive_ideas(
+        a["topic"],
+        a["current_situation"],
+        a.get("context", "")
     ),
-    Tool(
-        name="rbs_list_analyses",
-        description="すべてのRBS分析の一覧を取得する",
-        inputSchema={
-            "type": "object",
-            "properties": {}
-        }
+
+    # PMBOK RBSツール
+    "rbs_create_structure": lambda a: _get_analyzer(RBS).create_structure(
+        a["project_name"],
+        a["project_type"],
+        a.get("context", "")
     ),
-    
+    "rbs_identify_risks": lambda a: _get_analyzer(RBS).identify_risks(
+        a["analysis_id"],
+        a["category"],
+        a["subcategory"],
+        a["custom_risks"]
+    ),
+    "rbs_evaluate_risks": lambda a: _get_analyzer(RBS).evaluate_risks(a["analysis_id"]),
+    "rbs_get_analysis": lambda a: _get_analyzer(RBS).get_analysis(a["analysis_id"]),
+    "rbs_list_analyses": lambda a: _get_analyzer(RBS).list_analyses(),
+
     # m-SHELLモデルツール
-    Tool(
-        name="mshell_create_analysis",
-        description="m-SHELL分析を開始してヒューマンファクター分析を実行する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "system_name": {
-                    "type": "string",
-                    "description": "分析対象システムの名称"
-                },
-                "analysis_purpose": {
-                    "type": "string",
-                    "description": "分析の目的・背景"
-                },
-                "context": {
-                    "type": "string",
-                    "description": "分析の文脈・詳細情報（オプション）"
-                }
-            },
-            "required": ["system_name", "analysis_purpose"]
-        }
+    "mshell_create_analysis": lambda a: _get_analyzer(MShell).create_analysis(
+        a["system_name"],
+        a["analysis_purpose"],
+        a.get("context", "")
     ),
-    Tool(
-        name="mshell_analyze_element",
-        description="m-SHELLモデルの特定要素を分析する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "m-SHELL分析のID"
-                },
-                "element": {
-                    "type": "string",
-                    "description": "分析対象要素",
-                    "enum": ["Machine", "Software", "Hardware", "Environment", "Liveware-Central", "Liveware-Other"]
-                },
-                "findings": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "分析結果・発見事項のリスト"
-                },
-                "severity": {
-                    "type": "integer",
-                    "description": "重要度（1:軽微, 2:中程度, 3:重要, 4:致命的）",
-                    "minimum": 1,
-                    "maximum": 4,
-                    "default": 2
-                },
-                "recommendations": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "改善推奨事項のリスト（オプション）"
-                }
-            },
-            "required": ["analysis_id", "element", "findings"]
-        }
+    "mshell_analyze_element": lambda a: _get_analyzer(MShell).analyze_element(
+        a["analysis_id"],
+        a["element"],
+        a["findings"],
+        a.get("severity", 2),
+        a.get("recommendations")
     ),
-    Tool(
-        name="mshell_analyze_interface",
-        description="m-SHELL要素間のインターフェースを分析する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "m-SHELL分析のID"
-                },
-                "element1": {
-                    "type": "string",
-                    "description": "インターフェース分析対象要素1",
-                    "enum": ["Machine", "Software", "Hardware", "Environment", "Liveware-Central", "Liveware-Other"]
-                },
-                "element2": {
-                    "type": "string",
-                    "description": "インターフェース分析対象要素2",
-                    "enum": ["Machine", "Software", "Hardware", "Environment", "Liveware-Central", "Liveware-Other"]
-                },
-                "issues": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "インターフェース問題・課題のリスト"
-                },
-                "quality_score": {
-                    "type": "integer",
-                    "description": "インターフェース品質スコア（1-10）",
-                    "minimum": 1,
-                    "maximum": 10,
-                    "default": 5
-                }
-            },
-            "required": ["analysis_id", "element1", "element2", "issues"]
-        }
+    "mshell_analyze_interface": lambda a: _get_analyzer(MShell).analyze_interface(
+        a["analysis_id"],
+        a["element1"],
+        a["element2"],
+        a["issues"],
+        a.get("quality_score", 5)
     ),
-    Tool(
-        name="mshell_evaluate_system",
-        description="m-SHELLシステム全体を評価する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "m-SHELL分析のID"
-                }
-            },
-            "required": ["analysis_id"]
-        }
+    "mshell_evaluate_system": lambda a: _get_analyzer(MShell).evaluate_system(a["analysis_id"]),
+    "mshell_get_analysis": lambda a: _get_analyzer(MShell).get_analysis(
+        a["analysis_id"],
+        include_details=a.get("include_details", True)
     ),
-    Tool(
-        name="mshell_get_analysis",
-        description="m-SHELL分析の現在の状況を取得する",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "analysis_id": {
-                    "type": "string",
-                    "description": "m-SHELL分析のID"
-                }
-            },
-            "required": ["analysis_id"]
+    "mshell_list_analyses": lambda a: _get_analyzer(MShell).list_analyses(),
+}
+
+
+# 同一引数なら常に同じ結果を返すツール（状態を持たない）
+_PURE_TOOLS = frozenset({"mece_create_structure", *_FRAMEWORK_TOOLS})
+
+# 状態を読み取るだけのツール（同じ分析器の状態変更ツールの実行時にキャッシュを破棄）
+_READ_ONLY_TOOLS = frozenset({
+    "why_analysis_get",
+    "why_analysis_list",
+    "scamper_get_session",
+    "scamper_list_sessions",
+    "rbs_evaluate_risks",
+    "rbs_get_analysis",
+    "rbs_list_analyses",
+    "mshell_get_analysis",
+    "mshell_list_analyses",
+})
+
+# 状態を変更しないがセッションIDなどを毎回生成するためキャッシュしないツール
+_UNCACHED_STATELESS_TOOLS = frozenset({
+    "mece_analyze_categories",
+})
+
+RESULT_CACHE_SIZE = 128
+# キャッシュキー: (ツール名, 対象の分析ID/セッションID, 引数のJSON)
+_RESULT_CACHE: OrderedDict[tuple[str, str | None, str], dict[str, Any]] = OrderedDict()
+
+
+def _tool_family(name: str) -> str:
+    """ツール名から分析器の種別（why, scamper, rbs, mshell など）を返す."""
+    return name.split("_", 1)[0]
+
+
+def _target_id(arguments: dict[str, Any]) -> str | None:
+    """ツールが対象とする分析ID/セッションIDを返す（一覧・作成系はNone）."""
+    target = arguments.get("analysis_id") or arguments.get("session_id")
+    return None if target is None else str(target)
+
+
+def _invalidate_state_cache(name: str, arguments: dict[str, Any]) -> None:
+    """状態変更の影響を受けるキャッシュエントリ（同種の一覧と対象IDの取得結果）を破棄する.
+
+    作成系ツール（対象IDなし）は上限超過により既存の分析を破棄し得るため、同種の全エントリを破棄する。
+    """
+    family = _tool_family(name)
+    target = _target_id(arguments)
+    stale = [
+        key for key in _RESULT_CACHE
+        if key[0] not in _PURE_TOOLS
+        and _tool_family(key[0]) == family
+        and (target is None or key[1] is None or key[1] == target)
+    ]
+    for key in stale:
+        del _RESULT_CACHE[key]
+
+
+def _execute_tool(name: str, handler: Callable[[dict[str, Any]], dict[str, Any]],
+                  arguments: dict[str, Any]) -> dict[str, Any]:
+    """結果キャッシュを考慮してツールを実行する."""
+    if name in _PURE_TOOLS or name in _READ_ONLY_TOOLS:
+        key = (
+            name,
+            _target_id(arguments),
+            json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+        )
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(key)
+            return cached
+        
+        result = handler(arguments)
+        # 失敗結果（存在しないIDなど）は後から作成され得るためキャッシュしない
+        if result.get("success"):
+            _RESULT_CACHE[key] = result
+            if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
+        return result
+    
+    if name not in _UNCACHED_STATELESS_TOOLS:
+        _invalidate_state_cache(name, arguments)
+    return handler(arguments)
+
+
+# 分析ハンドラー実行用のワーカースレッド
+# 分析器の状態と結果キャッシュはロックを持たないため、ワーカーは1つに限定して
+# 実行を直列化しつつ、イベントループはstdioの読み書きに専念させる
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis-support")
+
+
+async def _run_tool(name: str, handler: Callable[[dict[str, Any]], dict[str, Any]],
+                    arguments: dict[str, Any]) -> dict[str, Any]:
+    """ツールをワーカースレッドで実行し、イベントループをブロックしない."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, _execute_tool, name, handler, arguments)
+
+
+async def _invoke_operation(operation: dict[str, Any], semaphore: asyncio.Semaphore) -> dict[str, Any]:
+    """一括実行内の1操作をディスパッチテーブル経由で実行する."""
+    name = operation.get("name", "")
+    handler = DISPATCH.get(name)
+    if handler is None:
+        return {
+            "name": name,
+            "success": False,
+            "message": f"❌ 未知のツール: {name}"
         }
-    ),
-    Tool(
-        name="mshell_list_analyses",
-        description="すべてのm-SHELL分析の一覧を取得する",
-        inputSchema={
-            "type": "object",
-            "properties": {}
+    
+    arguments = operation.get("arguments") or {}
+    error_message = _arguments_error(name, arguments)
+    if error_message is not None:
+        return {
+            "name": name,
+            "success": False,
+            "message": error_message
         }
-    )
-]
+    
+    async with semaphore:
+        try:
+            result = await _run_tool(name, handler, arguments)
+        except AnalysisError as e:
+            return {
+                "name": name,
+                "success": False,
+                "message": str(e)
+            }
+        except Exception as e:
+            # 1操作の想定外の例外で一括実行全体（実行済み操作の結果を含む）を失わないよう、
+            # 不具合として記録したうえでこの操作の失敗として返す
+            logger.exception("Batch operation error in %s", name)
+            return {
+                "name": name,
+                "success": False,
+                "message": f"❌ 実行エラー: {type(e).__name__}: {e}"
+            }
+    
+    return {
+        "name": name,
+        "success": bool(result.get("success", False)),
+        "result": result
+    }
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """利用可能なツールのリストを返す."""
-    logger.info(f"Listing {len(TOOLS)} available analysis tools")
-    return TOOLS
+async def _batch_execute(arguments: dict[str, Any]) -> dict[str, Any]:
+    """複数のツール呼び出しをまとめて実行する."""
+    operations: list[dict[str, Any]] = arguments["operations"]
+    semaphore = asyncio.Semaphore(max(1, arguments.get("max_concurrent", 4)))
+    
+    results: list[dict[str, Any]] = []
+    if arguments.get("stop_on_error", False):
+        # 失敗時に後続を実行しないよう、順次実行する
+        for operation in operations:
+            outcome = await _invoke_operation(operation, semaphore)
+            results.append(outcome)
+            if not outcome["success"]:
+                break
+    else:
+        results = list(await asyncio.gather(
+            *[_invoke_operation(operation, semaphore) for operation in operations]
+        ))
+    
+    succeeded = sum(1 for outcome in results if outcome["success"])
+    return {
+        "success": succeeded == len(operations),
+        "message": f"📦 {len(results)}/{len(operations)}件の操作を一括実行しました",
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "skipped": len(operations) - len(results)
+    }
+
+
+def _serialize_result(result: dict[str, Any]) -> str:
+    """ツール実行結果をJSON文字列に変換する."""
+    if HAS_ORJSON:
+        return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _text_response(text: str) -> list[dict[str, Any]]:
+    """テキスト応答のエンベロープを生成する."""
+    return [{"type": "text", "text": text}]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+@lru_cache(maxsize=32)
+def _unknown_tool_response(name: str) -> tuple[dict[str, Any], ...]:
+    """未知のツールに対する応答を返す（ツール名ごとに一度だけ構築する）."""
+    return ({"type": "text", "text": _serialize_result({
+        "success": False,
+        "message": f"❌ 未知のツール: {name}"
+    })},)
+
+
+# 引数はVALIDATORSで検証するため、SDKによる呼び出しごとのスキーマ検証は無効にする
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[dict[str, Any]]:
     """ツール呼び出しを処理する."""
-    logger.info(f"Tool called: {name} with arguments: {arguments}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Tool called: %s with %d args", name, len(arguments))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Tool %s arguments: %r", name, arguments)
+    
+    if name not in VALID_NAMES:
+        return _unknown_tool_response(name)
+    
+    error_message = _arguments_error(name, arguments)
+    if error_message is not None:
+        return _text_response(_serialize_result({"success": False, "message": error_message}))
     
     try:
-        # 5Why分析ツール
-        if name == "why_analysis_start":
-            result = why_analyzer.start_analysis(
-                arguments["problem"],
-                arguments.get("context")
-            )
-        elif name == "why_analysis_add_answer":
-            result = why_analyzer.add_answer(
-                arguments["analysis_id"],
-                arguments["level"],
-                arguments["answer"]
-            )
-        elif name == "why_analysis_get":
-            result = why_analyzer.get_analysis(arguments["analysis_id"])
-        elif name == "why_analysis_list":
-            result = why_analyzer.list_analyses()
-        
-        # MECE分析ツール
-        elif name == "mece_analyze_categories":
-            result = mece_analyzer.analyze_categories(
-                arguments["topic"],
-                arguments["categories"]
-            )
-        elif name == "mece_create_structure":
-            result = mece_analyzer.create_mece_structure(
-                arguments["topic"],
-                arguments.get("framework", "auto")
-            )
-        
-        # 専用フレームワーク分析ツール
-        elif name == "swot_analysis":
-            result = mece_analyzer.create_mece_structure(
-                arguments["topic"],
-                "SWOT"
-            )
-        elif name == "4p_analysis":
-            result = mece_analyzer.create_mece_structure(
-                arguments["topic"],
-                "4P"
-            )
-        elif name == "3c_analysis":
-            result = mece_analyzer.create_mece_structure(
-                arguments["topic"],
-                "3C"
-            )
-        elif name == "timeline_analysis":
-            result = mece_analyzer.create_mece_structure(
-                arguments["topic"],
-                "時系列"
-            )
-        elif name == "internal_external_analysis":
-            result = mece_analyzer.create_mece_structure(
-                arguments["topic"],
-                "内外"
-            )
-        
-        # SCAMPER法ツール
-        elif name == "scamper_start_session":
-            result = scamper_analyzer.start_session(
-                arguments["topic"],
-                arguments["current_situation"],
-                arguments.get("context", "")
-            )
-        elif name == "scamper_apply_technique":
-            result = scamper_analyzer.apply_technique(
-                arguments["session_id"],
-                arguments["technique"],
-                arguments["ideas"],
-                arguments.get("explanations")
-            )
-        elif name == "scamper_evaluate_ideas":
-            result = scamper_analyzer.evaluate_ideas(
-                arguments["session_id"],
-                arguments["idea_evaluations"]
-            )
-        elif name == "scamper_get_session":
-            result = scamper_analyzer.get_session(arguments["session_id"])
-        elif name == "scamper_list_sessions":
-            result = scamper_analyzer.list_sessions()
-        elif name == "scamper_generate_comprehensive":
-            result = scamper_analyzer.generate_comprehensive_ideas(
-                arguments["topic"],
-                arguments["current_situation"],
-                arguments.get("context", "")
-            )
-        
-        # PMBOK RBSツール
-        elif name == "rbs_create_structure":
-            result = rbs_analyzer.create_structure(
-                arguments["project_name"],
-                arguments["project_type"],
-                arguments.get("context", "")
-            )
-        elif name == "rbs_identify_risks":
-            result = rbs_analyzer.identify_risks(
-                arguments["analysis_id"],
-                arguments["category"],
-                arguments["subcategory"],
-                arguments["custom_risks"]
-            )
-        elif name == "rbs_evaluate_risks":
-            result = rbs_analyzer.evaluate_risks(arguments["analysis_id"])
-        elif name == "rbs_get_analysis":
-            result = rbs_analyzer.get_analysis(arguments["analysis_id"])
-        elif name == "rbs_list_analyses":
-            result = rbs_analyzer.list_analyses()
-        
-        # m-SHELLモデルツール
-        elif name == "mshell_create_analysis":
-            result = mshell_analyzer.create_analysis(
-                arguments["system_name"],
-                arguments["analysis_purpose"],
-                arguments.get("context", "")
-            )
-        elif name == "mshell_analyze_element":
-            result = mshell_analyzer.analyze_element(
-                arguments["analysis_id"],
-                arguments["element"],
-                arguments["findings"],
-                arguments.get("severity", 2),
-                arguments.get("recommendations")
-            )
-        elif name == "mshell_analyze_interface":
-            result = mshell_analyzer.analyze_interface(
-                arguments["analysis_id"],
-                arguments["element1"],
-                arguments["element2"],
-                arguments["issues"],
-                arguments.get("quality_score", 5)
-            )
-        elif name == "mshell_evaluate_system":
-            result = mshell_analyzer.evaluate_system(arguments["analysis_id"])
-        elif name == "mshell_get_analysis":
-            result = mshell_analyzer.get_analysis(arguments["analysis_id"])
-        elif name == "mshell_list_analyses":
-            result = mshell_analyzer.list_analyses()
-        
+        if name == "batch_execute":
+            result = await _batch_execute(arguments)
         else:
-            result = {
-                "success": False,
-                "message": f"❌ 未知のツール: {name}"
-            }
+            result = await _run_tool(name, DISPATCH[name], arguments)
         
-        logger.info(f"Tool {name} executed successfully")
-        return [{"type": "text", "text": str(result)}]
+        logger.debug("Tool %s executed successfully", name)
+        return _text_response(_serialize_result(result))
     
-    except Exception as e:
-        error_message = f"❌ ツール実行エラー: {str(e)}"
-        logger.error(f"Tool execution error: {e}")
-        return [{"type": "text", "text": error_message}]
+    except AnalysisError as e:
+        return _text_response(_serialize_result({"success": False, "message": str(e)}))
+    except Exception:
+        # 想定外の例外は不具合として記録し、MCPのエラー応答として呼び出し元に伝える
+        logger.exception("Tool execution error in %s", name)
+        raise
+
+
+_INIT_OPTIONS: InitializationOptions | None = None
+
+
+def _initialization_options() -> InitializationOptions:
+    """サーバーの初期化オプションを返す（初回のみ構築する）."""
+    global _INIT_OPTIONS
+    if _INIT_OPTIONS is None:
+        _INIT_OPTIONS = server.create_initialization_options()
+    return _INIT_OPTIONS
 
 
 async def main() -> None:
     """サーバーのメイン実行関数."""
+    logging.basicConfig(level=os.environ.get("ANALYSIS_SUPPORT_LOG_LEVEL", "WARNING").upper())
     logger.info("Starting Analysis Support MCP Server...")
     
     try:
@@ -739,14 +680,30 @@ async def main() -> None:
             await server.run(
                 read_stream,
                 write_stream,
-                server.create_initialization_options()
+                _initialization_options()
             )
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
-    except Exception as e:
-        logger.error(f"Server error: {e}")
+    except Exception:
+        logger.exception("Server error")
         raise
 
 
+def run() -> None:
+    """コンソールスクリプトのエントリーポイント."""
+    if sys.platform == "win32":
+        # 既定のProactorEventLoopはstdio待機中もCPUを消費するためSelectorに切り替える
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        asyncio.run(main())
+        return
+    
+    try:
+        import uvloop
+    except ImportError:  # uvloopは任意依存（未インストール時は標準のイベントループを使用）
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
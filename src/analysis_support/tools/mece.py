@@ -1,7 +1,12 @@
 """MECE分析ツール実装."""
 
-from typing import Dict, List, Optional, Any, Tuple
-import uuid
+import re
+from functools import lru_cache
+from itertools import combinations
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+import secrets
+import time
 from datetime import datetime
 from enum import Enum
 
@@ -16,6 +21,7 @@ class MECEViolationType(Enum):
 
 class MECECategory:
     """MECEカテゴリクラス."""
+    __slots__ = ("name", "description")
     
     def __init__(self, name: str, description: str = ""):
         self.name = name
@@ -24,6 +30,10 @@ class MECECategory:
 
 class MECEAnalysis:
     """MECE分析結果クラス."""
+    __slots__ = (
+        "id", "topic", "original_categories", "mece_categories", "violation_type",
+        "overlaps", "gaps", "improvement_suggestions", "analysis_notes", "_created_timestamp"
+    )
     
     def __init__(
         self, 
@@ -40,7 +50,148 @@ class MECEAnalysis:
         self.gaps: List[str] = []
         self.improvement_suggestions: List[str] = []
         self.analysis_notes: List[str] = []
-        self.created_at = datetime.now()
+        # 作成日時は参照されることが少ないため、タイムスタンプのみ記録し参照時に変換する
+        self._created_timestamp = time.time()
+    
+    @property
+    def created_at(self) -> datetime:
+        """作成日時."""
+        return datetime.fromtimestamp(self._created_timestamp)
+
+
+# フレームワーク名 → カテゴリごとの説明テンプレート（{topic}をトピックで置換する）
+_EXPLANATION_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "4P": {
+        "Product (製品)": "{topic}における製品・サービスの特徴、品質、機能について",
+        "Price (価格)": "{topic}の価格戦略、コスト構造、価値提案について",
+        "Place (流通)": "{topic}の販売チャネル、流通経路、アクセス方法について",
+        "Promotion (販促)": "{topic}の広告、宣伝、コミュニケーション戦略について"
+    },
+    "3C": {
+        "Customer (顧客)": "{topic}における顧客ニーズ、顧客行動、市場環境について",
+        "Competitor (競合)": "{topic}の競合他社の動向、競合優位性、市場シェアについて",
+        "Company (自社)": "{topic}における自社の強み、リソース、能力について"
+    },
+    "SWOT": {
+        "Strengths (強み)": "{topic}における内部の強み、優位性、競争力について",
+        "Weaknesses (弱み)": "{topic}における内部の弱み、課題、改善点について",
+        "Opportunities (機会)": "{topic}における外部の機会、チャンス、可能性について",
+        "Threats (脅威)": "{topic}における外部の脅威、リスク、阻害要因について"
+    },
+    "時系列": {
+        "過去": "{topic}の過去の状況、経緯、学習できる点について",
+        "現在": "{topic}の現在の状況、現状の課題と機会について",
+        "未来": "{topic}の将来の展望、予測、計画について"
+    },
+    "内外": {
+        "内部要因": "{topic}における内部でコントロール可能な要素について",
+        "外部要因": "{topic}における外部の環境や制約条件について"
+    }
+}
+
+# フレームワーク名 → 構造カテゴリ（MCPツールのスキーマとも共有する）
+# 結果にそのまま含めて共有するため、変更不可のマッピングとタプルで保持する
+FRAMEWORKS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    framework: tuple(templates) for framework, templates in _EXPLANATION_TEMPLATES.items()
+})
+_FRAMEWORK_NAMES_TEXT = ", ".join(FRAMEWORKS)
+
+# 1回の分析で検出する重複ペアの上限（カテゴリ数の2乗で増えるため打ち切る）
+MAX_OVERLAPS = 50
+
+# 漏れ検出でチェックする一般的な分析軸: (観点, キーワード)
+_COMMON_ASPECTS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("時間", ("時間", "期間", "タイミング", "スケジュール")),
+    ("場所", ("場所", "地域", "エリア", "位置")),
+    ("人", ("人", "担当者", "責任者", "ユーザー", "顧客")),
+    ("方法", ("方法", "手順", "プロセス", "やり方")),
+    ("理由", ("理由", "原因", "目的", "動機")),
+    ("コスト", ("費用", "コスト", "予算", "価格"))
+)
+
+# 漏れ検出の対象とするトピックのキーワード
+_BUSINESS_KEYWORDS: Tuple[str, ...] = ("ビジネス", "業務", "プロジェクト")
+
+# 分析軸・トピックのキーワード検索用の正規表現（カテゴリ・トピックをそれぞれ1回だけ走査する）
+_ASPECT_OF_KEYWORD: Dict[str, str] = {
+    keyword: aspect for aspect, keywords in _COMMON_ASPECTS for keyword in keywords
+}
+_ASPECT_PATTERN = re.compile("(?=(" + "|".join(map(re.escape, _ASPECT_OF_KEYWORD)) + "))")
+_BUSINESS_PATTERN = re.compile("|".join(map(re.escape, _BUSINESS_KEYWORDS)))
+
+# フレームワーク自動選択ルール: (キーワード, フレームワーク)、先に一致したものを優先
+_AUTO_SELECT_RULES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    # マーケティング関連
+    (("マーケティング", "販売", "商品", "製品"), "4P"),
+    # 組織・企業分析関連（SWOTを優先）
+    (("組織", "企業", "会社", "強み", "弱み"), "SWOT"),
+    # 戦略分析関連
+    (("戦略", "競合", "分析", "市場"), "3C"),
+    # 時間関連
+    (("変化", "推移", "履歴", "将来"), "時系列")
+)
+_DEFAULT_FRAMEWORK = "内外"
+
+# 全ルールのキーワードを優先度順に並べた正規表現（先読みで重なり合う一致も拾う）
+_AUTO_SELECT_PATTERN = re.compile(
+    "(?=(" + "|".join(
+        re.escape(keyword) for keywords, _ in _AUTO_SELECT_RULES for keyword in keywords
+    ) + "))"
+)
+# キーワード → ルールの優先度（複数ルールにある場合は先のルールを優先）
+_AUTO_SELECT_PRIORITY: Dict[str, int] = {
+    keyword: priority
+    for priority, (keywords, _) in reversed(list(enumerate(_AUTO_SELECT_RULES)))
+    for keyword in keywords
+}
+
+
+@lru_cache(maxsize=256)
+def _select_framework(topic: str) -> str:
+    """トピックに基づいてフレームワークを自動選択する."""
+    # トピックを1回走査し、一致したキーワードのうち最も優先度の高いルールを選ぶ
+    priority = min(
+        (_AUTO_SELECT_PRIORITY[match.group(1)] for match in _AUTO_SELECT_PATTERN.finditer(topic.lower())),
+        default=None
+    )
+    if priority is None:
+        # デフォルト
+        return _DEFAULT_FRAMEWORK
+    return _AUTO_SELECT_RULES[priority][1]
+
+
+def _category_explanations(topic: str, framework: str) -> Dict[str, str]:
+    """カテゴリごとの説明を生成する."""
+    return {
+        category: template.format(topic=topic)
+        for category, template in _EXPLANATION_TEMPLATES[framework].items()
+    }
+
+
+def _build_structure(topic: str, framework: str) -> Dict[str, Any]:
+    """フレームワークに基づくMECE構造の提案結果を構築する."""
+    structure_categories = list(FRAMEWORKS[framework])
+    category_explanations = _category_explanations(topic, framework)
+    
+    return {
+        "success": True,
+        "message": f"🎯 {framework}フレームワークによるMECE構造を提案しました",
+        "topic": topic,
+        "framework": framework,
+        "structure": {
+            "categories": structure_categories,
+            "explanations": category_explanations
+        },
+        "characteristics": {
+            "mutually_exclusive": f"各カテゴリは重複しない独立した領域です",
+            "collectively_exhaustive": f"すべてのカテゴリで{topic}を網羅的にカバーします"
+        },
+        "usage_tips": [
+            f"各カテゴリの視点から{topic}について分析してください",
+            "カテゴリ間での重複がないか確認しながら整理しましょう",
+            "すべてのカテゴリを検討することで漏れを防げます"
+        ]
+    }
 
 
 class MECE:
@@ -48,13 +199,7 @@ class MECE:
     
     def __init__(self) -> None:
         """MECE分析マネージャーを初期化."""
-        self._frameworks = {
-            "4P": ["Product (製品)", "Price (価格)", "Place (流通)", "Promotion (販促)"],
-            "3C": ["Customer (顧客)", "Competitor (競合)", "Company (自社)"],
-            "SWOT": ["Strengths (強み)", "Weaknesses (弱み)", "Opportunities (機会)", "Threats (脅威)"],
-            "時系列": ["過去", "現在", "未来"],
-            "内外": ["内部要因", "外部要因"]
-        }
+        self._frameworks = FRAMEWORKS
     
     def analyze_categories(self, topic: str, categories: List[str]) -> Dict[str, Any]:
         """
@@ -67,7 +212,7 @@ class MECE:
         Returns:
             MECE評価、重複・漏れの検出、改善提案
         """
-        analysis_id = str(uuid.uuid4())[:8]
+        analysis_id = secrets.token_hex(4)
         analysis = MECEAnalysis(analysis_id, topic, categories)
         
         # MECEカテゴリを作成
@@ -113,40 +258,22 @@ class MECE:
         if framework not in self._frameworks:
             return {
                 "success": False,
-                "message": f"❌ フレームワーク '{framework}' はサポートされていません。対応フレームワーク: {', '.join(self._frameworks.keys())}"
+                "message": f"❌ フレームワーク '{framework}' はサポートされていません。対応フレームワーク: {_FRAMEWORK_NAMES_TEXT}"
             }
         
-        structure_categories = self._frameworks[framework]
-        category_explanations = self._generate_category_explanations(topic, framework, structure_categories)
-        
-        return {
-            "success": True,
-            "message": f"🎯 {framework}フレームワークによるMECE構造を提案しました",
-            "topic": topic,
-            "framework": framework,
-            "structure": {
-                "categories": structure_categories,
-                "explanations": category_explanations
-            },
-            "characteristics": {
-                "mutually_exclusive": f"各カテゴリは重複しない独立した領域です",
-                "collectively_exhaustive": f"すべてのカテゴリで{topic}を網羅的にカバーします"
-            },
-            "usage_tips": [
-                f"各カテゴリの視点から{topic}について分析してください",
-                "カテゴリ間での重複がないか確認しながら整理しましょう",
-                "すべてのカテゴリを検討することで漏れを防げます"
-            ]
-        }
+        return _build_structure(topic, framework)
     
     def _check_mece_violations(self, analysis: MECEAnalysis) -> None:
         """MECE違反をチェックする."""
+        # 重複検出・漏れ検出で共用するため、カテゴリの正規化（casefold）は一度だけ行う
+        folded = [category.casefold() for category in analysis.original_categories]
+        
         # 重複検出
-        overlaps = self._find_overlaps(analysis.original_categories)
+        overlaps = self._find_overlaps(analysis.original_categories, folded)
         analysis.overlaps = overlaps
         
         # 漏れ検出
-        gaps = self._find_gaps(analysis.topic, analysis.original_categories)
+        gaps = self._find_gaps(analysis.topic, analysis.original_categories, folded)
         analysis.gaps = gaps
         
         # 違反タイプを決定
@@ -168,54 +295,50 @@ class MECE:
         # 分析ノートを生成
         analysis.analysis_notes = self._generate_analysis_notes(analysis)
     
-    def _find_overlaps(self, categories: List[str]) -> List[Tuple[str, str, str]]:
-        """重複を検出する."""
+    def _find_overlaps(self, categories: List[str], folded: Optional[List[str]] = None,
+                       max_overlaps: int = MAX_OVERLAPS) -> List[Tuple[str, str, str]]:
+        """重複を検出する（foldedはcasefold済みのカテゴリ、max_overlaps件に達したら打ち切る）."""
         overlaps = []
-        
-        # 簡単な重複検出（キーワードベース）
-        keywords_map: Dict[str, List[str]] = {}
-        for category in categories:
-            words = category.lower().split()
-            for word in words:
-                if len(word) > 2:  # 2文字以下は除外
-                    if word not in keywords_map:
-                        keywords_map[word] = []
-                    keywords_map[word].append(category)
-        
-        # 共通キーワードを持つカテゴリペアを検出
-        for word, cats in keywords_map.items():
-            if len(cats) > 1:
-                for i in range(len(cats)):
-                    for j in range(i + 1, len(cats)):
-                        overlap_reason = f"共通キーワード「{word}」を含む"
-                        overlaps.append((cats[i], cats[j], overlap_reason))
+        if folded is None:
+            folded = [category.casefold() for category in categories]
+        
+        # 簡単な重複検出（キーワードベース、2文字以下は除外）
+        token_sets = [
+            frozenset(word for word in category.split() if len(word) > 2)
+            for category in folded
+        ]
+        
+        # 共通キーワードを持つカテゴリペアを検出（同じカテゴリ名の組は1件にまとめる）
+        seen_pairs = set()
+        for (category_a, tokens_a), (category_b, tokens_b) in combinations(zip(categories, token_sets), 2):
+            pair_key = tuple(sorted((category_a, category_b)))
+            if pair_key in seen_pairs:
+                continue
+            shared = tokens_a & tokens_b
+            if shared:
+                seen_pairs.add(pair_key)
+                overlap_reason = f"共通キーワード「{'」「'.join(sorted(shared))}」を含む"
+                overlaps.append((category_a, category_b, overlap_reason))
+                if len(overlaps) >= max_overlaps:
+                    break
         
         return overlaps
     
-    def _find_gaps(self, topic: str, categories: List[str]) -> List[str]:
-        """漏れを検出する."""
-        gaps = []
-        
-        # トピックに基づく一般的な漏れを検出
-        topic_lower = topic.lower()
-        category_text = " ".join(categories).lower()
+    def _find_gaps(self, topic: str, categories: List[str],
+                   folded: Optional[List[str]] = None) -> List[str]:
+        """漏れを検出する（foldedはcasefold済みのカテゴリ）."""
+        # 漏れ検出はビジネス関連のトピックのみが対象
+        if _BUSINESS_PATTERN.search(topic.lower()) is None:
+            return []
         
         # 一般的な分析軸の漏れをチェック
-        common_aspects = {
-            "時間": ["時間", "期間", "タイミング", "スケジュール"],
-            "場所": ["場所", "地域", "エリア", "位置"],
-            "人": ["人", "担当者", "責任者", "ユーザー", "顧客"],
-            "方法": ["方法", "手順", "プロセス", "やり方"],
-            "理由": ["理由", "原因", "目的", "動機"],
-            "コスト": ["費用", "コスト", "予算", "価格"]
+        if folded is None:
+            folded = [category.casefold() for category in categories]
+        category_text = " ".join(folded)
+        covered = {
+            _ASPECT_OF_KEYWORD[match.group(1)] for match in _ASPECT_PATTERN.finditer(category_text)
         }
-        
-        for aspect, keywords in common_aspects.items():
-            if not any(keyword in category_text for keyword in keywords):
-                if "ビジネス" in topic_lower or "業務" in topic_lower or "プロジェクト" in topic_lower:
-                    gaps.append(f"{aspect}の観点")
-        
-        return gaps
+        return [f"{aspect}の観点" for aspect, _ in _COMMON_ASPECTS if aspect not in covered]
     
     def _generate_improvement_suggestions(self, analysis: MECEAnalysis) -> List[str]:
         """改善提案を生成する."""
@@ -244,7 +367,9 @@ class MECE:
         notes.append(f"カテゴリ数: {len(analysis.original_categories)}個")
         notes.append(f"MECE評価: {analysis.violation_type.value}")
         
-        if analysis.overlaps:
+        if len(analysis.overlaps) >= MAX_OVERLAPS:
+            notes.append(f"重複検出: {MAX_OVERLAPS}件以上（以降の検出は省略）")
+        elif analysis.overlaps:
             notes.append(f"重複検出: {len(analysis.overlaps)}件")
         
         if analysis.gaps:
@@ -254,61 +379,4 @@ class MECE:
     
     def _auto_select_framework(self, topic: str) -> str:
         """トピックに基づいてフレームワークを自動選択する."""
-        topic_lower = topic.lower()
-        
-        # マーケティング関連
-        if any(keyword in topic_lower for keyword in ["マーケティング", "販売", "商品", "製品"]):
-            return "4P"
-        
-        # 組織・企業分析関連（SWOTを優先）
-        if any(keyword in topic_lower for keyword in ["組織", "企業", "会社", "強み", "弱み"]):
-            return "SWOT"
-            
-        # 戦略分析関連
-        if any(keyword in topic_lower for keyword in ["戦略", "競合", "分析", "市場"]):
-            return "3C"
-        
-        # 時間関連
-        if any(keyword in topic_lower for keyword in ["変化", "推移", "履歴", "将来"]):
-            return "時系列"
-        
-        # デフォルト
-        return "内外"
-    
-    def _generate_category_explanations(self, topic: str, framework: str, categories: List[str]) -> Dict[str, str]:
-        """カテゴリごとの説明を生成する."""
-        explanations = {}
-        
-        if framework == "4P":
-            explanations = {
-                "Product (製品)": f"{topic}における製品・サービスの特徴、品質、機能について",
-                "Price (価格)": f"{topic}の価格戦略、コスト構造、価値提案について",
-                "Place (流通)": f"{topic}の販売チャネル、流通経路、アクセス方法について",
-                "Promotion (販促)": f"{topic}の広告、宣伝、コミュニケーション戦略について"
-            }
-        elif framework == "3C":
-            explanations = {
-                "Customer (顧客)": f"{topic}における顧客ニーズ、顧客行動、市場環境について",
-                "Competitor (競合)": f"{topic}の競合他社の動向、競合優位性、市場シェアについて",
-                "Company (自社)": f"{topic}における自社の強み、リソース、能力について"
-            }
-        elif framework == "SWOT":
-            explanations = {
-                "Strengths (強み)": f"{topic}における内部の強み、優位性、競争力について",
-                "Weaknesses (弱み)": f"{topic}における内部の弱み、課題、改善点について",
-                "Opportunities (機会)": f"{topic}における外部の機会、チャンス、可能性について",
-                "Threats (脅威)": f"{topic}における外部の脅威、リスク、阻害要因について"
-            }
-        elif framework == "時系列":
-            explanations = {
-                "過去": f"{topic}の過去の状況、経緯、学習できる点について",
-                "現在": f"{topic}の現在の状況、現状の課題と機会について",
-                "未来": f"{topic}の将来の展望、予測、計画について"
-            }
-        elif framework == "内外":
-            explanations = {
-                "内部要因": f"{topic}における内部でコントロール可能な要素について",
-                "外部要因": f"{topic}における外部の環境や制約条件について"
-            }
-        
-        return explanations
\ No newline at end of file
+        return _select_framework(topic)
@@ -1,8 +1,11 @@
 """m-SHELL Model implementation for Human Factors Analysis."""
 
-import uuid
+import secrets
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from itertools import combinations
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from enum import Enum
 
 
@@ -24,119 +27,297 @@ class AnalysisSeverity(Enum):
     CRITICAL = 4
 
 
+# 値から列挙メンバーへの対応（不正な値を例外処理なしで判定する）
+_ELEMENTS_BY_VALUE: Dict[str, MShellElement] = {element.value: element for element in MShellElement}
+_SEVERITIES_BY_VALUE: Dict[int, AnalysisSeverity] = {severity.value: severity for severity in AnalysisSeverity}
+
+# 日時の表示形式
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 保持する分析の上限（長時間稼働するサーバーでメモリ使用量を抑える）
+MAX_ANALYSES = 1000
+
+# この品質スコア未満のインターフェースを問題ありとみなす
+_INTERFACE_PROBLEM_THRESHOLD = 6
+
+# スコアの下限値とレベルの対応（下限値の降順、最後の要素は最低レベル）
+_QUALITY_LEVELS: Tuple[Tuple[float, str], ...] = (
+    (8, "良好"),
+    (6, "普通"),
+    (4, "要改善"),
+    (float("-inf"), "問題あり")
+)
+
+_OVERALL_LEVELS: Tuple[Tuple[float, str], ...] = (
+    (8, "優秀"),
+    (6, "良好"),
+    (4, "普通"),
+    (2, "要改善"),
+    (float("-inf"), "危険")
+)
+
+
+def _level_for(score: float, levels: Tuple[Tuple[float, str], ...]) -> str:
+    """スコアが下限値を満たす最初のレベルを返す"""
+    return next(label for threshold, label in levels if score >= threshold)
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """UNIX時刻を表示用の文字列に変換"""
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime(timestamp))
+
+
+# 要素の日本語名
+_ELEMENT_JP_NAMES: Dict[MShellElement, str] = {
+    MShellElement.MACHINE: "機械・設備",
+    MShellElement.SOFTWARE: "ソフトウェア・手順",
+    MShellElement.HARDWARE: "ハードウェア・物理環境",
+    MShellElement.ENVIRONMENT: "環境・条件",
+    MShellElement.LIVEWARE_CENTRAL: "中心人物・主要オペレーター",
+    MShellElement.LIVEWARE_OTHER: "他者・チーム・組織"
+}
+
+# 要素の説明（読み取り専用。応答にはコピーを渡す）
+_ELEMENT_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "Machine": "機械・設備・装置（物理的なシステムの中核）",
+    "Software": "ソフトウェア・手順・規則（システムの論理的側面）",
+    "Hardware": "ハードウェア・物理環境・インターフェース（システムの物理的境界）",
+    "Environment": "環境・条件・文脈（システムを取り巻く状況）",
+    "Liveware-Central": "中心人物・主要オペレーター（システムの中核となる人）",
+    "Liveware-Other": "他者・チーム・組織（中心人物と関わる人々）"
+})
+
+# インターフェース表記用の要素の日本語略称
+_ELEMENT_SHORT_JP_NAMES: Dict[MShellElement, str] = {
+    MShellElement.MACHINE: "機械",
+    MShellElement.SOFTWARE: "SW",
+    MShellElement.HARDWARE: "HW",
+    MShellElement.ENVIRONMENT: "環境",
+    MShellElement.LIVEWARE_CENTRAL: "中心人物",
+    MShellElement.LIVEWARE_OTHER: "他者"
+}
+
+# 重要度のラベル
+_SEVERITY_LABELS: Dict[AnalysisSeverity, str] = {
+    AnalysisSeverity.LOW: "軽微",
+    AnalysisSeverity.MEDIUM: "中程度",
+    AnalysisSeverity.HIGH: "重要",
+    AnalysisSeverity.CRITICAL: "致命的"
+}
+
+
+# 要素間インターフェースのチェックポイント（要素の定義順に並べた組をキーとする）
+_INTERFACE_PATTERNS: Dict[Tuple[MShellElement, MShellElement], Tuple[str, ...]] = {
+    (MShellElement.MACHINE, MShellElement.SOFTWARE): (
+        "機械制御ソフトウェアは適切に動作するか",
+        "機械からのフィードバック情報は正確か",
+        "ソフトウェア更新時の機械への影響は検証されているか"
+    ),
+    (MShellElement.MACHINE, MShellElement.HARDWARE): (
+        "機械と操作盤の配置関係は適切か",
+        "表示・警告装置は機械の状態を正確に反映するか",
+        "物理的な接続・配線に問題はないか"
+    ),
+    (MShellElement.MACHINE, MShellElement.ENVIRONMENT): (
+        "環境条件は機械の性能に影響しないか",
+        "機械からの発熱・騒音・振動は環境に悪影響を与えないか",
+        "清掃・保守作業用のスペースは確保されているか"
+    ),
+    (MShellElement.MACHINE, MShellElement.LIVEWARE_CENTRAL): (
+        "オペレーターは機械の操作方法を熟知しているか",
+        "機械の異常を適切に判断できるか",
+        "緊急時の対応手順は身についているか"
+    ),
+    (MShellElement.MACHINE, MShellElement.LIVEWARE_OTHER): (
+        "保守担当者との連携は円滑か",
+        "機械情報の共有は適切に行われているか",
+        "交代時の申し送り事項は明確か"
+    ),
+    (MShellElement.SOFTWARE, MShellElement.HARDWARE): (
+        "ソフトウェアとハードウェアの互換性に問題はないか",
+        "画面表示と物理操作の対応関係は明確か",
+        "入力デバイスの応答性は適切か"
+    ),
+    (MShellElement.SOFTWARE, MShellElement.ENVIRONMENT): (
+        "環境変化がソフトウェア動作に影響しないか",
+        "ネットワーク環境は安定しているか",
+        "データバックアップ環境は整備されているか"
+    ),
+    (MShellElement.SOFTWARE, MShellElement.LIVEWARE_CENTRAL): (
+        "ユーザーインターフェースは直感的か",
+        "エラーメッセージは理解しやすいか",
+        "操作手順は論理的に設計されているか"
+    ),
+    (MShellElement.SOFTWARE, MShellElement.LIVEWARE_OTHER): (
+        "複数ユーザー間での情報共有は適切か",
+        "アクセス権限の管理は適正か",
+        "協調作業の支援機能は充実しているか"
+    ),
+    (MShellElement.HARDWARE, MShellElement.ENVIRONMENT): (
+        "ハードウェアは環境条件に対して十分な耐性があるか",
+        "設置場所の物理的制約は考慮されているか",
+        "メンテナンス用のアクセス経路は確保されているか"
+    ),
+    (MShellElement.HARDWARE, MShellElement.LIVEWARE_CENTRAL): (
+        "操作性・視認性は十分考慮されているか",
+        "人間工学的な配慮がなされているか",
+        "長時間使用時の疲労軽減策はあるか"
+    ),
+    (MShellElement.HARDWARE, MShellElement.LIVEWARE_OTHER): (
+        "共用設備の使用ルールは明確か",
+        "保守・点検作業の安全性は確保されているか",
+        "機器の設定変更権限は適切に管理されているか"
+    ),
+    (MShellElement.ENVIRONMENT, MShellElement.LIVEWARE_CENTRAL): (
+        "作業環境は集中力を維持できるレベルか",
+        "健康・安全への配慮は十分か",
+        "ストレス要因の軽減策はあるか"
+    ),
+    (MShellElement.ENVIRONMENT, MShellElement.LIVEWARE_OTHER): (
+        "コミュニケーションを促進する環境か",
+        "チームワークを支援する物理的配置か",
+        "組織風土は協力的か"
+    ),
+    (MShellElement.LIVEWARE_CENTRAL, MShellElement.LIVEWARE_OTHER): (
+        "役割分担は明確で適切か",
+        "情報共有・報告の仕組みは機能しているか",
+        "相互支援・バックアップ体制は整っているか"
+    )
+}
+
+
 class ElementAnalysis:
     """要素別分析結果"""
+    __slots__ = (
+        "id", "element", "findings", "severity", "recommendations",
+        "_analyzed_timestamp", "analyzed_at_text"
+    )
+
     def __init__(self, element: MShellElement, findings: List[str], 
                  severity: AnalysisSeverity = AnalysisSeverity.MEDIUM,
                  recommendations: List[str] = None):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = secrets.token_hex(4)
         self.element = element
         self.findings = findings or []
         self.severity = severity
         self.recommendations = recommendations or []
-        self.analyzed_at = datetime.now()
+        self._analyzed_timestamp = time.time()
+        self.analyzed_at_text = _format_timestamp(self._analyzed_timestamp)
+
+    @property
+    def analyzed_at(self) -> datetime:
+        """分析日時"""
+        return datetime.fromtimestamp(self._analyzed_timestamp)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "element": self.element.value,
-            "element_jp": self._get_element_japanese(),
+            "element_jp": _ELEMENT_JP_NAMES[self.element],
             "findings": self.findings,
             "severity": {
                 "value": self.severity.value,
-                "label": self._get_severity_label()
+                "label": _SEVERITY_LABELS[self.severity]
             },
             "recommendations": self.recommendations,
-            "analyzed_at": self.analyzed_at.strftime('%Y-%m-%d %H:%M:%S')
+            "analyzed_at": self.analyzed_at_text
         }
 
     def _get_element_japanese(self) -> str:
-        jp_names = {
-            MShellElement.MACHINE: "機械・設備",
-            MShellElement.SOFTWARE: "ソフトウェア・手順",
-            MShellElement.HARDWARE: "ハードウェア・物理環境",
-            MShellElement.ENVIRONMENT: "環境・条件",
-            MShellElement.LIVEWARE_CENTRAL: "中心人物・主要オペレーター",
-            MShellElement.LIVEWARE_OTHER: "他者・チーム・組織"
-        }
-        return jp_names[self.element]
-
-    def _get_severity_label(self) -> str:
-        labels = {
-            AnalysisSeverity.LOW: "軽微",
-            AnalysisSeverity.MEDIUM: "中程度",
-            AnalysisSeverity.HIGH: "重要",
-            AnalysisSeverity.CRITICAL: "致命的"
-        }
-        return labels[self.severity]
+        return _ELEMENT_JP_NAMES[self.element]
 
 
 class InterfaceAnalysis:
     """要素間インターフェース分析"""
+    __slots__ = (
+        "id", "element1", "element2", "interface_issues", "interaction_quality",
+        "_analyzed_timestamp", "analyzed_at_text"
+    )
+
     def __init__(self, element1: MShellElement, element2: MShellElement,
                  interface_issues: List[str], interaction_quality: int = 5):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = secrets.token_hex(4)
         self.element1 = element1
         self.element2 = element2
         self.interface_issues = interface_issues or []
         self.interaction_quality = max(1, min(10, interaction_quality))  # 1-10スケール
-        self.analyzed_at = datetime.now()
+        self._analyzed_timestamp = time.time()
+        self.analyzed_at_text = _format_timestamp(self._analyzed_timestamp)
+
+    @property
+    def analyzed_at(self) -> datetime:
+        """分析日時"""
+        return datetime.fromtimestamp(self._analyzed_timestamp)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "interface": f"{self.element1.value} ↔ {self.element2.value}",
-            "interface_jp": f"{self._get_jp_name(self.element1)} ↔ {self._get_jp_name(self.element2)}",
+            "interface_jp": f"{_ELEMENT_SHORT_JP_NAMES[self.element1]} ↔ {_ELEMENT_SHORT_JP_NAMES[self.element2]}",
             "issues": self.interface_issues,
             "quality_score": self.interaction_quality,
             "quality_level": self._get_quality_level(),
-            "analyzed_at": self.analyzed_at.strftime('%Y-%m-%d %H:%M:%S')
+            "analyzed_at": self.analyzed_at_text
         }
 
-    def _get_jp_name(self, element: MShellElement) -> str:
-        jp_names = {
-            MShellElement.MACHINE: "機械",
-            MShellElement.SOFTWARE: "SW",
-            MShellElement.HARDWARE: "HW",
-            MShellElement.ENVIRONMENT: "環境",
-            MShellElement.LIVEWARE_CENTRAL: "中心人物",
-            MShellElement.LIVEWARE_OTHER: "他者"
-        }
-        return jp_names[element]
-
     def _get_quality_level(self) -> str:
-        if self.interaction_quality >= 8:
-            return "良好"
-        elif self.interaction_quality >= 6:
-            return "普通"
-        elif self.interaction_quality >= 4:
-            return "要改善"
-        else:
-            return "問題あり"
+        return _level_for(self.interaction_quality, _QUALITY_LEVELS)
 
 
 class MShellAnalysis:
     """m-SHELL分析セッション"""
+    __slots__ = (
+        "id", "system_name", "analysis_purpose", "context", "element_analyses",
+        "interface_analyses", "overall_assessment", "_created_timestamp", "_updated_timestamp",
+        "created_at_text", "updated_at_text", "critical_count", "interface_problem_count"
+    )
+
     def __init__(self, system_name: str, analysis_purpose: str, context: str = ""):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = secrets.token_hex(4)
         self.system_name = system_name
         self.analysis_purpose = analysis_purpose
         self.context = context
         self.element_analyses: Dict[str, ElementAnalysis] = {}
         self.interface_analyses: List[InterfaceAnalysis] = []
         self.overall_assessment: Optional[str] = None
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # 件数は追加時に更新し、参照のたびに全件を走査しない
+        self.critical_count = 0
+        self.interface_problem_count = 0
+        self._created_timestamp = time.time()
+        self.created_at_text = _format_timestamp(self._created_timestamp)
+        self._touch()
 
     def add_element_analysis(self, analysis: ElementAnalysis):
         """要素分析を追加"""
+        previous = self.element_analyses.get(analysis.element.value)
+        if previous is not None and previous.severity == AnalysisSeverity.CRITICAL:
+            self.critical_count -= 1
+        if analysis.severity == AnalysisSeverity.CRITICAL:
+            self.critical_count += 1
         self.element_analyses[analysis.element.value] = analysis
-        self.updated_at = datetime.now()
+        self._touch()
 
     def add_interface_analysis(self, analysis: InterfaceAnalysis):
         """インターフェース分析を追加"""
         self.interface_analyses.append(analysis)
-        self.updated_at = datetime.now()
+        if analysis.interaction_quality < _INTERFACE_PROBLEM_THRESHOLD:
+            self.interface_problem_count += 1
+        self._touch()
+
+    def _touch(self) -> None:
+        """更新日時と表示用文字列を更新"""
+        self._updated_timestamp = time.time()
+        self.updated_at_text = _format_timestamp(self._updated_timestamp)
+
+    @property
+    def created_at(self) -> datetime:
+        """作成日時"""
+        return datetime.fromtimestamp(self._created_timestamp)
+
+    @property
+    def updated_at(self) -> datetime:
+        """更新日時"""
+        return datetime.fromtimestamp(self._updated_timestamp)
 
     def get_critical_issues(self) -> List[ElementAnalysis]:
         """致命的問題の取得"""
@@ -146,7 +327,7 @@ class MShellAnalysis:
     def get_interface_problems(self) -> List[InterfaceAnalysis]:
         """インターフェース問題の取得"""
         return [analysis for analysis in self.interface_analyses 
-                if analysis.interaction_quality < 6]
+                if analysis.interaction_quality < _INTERFACE_PROBLEM_THRESHOLD]
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -156,232 +337,160 @@ class MShellAnalysis:
             "context": self.context,
             "element_count": len(self.element_analyses),
             "interface_count": len(self.interface_analyses),
-            "critical_issues": len(self.get_critical_issues()),
-            "interface_problems": len(self.get_interface_problems()),
+            "critical_issues": self.critical_count,
+            "interface_problems": self.interface_problem_count,
             "overall_assessment": self.overall_assessment,
-            "created_at": self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            "updated_at": self.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+            "created_at": self.created_at_text,
+            "updated_at": self.updated_at_text
         }
 
 
+# 要素別の分析テンプレート（カテゴリ → チェックポイント）
+_ANALYSIS_TEMPLATES: Mapping[MShellElement, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    MShellElement.MACHINE: MappingProxyType({
+        "設計・機能": (
+            "機器の設計は使用目的に適しているか",
+            "必要な機能が適切に実装されているか",
+            "異常時の動作は予測可能か"
+        ),
+        "信頼性・保守性": (
+            "故障率は許容範囲内か",
+            "保守・点検は容易に実行できるか",
+            "部品交換は迅速に行えるか"
+        ),
+        "操作性": (
+            "操作は直感的で分かりやすいか",
+            "エラーを防ぐ仕組みがあるか",
+            "緊急時の操作は容易か"
+        )
+    }),
+    MShellElement.SOFTWARE: MappingProxyType({
+        "手順・プロセス": (
+            "作業手順は明確に定義されているか",
+            "例外処理の手順は整備されているか",
+            "手順書は最新の状態に保たれているか"
+        ),
+        "プログラム・システム": (
+            "ソフトウェアは仕様通りに動作するか",
+            "ユーザーインターフェースは使いやすいか",
+            "データの整合性は保たれているか"
+        ),
+        "規則・基準": (
+            "関連法規・規制に準拠しているか",
+            "社内規定は適切に整備されているか",
+            "業界標準に合致しているか"
+        )
+    }),
+    MShellElement.HARDWARE: MappingProxyType({
+        "物理的環境": (
+            "作業スペースは十分確保されているか",
+            "照明・温度は適切に管理されているか",
+            "騒音レベルは許容範囲内か"
+        ),
+        "インターフェース": (
+            "操作パネルは見やすく配置されているか",
+            "表示装置は判読しやすいか",
+            "操作系統は使いやすい配置か"
+        ),
+        "安全設備": (
+            "安全装置は適切に配置されているか",
+            "緊急停止装置にアクセスしやすいか",
+            "防護設備は十分に機能するか"
+        )
+    }),
+    MShellElement.ENVIRONMENT: MappingProxyType({
+        "作業環境": (
+            "温度・湿度は快適な範囲か",
+            "換気は十分に行われているか",
+            "振動・衝撃の影響はないか"
+        ),
+        "組織環境": (
+            "組織風土は安全を重視しているか",
+            "報告・相談しやすい雰囲気か",
+            "継続的改善の仕組みがあるか"
+        ),
+        "外部環境": (
+            "気象条件の影響を考慮しているか",
+            "周辺施設からの影響はないか",
+            "法的・社会的制約を理解しているか"
+        )
+    }),
+    MShellElement.LIVEWARE_CENTRAL: MappingProxyType({
+        "知識・技能": (
+            "必要な知識・技能を習得しているか",
+            "経験は業務に十分活用されているか",
+            "継続的な学習・向上に取り組んでいるか"
+        ),
+        "身体的・心理的状態": (
+            "健康状態は良好か",
+            "疲労・ストレス管理はできているか",
+            "モチベーションは維持されているか"
+        ),
+        "判断・意思決定": (
+            "状況判断は適切に行えるか",
+            "優先順位の設定は妥当か",
+            "リスクの認識・評価は適切か"
+        )
+    }),
+    MShellElement.LIVEWARE_OTHER: MappingProxyType({
+        "チーム・協調": (
+            "チーム内のコミュニケーションは円滑か",
+            "役割分担は明確に定義されているか",
+            "相互支援の仕組みがあるか"
+        ),
+        "組織・管理": (
+            "管理体制は適切に構築されているか",
+            "情報共有は効果的に行われているか",
+            "意思決定プロセスは迅速か"
+        ),
+        "外部関係者": (
+            "関係機関との連携は良好か",
+            "顧客・利用者との関係は適切か",
+            "協力会社との調整は円滑か"
+        )
+    })
+})
+
+
+def _interface_checkpoints(elem1: MShellElement, elem2: MShellElement) -> Tuple[str, ...]:
+    """要素間インターフェースのチェックポイント取得"""
+    return _INTERFACE_PATTERNS.get((elem1, elem2), _INTERFACE_PATTERNS.get((elem2, elem1), (
+        f"{elem1.value}と{elem2.value}の相互作用を分析",
+        "インターフェース品質の評価",
+        "改善点の特定"
+    )))
+
+
+# 要素間インターフェースの分析ポイント（要素の組み合わせごとに1件、重複なし）
+_INTERFACE_MATRIX: Mapping[Tuple[MShellElement, MShellElement], Tuple[str, ...]] = MappingProxyType({
+    (elem1, elem2): _interface_checkpoints(elem1, elem2)
+    for elem1, elem2 in combinations(MShellElement, 2)
+})
+
+# 要素の順序に関係なく1回の参照で引けるよう、両方向のキーを持つ索引
+_INTERFACE_LOOKUP: Mapping[Tuple[MShellElement, MShellElement], Tuple[str, ...]] = MappingProxyType({
+    **_INTERFACE_MATRIX,
+    **{(elem2, elem1): checkpoints for (elem1, elem2), checkpoints in _INTERFACE_MATRIX.items()}
+})
+
+
 class MShell:
     """m-SHELL Model implementation for Human Factors Analysis"""
 
-    def __init__(self):
+    def __init__(self, max_analyses: int = MAX_ANALYSES):
+        # 分析は作成順に保持し、上限を超えたら最も古いものから破棄する
         self.analyses: Dict[str, MShellAnalysis] = {}
-        self.analysis_templates = self._initialize_analysis_templates()
-        self.interface_matrix = self._initialize_interface_matrix()
-
-    def _initialize_analysis_templates(self) -> Dict[MShellElement, Dict[str, List[str]]]:
-        """分析テンプレートの初期化"""
-        return {
-            MShellElement.MACHINE: {
-                "設計・機能": [
-                    "機器の設計は使用目的に適しているか",
-                    "必要な機能が適切に実装されているか",
-                    "異常時の動作は予測可能か"
-                ],
-                "信頼性・保守性": [
-                    "故障率は許容範囲内か",
-                    "保守・点検は容易に実行できるか",
-                    "部品交換は迅速に行えるか"
-                ],
-                "操作性": [
-                    "操作は直感的で分かりやすいか",
-                    "エラーを防ぐ仕組みがあるか",
-                    "緊急時の操作は容易か"
-                ]
-            },
-            MShellElement.SOFTWARE: {
-                "手順・プロセス": [
-                    "作業手順は明確に定義されているか",
-                    "例外処理の手順は整備されているか",
-                    "手順書は最新の状態に保たれているか"
-                ],
-                "プログラム・システム": [
-                    "ソフトウェアは仕様通りに動作するか",
-                    "ユーザーインターフェースは使いやすいか",
-                    "データの整合性は保たれているか"
-                ],
-                "規則・基準": [
-                    "関連法規・規制に準拠しているか",
-                    "社内規定は適切に整備されているか",
-                    "業界標準に合致しているか"
-                ]
-            },
-            MShellElement.HARDWARE: {
-                "物理的環境": [
-                    "作業スペースは十分確保されているか",
-                    "照明・温度は適切に管理されているか",
-                    "騒音レベルは許容範囲内か"
-                ],
-                "インターフェース": [
-                    "操作パネルは見やすく配置されているか",
-                    "表示装置は判読しやすいか",
-                    "操作系統は使いやすい配置か"
-                ],
-                "安全設備": [
-                    "安全装置は適切に配置されているか",
-                    "緊急停止装置にアクセスしやすいか",
-                    "防護設備は十分に機能するか"
-                ]
-            },
-            MShellElement.ENVIRONMENT: {
-                "作業環境": [
-                    "温度・湿度は快適な範囲か",
-                    "換気は十分に行われているか",
-                    "振動・衝撃の影響はないか"
-                ],
-                "組織環境": [
-                    "組織風土は安全を重視しているか",
-                    "報告・相談しやすい雰囲気か",
-                    "継続的改善の仕組みがあるか"
-                ],
-                "外部環境": [
-                    "気象条件の影響を考慮しているか",
-                    "周辺施設からの影響はないか",
-                    "法的・社会的制約を理解しているか"
-                ]
-            },
-            MShellElement.LIVEWARE_CENTRAL: {
-                "知識・技能": [
-                    "必要な知識・技能を習得しているか",
-                    "経験は業務に十分活用されているか",
-                    "継続的な学習・向上に取り組んでいるか"
-                ],
-                "身体的・心理的状態": [
-                    "健康状態は良好か",
-                    "疲労・ストレス管理はできているか",
-                    "モチベーションは維持されているか"
-                ],
-                "判断・意思決定": [
-                    "状況判断は適切に行えるか",
-                    "優先順位の設定は妥当か",
-                    "リスクの認識・評価は適切か"
-                ]
-            },
-            MShellElement.LIVEWARE_OTHER: {
-                "チーム・協調": [
-                    "チーム内のコミュニケーションは円滑か",
-                    "役割分担は明確に定義されているか",
-                    "相互支援の仕組みがあるか"
-                ],
-                "組織・管理": [
-                    "管理体制は適切に構築されているか",
-                    "情報共有は効果的に行われているか",
-                    "意思決定プロセスは迅速か"
-                ],
-                "外部関係者": [
-                    "関係機関との連携は良好か",
-                    "顧客・利用者との関係は適切か",
-                    "協力会社との調整は円滑か"
-                ]
-            }
-        }
-
-    def _initialize_interface_matrix(self) -> Dict[Tuple[MShellElement, MShellElement], List[str]]:
-        """要素間インターフェースの分析ポイント初期化"""
-        matrix = {}
-        elements = list(MShellElement)
-        
-        for i, elem1 in enumerate(elements):
-            for j, elem2 in enumerate(elements):
-                if i < j:  # 重複を避ける
-                    key = (elem1, elem2)
-                    matrix[key] = self._get_interface_checkpoints(elem1, elem2)
-        
-        return matrix
-
-    def _get_interface_checkpoints(self, elem1: MShellElement, elem2: MShellElement) -> List[str]:
-        """要素間インターフェースのチェックポイント取得"""
-        interface_patterns = {
-            (MShellElement.MACHINE, MShellElement.SOFTWARE): [
-                "機械制御ソフトウェアは適切に動作するか",
-                "機械からのフィードバック情報は正確か",
-                "ソフトウェア更新時の機械への影響は検証されているか"
-            ],
-            (MShellElement.MACHINE, MShellElement.HARDWARE): [
-                "機械と操作盤の配置関係は適切か",
-                "表示・警告装置は機械の状態を正確に反映するか",
-                "物理的な接続・配線に問題はないか"
-            ],
-            (MShellElement.MACHINE, MShellElement.ENVIRONMENT): [
-                "環境条件は機械の性能に影響しないか",
-                "機械からの発熱・騒音・振動は環境に悪影響を与えないか",
-                "清掃・保守作業用のスペースは確保されているか"
-            ],
-            (MShellElement.MACHINE, MShellElement.LIVEWARE_CENTRAL): [
-                "オペレーターは機械の操作方法を熟知しているか",
-                "機械の異常を適切に判断できるか",
-                "緊急時の対応手順は身についているか"
-            ],
-            (MShellElement.MACHINE, MShellElement.LIVEWARE_OTHER): [
-                "保守担当者との連携は円滑か",
-                "機械情報の共有は適切に行われているか",
-                "交代時の申し送り事項は明確か"
-            ],
-            (MShellElement.SOFTWARE, MShellElement.HARDWARE): [
-                "ソフトウェアとハードウェアの互換性に問題はないか",
-                "画面表示と物理操作の対応関係は明確か",
-                "入力デバイスの応答性は適切か"
-            ],
-            (MShellElement.SOFTWARE, MShellElement.ENVIRONMENT): [
-                "環境変化がソフトウェア動作に影響しないか",
-                "ネットワーク環境は安定しているか",
-                "データバックアップ環境は整備されているか"
-            ],
-            (MShellElement.SOFTWARE, MShellElement.LIVEWARE_CENTRAL): [
-                "ユーザーインターフェースは直感的か",
-                "エラーメッセージは理解しやすいか",
-                "操作手順は論理的に設計されているか"
-            ],
-            (MShellElement.SOFTWARE, MShellElement.LIVEWARE_OTHER): [
-                "複数ユーザー間での情報共有は適切か",
-                "アクセス権限の管理は適正か",
-                "協調作業の支援機能は充実しているか"
-            ],
-            (MShellElement.HARDWARE, MShellElement.ENVIRONMENT): [
-                "ハードウェアは環境条件に対して十分な耐性があるか",
-                "設置場所の物理的制約は考慮されているか",
-                "メンテナンス用のアクセス経路は確保されているか"
-            ],
-            (MShellElement.HARDWARE, MShellElement.LIVEWARE_CENTRAL): [
-                "操作性・視認性は十分考慮されているか",
-                "人間工学的な配慮がなされているか",
-                "長時間使用時の疲労軽減策はあるか"
-            ],
-            (MShellElement.HARDWARE, MShellElement.LIVEWARE_OTHER): [
-                "共用設備の使用ルールは明確か",
-                "保守・点検作業の安全性は確保されているか",
-                "機器の設定変更権限は適切に管理されているか"
-            ],
-            (MShellElement.ENVIRONMENT, MShellElement.LIVEWARE_CENTRAL): [
-                "作業環境は集中力を維持できるレベルか",
-                "健康・安全への配慮は十分か",
-                "ストレス要因の軽減策はあるか"
-            ],
-            (MShellElement.ENVIRONMENT, MShellElement.LIVEWARE_OTHER): [
-                "コミュニケーションを促進する環境か",
-                "チームワークを支援する物理的配置か",
-                "組織風土は協力的か"
-            ],
-            (MShellElement.LIVEWARE_CENTRAL, MShellElement.LIVEWARE_OTHER): [
-                "役割分担は明確で適切か",
-                "情報共有・報告の仕組みは機能しているか",
-                "相互支援・バックアップ体制は整っているか"
-            ]
-        }
-        
-        return interface_patterns.get((elem1, elem2), interface_patterns.get((elem2, elem1), [
-            f"{elem1.value}と{elem2.value}の相互作用を分析",
-            "インターフェース品質の評価",
-            "改善点の特定"
-        ]))
+        self.max_analyses = max_analyses
+        # テンプレートとマトリックスは不変のモジュール定数を共有する
+        self.analysis_templates = _ANALYSIS_TEMPLATES
+        self.interface_matrix = _INTERFACE_MATRIX
 
     def create_analysis(self, system_name: str, analysis_purpose: str, context: str = "") -> Dict[str, Any]:
         """m-SHELL分析を開始"""
         analysis = MShellAnalysis(system_name, analysis_purpose, context)
         self.analyses[analysis.id] = analysis
+        while len(self.analyses) > self.max_analyses:
+            del self.analyses[next(iter(self.analyses))]
 
         return {
             "success": True,
@@ -392,20 +501,13 @@ class MShell:
                 "analysis_purpose": analysis_purpose,
                 "available_elements": [elem.value for elem in MShellElement],
                 "element_descriptions": self._get_element_descriptions(),
-                "created_at": analysis.created_at.strftime('%Y-%m-%d %H:%M:%S')
+                "created_at": analysis.created_at_text
             }
         }
 
     def _get_element_descriptions(self) -> Dict[str, str]:
         """要素の説明を取得"""
-        return {
-            "Machine": "機械・設備・装置（物理的なシステムの中核）",
-            "Software": "ソフトウェア・手順・規則（システムの論理的側面）",
-            "Hardware": "ハードウェア・物理環境・インターフェース（システムの物理的境界）",
-            "Environment": "環境・条件・文脈（システムを取り巻く状況）",
-            "Liveware-Central": "中心人物・主要オペレーター（システムの中核となる人）",
-            "Liveware-Other": "他者・チーム・組織（中心人物と関わる人々）"
-        }
+        return dict(_ELEMENT_DESCRIPTIONS)
 
     def analyze_element(self, analysis_id: str, element: str, findings: List[str],
                        severity: int = 2, recommendations: List[str] = None) -> Dict[str, Any]:
@@ -416,17 +518,15 @@ class MShell:
                 "message": f"❌ 分析ID '{analysis_id}' が見つかりません"
             }
 
-        try:
-            element_enum = MShellElement(element)
-        except ValueError:
+        element_enum = _ELEMENTS_BY_VALUE.get(element)
+        if element_enum is None:
             return {
                 "success": False,
                 "message": f"❌ 無効な要素: {element}"
             }
 
-        try:
-            severity_enum = AnalysisSeverity(severity)
-        except ValueError:
+        severity_enum = _SEVERITIES_BY_VALUE.get(severity)
+        if severity_enum is None:
             return {
                 "success": False,
                 "message": f"❌ 無効な重要度: {severity} (1-4の範囲で指定)"
@@ -442,7 +542,11 @@ class MShell:
             "data": {
                 "analysis_id": analysis_id,
                 "element_analysis": element_analysis.to_dict(),
-                "available_checkpoints": self.analysis_templates.get(element_enum, {}),
+                # 共有テンプレートを呼び出し元に渡さないよう、カテゴリごとにコピーして返す
+                "available_checkpoints": {
+                    category: list(checkpoints)
+                    for category, checkpoints in self.analysis_templates[element_enum].items()
+                },
                 "progress": f"{len(analysis.element_analyses)}/6要素"
             }
         }
@@ -456,10 +560,9 @@ class MShell:
                 "message": f"❌ 分析ID '{analysis_id}' が見つかりません"
             }
 
-        try:
-            elem1 = MShellElement(element1)
-            elem2 = MShellElement(element2)
-        except ValueError:
+        elem1 = _ELEMENTS_BY_VALUE.get(element1)
+        elem2 = _ELEMENTS_BY_VALUE.get(element2)
+        if elem1 is None or elem2 is None:
             return {
                 "success": False,
                 "message": f"❌ 無効な要素: {element1} または {element2}"
@@ -476,15 +579,15 @@ class MShell:
         analysis.add_interface_analysis(interface_analysis)
 
         # 該当インターフェースのチェックポイント取得
-        checkpoints = self.interface_matrix.get((elem1, elem2)) or \
-                     self.interface_matrix.get((elem2, elem1)) or []
+        checkpoints = _INTERFACE_LOOKUP.get((elem1, elem2), ())
+        interface_dict = interface_analysis.to_dict()
 
         return {
             "success": True,
-            "message": f"✅ {interface_analysis.to_dict()['interface_jp']}のインターフェース分析を記録しました",
+            "message": f"✅ {interface_dict['interface_jp']}のインターフェース分析を記録しました",
             "data": {
                 "analysis_id": analysis_id,
-                "interface_analysis": interface_analysis.to_dict(),
+                "interface_analysis": interface_dict,
                 "suggested_checkpoints": checkpoints,
                 "total_interfaces": len(analysis.interface_analyses)
             }
@@ -537,11 +640,14 @@ class MShell:
         avg_element_score = total_severity / element_count if element_count > 0 else 0
 
         # インターフェース評価
-        interface_scores = [ia.interaction_quality for ia in analysis.interface_analyses]
-        avg_interface_score = sum(interface_scores) / len(interface_scores) if interface_scores else 0
+        interface_count = len(analysis.interface_analyses)
+        avg_interface_score = (
+            sum(ia.interaction_quality for ia in analysis.interface_analyses) / interface_count
+            if interface_count else 0
+        )
 
         # 総合スコア
-        overall_score = (avg_element_score * 0.6 + avg_interface_score * 0.4) if interface_scores else avg_element_score
+        overall_score = (avg_element_score * 0.6 + avg_interface_score * 0.4) if interface_count else avg_element_score
 
         return {
             "overall_score": round(overall_score, 2),
@@ -550,60 +656,47 @@ class MShell:
             "average_element_score": round(avg_element_score, 2),
             "average_interface_score": round(avg_interface_score, 2),
             "analysis_completeness": f"{element_count}/6要素分析済み",
-            "interface_completeness": f"{len(analysis.interface_analyses)}件のインターフェース分析済み",
+            "interface_completeness": f"{interface_count}件のインターフェース分析済み",
             "summary": self._generate_evaluation_summary(analysis, overall_score)
         }
 
     def _get_overall_level(self, score: float) -> str:
         """総合評価レベルの判定"""
-        if score >= 8:
-            return "優秀"
-        elif score >= 6:
-            return "良好" 
-        elif score >= 4:
-            return "普通"
-        elif score >= 2:
-            return "要改善"
-        else:
-            return "危険"
+        return _level_for(score, _OVERALL_LEVELS)
 
     def _generate_evaluation_summary(self, analysis: MShellAnalysis, score: float) -> str:
         """評価サマリーの生成"""
         level = self._get_overall_level(score)
-        critical_count = len(analysis.get_critical_issues())
-        problem_interfaces = len(analysis.get_interface_problems())
+        critical_count = analysis.critical_count
+        problem_interfaces = analysis.interface_problem_count
 
-        summary = f"システム全体の評価は「{level}」レベルです。"
+        parts = [f"システム全体の評価は「{level}」レベルです。"]
         
         if critical_count > 0:
-            summary += f" {critical_count}件の致命的問題が特定されました。"
+            parts.append(f" {critical_count}件の致命的問題が特定されました。")
         
         if problem_interfaces > 0:
-            summary += f" {problem_interfaces}件のインターフェースに改善の余地があります。"
+            parts.append(f" {problem_interfaces}件のインターフェースに改善の余地があります。")
             
         if score >= 6:
-            summary += " 基本的なシステム品質は確保されています。"
+            parts.append(" 基本的なシステム品質は確保されています。")
         else:
-            summary += " システム改善の優先的な取り組みが必要です。"
+            parts.append(" システム改善の優先的な取り組みが必要です。")
 
-        return summary
+        return "".join(parts)
 
     def _generate_system_recommendations(self, analysis: MShellAnalysis) -> List[str]:
         """システム推奨事項の生成"""
         recommendations = []
         
-        critical_issues = analysis.get_critical_issues()
-        if critical_issues:
-            recommendations.append(f"🚨 {len(critical_issues)}件の致命的問題への即座の対応が最優先")
+        if analysis.critical_count:
+            recommendations.append(f"🚨 {analysis.critical_count}件の致命的問題への即座の対応が最優先")
             
-        problem_interfaces = analysis.get_interface_problems()
-        if problem_interfaces:
-            recommendations.append(f"🔗 {len(problem_interfaces)}件のインターフェース改善が必要")
+        if analysis.interface_problem_count:
+            recommendations.append(f"🔗 {analysis.interface_problem_count}件のインターフェース改善が必要")
 
         # 要素別の分析状況確認
-        analyzed_elements = set(analysis.element_analyses.keys())
-        all_elements = set(elem.value for elem in MShellElement)
-        missing_elements = all_elements - analyzed_elements
+        missing_elements = [value for value in _ELEMENTS_BY_VALUE if value not in analysis.element_analyses]
         
         if missing_elements:
             recommendations.append(f"📋 未分析要素（{', '.join(missing_elements)}）の分析を推奨")
@@ -618,8 +711,12 @@ class MShell:
 
         return recommendations
 
-    def get_analysis(self, analysis_id: str) -> Dict[str, Any]:
-        """m-SHELL分析の取得"""
+    def get_analysis(self, analysis_id: str, *, include_details: bool = True) -> Dict[str, Any]:
+        """m-SHELL分析の取得
+
+        include_details=Falseの場合は要素・インターフェース分析の個別結果を省略し、
+        件数とサマリーのみを返す。
+        """
         if analysis_id not in self.analyses:
             return {
                 "success": False,
@@ -627,44 +724,43 @@ class MShell:
             }
 
         analysis = self.analyses[analysis_id]
-        element_analyses = [elem.to_dict() for elem in analysis.element_analyses.values()]
-        interface_analyses = [intf.to_dict() for intf in analysis.interface_analyses]
+        data = analysis.to_dict()
+        if include_details:
+            data["element_analyses"] = [elem.to_dict() for elem in analysis.element_analyses.values()]
+            data["interface_analyses"] = [intf.to_dict() for intf in analysis.interface_analyses]
+        data["analysis_summary"] = self._generate_analysis_summary(analysis)
 
         return {
             "success": True,
             "message": f"🔍 m-SHELL分析 '{analysis.system_name}' の詳細",
-            "data": {
-                **analysis.to_dict(),
-                "element_analyses": element_analyses,
-                "interface_analyses": interface_analyses,
-                "analysis_summary": self._generate_analysis_summary(analysis)
-            }
+            "data": data
         }
 
     def _generate_analysis_summary(self, analysis: MShellAnalysis) -> Dict[str, Any]:
         """分析サマリーの生成"""
+        # 指摘数・推奨数・重要度分布を要素分析の1回の走査で集計
+        total_findings = 0
+        total_recommendations = 0
+        distribution = dict.fromkeys(_SEVERITY_LABELS.values(), 0)
+        for elem_analysis in analysis.element_analyses.values():
+            total_findings += len(elem_analysis.findings)
+            total_recommendations += len(elem_analysis.recommendations)
+            distribution[_SEVERITY_LABELS[elem_analysis.severity]] += 1
+
         return {
             "completion_rate": f"{len(analysis.element_analyses)}/6要素",
-            "total_findings": sum(len(ea.findings) for ea in analysis.element_analyses.values()),
-            "total_recommendations": sum(len(ea.recommendations) for ea in analysis.element_analyses.values()),
-            "severity_distribution": self._calculate_severity_distribution(analysis),
+            "total_findings": total_findings,
+            "total_recommendations": total_recommendations,
+            "severity_distribution": distribution,
             "interface_quality_avg": self._calculate_interface_average(analysis)
         }
 
-    def _calculate_severity_distribution(self, analysis: MShellAnalysis) -> Dict[str, int]:
-        """重要度分布の計算"""
-        distribution = {"軽微": 0, "中程度": 0, "重要": 0, "致命的": 0}
-        for elem_analysis in analysis.element_analyses.values():
-            label = elem_analysis._get_severity_label()
-            distribution[label] += 1
-        return distribution
-
     def _calculate_interface_average(self, analysis: MShellAnalysis) -> Optional[float]:
         """インターフェース品質の平均計算"""
         if not analysis.interface_analyses:
             return None
-        scores = [ia.interaction_quality for ia in analysis.interface_analyses]
-        return round(sum(scores) / len(scores), 2)
+        total = sum(ia.interaction_quality for ia in analysis.interface_analyses)
+        return round(total / len(analysis.interface_analyses), 2)
 
     def list_analyses(self) -> Dict[str, Any]:
         """すべてのm-SHELL分析の一覧取得"""
@@ -675,9 +771,8 @@ class MShell:
                 "data": {"analyses": []}
             }
 
-        # 分析を作成日時でソート（新しい順）
-        sorted_analyses = sorted(self.analyses.values(), key=lambda x: x.created_at, reverse=True)
-        analyses_list = [analysis.to_dict() for analysis in sorted_analyses]
+        # 分析は作成時にのみ登録されるため、登録順の逆がそのまま新しい順になる
+        analyses_list = [analysis.to_dict() for analysis in reversed(self.analyses.values())]
 
         return {
             "success": True,
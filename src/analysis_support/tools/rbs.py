@@ -1,9 +1,12 @@
 """PMBOK RBS (Risk Breakdown Structure) implementation."""
 
-import uuid
+import secrets
+import time
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-from enum import Enum
+from types import MappingProxyType
+from typing import Any, Counter as CounterType, DefaultDict, Dict, List, Mapping, Optional, Tuple
+from enum import Enum, IntEnum
 
 
 class RiskCategory(Enum):
@@ -14,7 +17,7 @@ class RiskCategory(Enum):
     PROJECT_MANAGEMENT = "プロジェクト管理リスク"
 
 
-class RiskImpact(Enum):
+class RiskImpact(IntEnum):
     """リスクの影響度"""
     VERY_LOW = 1
     LOW = 2
@@ -23,7 +26,7 @@ class RiskImpact(Enum):
     VERY_HIGH = 5
 
 
-class RiskProbability(Enum):
+class RiskProbability(IntEnum):
     """リスクの発生確率"""
     VERY_LOW = 1
     LOW = 2
@@ -32,97 +35,169 @@ class RiskProbability(Enum):
     VERY_HIGH = 5
 
 
+# カテゴリ名からリスクカテゴリへの対応（不正な値を例外処理なしで判定する）
+_CATEGORIES_BY_VALUE: Dict[str, RiskCategory] = {category.value: category for category in RiskCategory}
+
+# 日時の表示形式
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _format_timestamp_ns(timestamp_ns: int) -> str:
+    """ナノ秒のUNIX時刻を表示用の文字列に変換"""
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime(timestamp_ns / 1e9))
+
+
+# 発生確率・影響度のラベル（値 - 1 で参照）
+_PROBABILITY_LABELS: Tuple[str, ...] = ("非常に低い", "低い", "中程度", "高い", "非常に高い")
+_IMPACT_LABELS: Tuple[str, ...] = ("非常に軽微", "軽微", "中程度", "重大", "非常に重大")
+
+# 辞書化で使う値とラベルの組（値 - 1 で参照。to_dictはコピーを返すため外部には共有されない）
+_PROBABILITY_ENTRIES: Tuple[Dict[str, Any], ...] = tuple(
+    {"value": level, "label": label} for level, label in enumerate(_PROBABILITY_LABELS, 1)
+)
+_IMPACT_ENTRIES: Tuple[Dict[str, Any], ...] = tuple(
+    {"value": level, "label": label} for level, label in enumerate(_IMPACT_LABELS, 1)
+)
+
+# 優先度の下限スコアとラベル（下限スコアの降順）
+_PRIORITY_THRESHOLDS: Tuple[Tuple[int, str], ...] = (
+    (16, "最高優先"),
+    (12, "高優先"),
+    (8, "中優先"),
+    (4, "低優先"),
+    (0, "最低優先")
+)
+
+# 発生確率・影響度の値（1-5）とリスクマトリックスのキー（添字0は未使用）
+_LEVELS = range(1, 6)
+_LEVEL_KEYS: Tuple[str, ...] = tuple(str(level) for level in range(6))
+
+# リスクスコアの上限（発生確率5 × 影響度5）と高優先度とみなす下限
+_MAX_RISK_SCORE = 25
+_HIGH_PRIORITY_SCORE = 12
+
+# リスクスコア（1-25）→ 優先度ラベル
+_PRIORITY_BY_SCORE: Tuple[str, ...] = tuple(
+    next(label for threshold, label in _PRIORITY_THRESHOLDS if score >= threshold)
+    for score in range(_MAX_RISK_SCORE + 1)
+)
+
+
 class RiskItem:
     """個別のリスクアイテム"""
+    __slots__ = (
+        "id", "name", "description", "category", "subcategory", "probability", "impact",
+        "risk_score", "_created_ns", "_cached_dict"
+    )
+
     def __init__(self, name: str, description: str, category: RiskCategory,
                  subcategory: str, probability: RiskProbability = RiskProbability.MEDIUM,
                  impact: RiskImpact = RiskImpact.MEDIUM):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = secrets.token_hex(4)
         self.name = name
         self.description = description
         self.category = category
         self.subcategory = subcategory
         self.probability = probability
         self.impact = impact
-        self.risk_score = probability.value * impact.value
-        self.created_at = datetime.now()
+        self.risk_score = probability * impact
+        # 時刻は整数で保持し、文字列化は辞書化するときまで遅らせる
+        self._created_ns = time.time_ns()
+        self._cached_dict: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換（作成後は変更されないため初回の結果を保持し、呼び出しごとにコピーを返す）"""
+        if self._cached_dict is None:
+            self._cached_dict = self._build_dict()
+        data = dict(self._cached_dict)
+        data["probability"] = dict(data["probability"])
+        data["impact"] = dict(data["impact"])
+        return data
+
+    @property
+    def created_at(self) -> datetime:
+        """作成日時"""
+        return datetime.fromtimestamp(self._created_ns / 1e9)
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "name": self.name,
             "description": self.description,
             "category": self.category.value,
             "subcategory": self.subcategory,
-            "probability": {
-                "value": self.probability.value,
-                "label": self._get_probability_label()
-            },
-            "impact": {
-                "value": self.impact.value,
-                "label": self._get_impact_label()
-            },
+            "probability": _PROBABILITY_ENTRIES[self.probability - 1],
+            "impact": _IMPACT_ENTRIES[self.impact - 1],
             "risk_score": self.risk_score,
             "priority": self._get_priority_level(),
-            "created_at": self.created_at.strftime('%Y-%m-%d %H:%M:%S')
+            "created_at": _format_timestamp_ns(self._created_ns)
         }
 
-    def _get_probability_label(self) -> str:
-        labels = {
-            RiskProbability.VERY_LOW: "非常に低い",
-            RiskProbability.LOW: "低い",
-            RiskProbability.MEDIUM: "中程度",
-            RiskProbability.HIGH: "高い",
-            RiskProbability.VERY_HIGH: "非常に高い"
-        }
-        return labels[self.probability]
-
-    def _get_impact_label(self) -> str:
-        labels = {
-            RiskImpact.VERY_LOW: "非常に軽微",
-            RiskImpact.LOW: "軽微",
-            RiskImpact.MEDIUM: "中程度",
-            RiskImpact.HIGH: "重大",
-            RiskImpact.VERY_HIGH: "非常に重大"
-        }
-        return labels[self.impact]
-
     def _get_priority_level(self) -> str:
-        if self.risk_score >= 16:
-            return "最高優先"
-        elif self.risk_score >= 12:
-            return "高優先"
-        elif self.risk_score >= 8:
-            return "中優先"
-        elif self.risk_score >= 4:
-            return "低優先"
-        else:
-            return "最低優先"
+        return _PRIORITY_BY_SCORE[self.risk_score]
 
 
 class RBSAnalysis:
     """RBS分析セッション"""
+    __slots__ = (
+        "id", "project_name", "project_type", "context", "risks", "_created_ns", "_updated_ns",
+        "_risks_by_category", "_high_priority_risks", "category_counts"
+    )
+
     def __init__(self, project_name: str, project_type: str, context: str = ""):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = secrets.token_hex(4)
         self.project_name = project_name
         self.project_type = project_type
         self.context = context
         self.risks: List[RiskItem] = []
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
-
-    def add_risk(self, risk: RiskItem):
+        # カテゴリ別・高優先度の索引とカテゴリ別件数は追加時に更新し、参照のたびに全件を走査しない
+        self._risks_by_category: Dict[RiskCategory, List[RiskItem]] = {category: [] for category in RiskCategory}
+        self._high_priority_risks: List[RiskItem] = []
+        self.category_counts: CounterType[str] = Counter()
+        self._created_ns = time.time_ns()
+        self._updated_ns = self._created_ns
+
+    def add_risk(self, risk: RiskItem) -> None:
         """リスクを追加"""
-        self.risks.append(risk)
-        self.updated_at = datetime.now()
+        self.add_risks([risk])
+
+    def add_risks(self, risks: List[RiskItem]) -> None:
+        """複数のリスクをまとめて追加"""
+        self.risks.extend(risks)
+        for risk in risks:
+            self._risks_by_category[risk.category].append(risk)
+            if risk.risk_score >= _HIGH_PRIORITY_SCORE:
+                self._high_priority_risks.append(risk)
+            self.category_counts[risk.category.value] += 1
+        self._updated_ns = time.time_ns()
+
+    @property
+    def created_at(self) -> datetime:
+        """作成日時"""
+        return datetime.fromtimestamp(self._created_ns / 1e9)
+
+    @property
+    def updated_at(self) -> datetime:
+        """更新日時"""
+        return datetime.fromtimestamp(self._updated_ns / 1e9)
+
+    @property
+    def created_at_text(self) -> str:
+        """表示用の作成日時"""
+        return _format_timestamp_ns(self._created_ns)
 
     def get_risks_by_category(self, category: RiskCategory) -> List[RiskItem]:
         """カテゴリ別のリスク取得"""
-        return [risk for risk in self.risks if risk.category == category]
+        return list(self._risks_by_category[category])
 
     def get_high_priority_risks(self) -> List[RiskItem]:
         """高優先度リスクの取得"""
-        return [risk for risk in self.risks if risk.risk_score >= 12]
+        return list(self._high_priority_risks)
+
+    @property
+    def high_priority_count(self) -> int:
+        """高優先度リスクの件数"""
+        return len(self._high_priority_risks)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -131,10 +206,130 @@ class RBSAnalysis:
             "project_type": self.project_type,
             "context": self.context,
             "risk_count": len(self.risks),
-            "high_priority_count": len(self.get_high_priority_risks()),
-            "created_at": self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            "updated_at": self.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+            "high_priority_count": self.high_priority_count,
+            "created_at": self.created_at_text,
+            "updated_at": _format_timestamp_ns(self._updated_ns)
+        }
+
+
+# カテゴリ別のリスクテンプレート（サブカテゴリ → リスク例）
+_RISK_TEMPLATES: Mapping[RiskCategory, Dict[str, Tuple[str, ...]]] = MappingProxyType({
+    RiskCategory.TECHNICAL: {
+        "技術要件": (
+            "新技術の学習コスト",
+            "技術仕様の変更",
+            "技術的実現可能性の不確実性"
+        ),
+        "システム統合": (
+            "既存システムとの互換性",
+            "データ移行の複雑さ",
+            "システム性能の問題"
+        ),
+        "品質保証": (
+            "テスト不備による品質問題",
+            "セキュリティ脆弱性",
+            "スケーラビリティの問題"
+        )
+    },
+    RiskCategory.EXTERNAL: {
+        "市場・競合": (
+            "市場環境の変化",
+            "競合他社の動向",
+            "顧客ニーズの変化"
+        ),
+        "規制・法律": (
+            "規制要件の変更",
+            "法律改正の影響",
+            "コンプライアンス違反"
+        ),
+        "外部依存": (
+            "外部ベンダーの遅延",
+            "サードパーティライブラリの問題",
+            "外部サービスの停止"
+        )
+    },
+    RiskCategory.ORGANIZATIONAL: {
+        "人的リソース": (
+            "キーパーソンの離職",
+            "スキル不足",
+            "チーム間のコミュニケーション不足"
+        ),
+        "組織体制": (
+            "組織変更の影響",
+            "権限・責任の不明確",
+            "意思決定の遅延"
+        ),
+        "企業文化": (
+            "変革への抵抗",
+            "優先度の競合",
+            "リソース配分の問題"
+        )
+    },
+    RiskCategory.PROJECT_MANAGEMENT: {
+        "スケジュール": (
+            "工期の遅延",
+            "依存関係の複雑化",
+            "マイルストーンの未達成"
+        ),
+        "予算・コスト": (
+            "予算超過",
+            "隠れたコストの発生",
+            "為替変動の影響"
+        ),
+        "スコープ・要件": (
+            "要件の変更・追加",
+            "スコープクリープ",
+            "ステークホルダー要求の変化"
+        )
+    }
+})
+
+
+def _build_structure_tree() -> Dict[str, Any]:
+    """RBS構造ツリーの構築（呼び出し元が変更してもテンプレートに影響しないよう毎回新しく作る）"""
+    structure = {}
+    for category in RiskCategory:
+        subcategories = {}
+        for subcat, risks in _RISK_TEMPLATES[category].items():
+            subcategories[subcat] = {
+                "risk_examples": list(risks),
+                "count": len(risks)
+            }
+        structure[category.value] = {
+            "subcategories": subcategories,
+            "total_examples": sum(len(risks) for risks in _RISK_TEMPLATES[category].values())
         }
+    return structure
+
+
+# プロジェクトタイプ別の推奨フォーカス領域
+_PROJECT_RECOMMENDATIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "IT・システム開発": (
+        "技術的リスクを最優先で検討",
+        "システム統合とデータ移行に注意",
+        "セキュリティ要件の早期確認"
+    ),
+    "インフラ・建設": (
+        "外部環境要因（天候、規制）を重視",
+        "安全管理と品質保証を最優先",
+        "資材調達とサプライチェーン管理"
+    ),
+    "新商品開発": (
+        "市場・競合リスクを重点分析",
+        "技術的実現可能性の検証",
+        "知的財産と特許の考慮"
+    ),
+    "組織変革": (
+        "組織リスクを最重要視",
+        "変革への抵抗とチェンジマネジメント",
+        "コミュニケーション戦略の確立"
+    )
+})
+_DEFAULT_RECOMMENDATIONS: Tuple[str, ...] = (
+    "全カテゴリをバランスよく検討",
+    "プロジェクト固有のリスクを特定",
+    "ステークホルダー分析の実施"
+)
 
 
 class RBS:
@@ -142,80 +337,8 @@ class RBS:
 
     def __init__(self):
         self.analyses: Dict[str, RBSAnalysis] = {}
-        self.risk_templates = self._initialize_risk_templates()
-
-    def _initialize_risk_templates(self) -> Dict[RiskCategory, Dict[str, List[str]]]:
-        """リスクテンプレートの初期化"""
-        return {
-            RiskCategory.TECHNICAL: {
-                "技術要件": [
-                    "新技術の学習コスト",
-                    "技術仕様の変更",
-                    "技術的実現可能性の不確実性"
-                ],
-                "システム統合": [
-                    "既存システムとの互換性",
-                    "データ移行の複雑さ",
-                    "システム性能の問題"
-                ],
-                "品質保証": [
-                    "テスト不備による品質問題",
-                    "セキュリティ脆弱性",
-                    "スケーラビリティの問題"
-                ]
-            },
-            RiskCategory.EXTERNAL: {
-                "市場・競合": [
-                    "市場環境の変化",
-                    "競合他社の動向",
-                    "顧客ニーズの変化"
-                ],
-                "規制・法律": [
-                    "規制要件の変更",
-                    "法律改正の影響",
-                    "コンプライアンス違反"
-                ],
-                "外部依存": [
-                    "外部ベンダーの遅延",
-                    "サードパーティライブラリの問題",
-                    "外部サービスの停止"
-                ]
-            },
-            RiskCategory.ORGANIZATIONAL: {
-                "人的リソース": [
-                    "キーパーソンの離職",
-                    "スキル不足",
-                    "チーム間のコミュニケーション不足"
-                ],
-                "組織体制": [
-                    "組織変更の影響",
-                    "権限・責任の不明確",
-                    "意思決定の遅延"
-                ],
-                "企業文化": [
-                    "変革への抵抗",
-                    "優先度の競合",
-                    "リソース配分の問題"
-                ]
-            },
-            RiskCategory.PROJECT_MANAGEMENT: {
-                "スケジュール": [
-                    "工期の遅延",
-                    "依存関係の複雑化",
-                    "マイルストーンの未達成"
-                ],
-                "予算・コスト": [
-                    "予算超過",
-                    "隠れたコストの発生",
-                    "為替変動の影響"
-                ],
-                "スコープ・要件": [
-                    "要件の変更・追加",
-                    "スコープクリープ",
-                    "ステークホルダー要求の変化"
-                ]
-            }
-        }
+        # テンプレートは不変のモジュール定数を共有する
+        self.risk_templates = _RISK_TEMPLATES
 
     def create_structure(self, project_name: str, project_type: str, context: str = "") -> Dict[str, Any]:
         """RBS構造を作成"""
@@ -226,9 +349,9 @@ class RBS:
             "analysis_id": analysis.id,
             "project_name": project_name,
             "project_type": project_type,
-            "rbs_structure": self._build_structure_tree(),
+            "rbs_structure": _build_structure_tree(),
             "recommended_focus": self._get_project_type_recommendations(project_type),
-            "created_at": analysis.created_at.strftime('%Y-%m-%d %H:%M:%S')
+            "created_at": analysis.created_at_text
         }
 
         return {
@@ -237,51 +360,9 @@ class RBS:
             "data": structure
         }
 
-    def _build_structure_tree(self) -> Dict[str, Any]:
-        """RBS構造ツリーの構築"""
-        structure = {}
-        for category in RiskCategory:
-            subcategories = {}
-            for subcat, risks in self.risk_templates[category].items():
-                subcategories[subcat] = {
-                    "risk_examples": risks,
-                    "count": len(risks)
-                }
-            structure[category.value] = {
-                "subcategories": subcategories,
-                "total_examples": sum(len(risks) for risks in self.risk_templates[category].values())
-            }
-        return structure
-
     def _get_project_type_recommendations(self, project_type: str) -> List[str]:
         """プロジェクトタイプ別の推奨フォーカス領域"""
-        recommendations = {
-            "IT・システム開発": [
-                "技術的リスクを最優先で検討",
-                "システム統合とデータ移行に注意",
-                "セキュリティ要件の早期確認"
-            ],
-            "インフラ・建設": [
-                "外部環境要因（天候、規制）を重視",
-                "安全管理と品質保証を最優先",
-                "資材調達とサプライチェーン管理"
-            ],
-            "新商品開発": [
-                "市場・競合リスクを重点分析",
-                "技術的実現可能性の検証",
-                "知的財産と特許の考慮"
-            ],
-            "組織変革": [
-                "組織リスクを最重要視",
-                "変革への抵抗とチェンジマネジメント",
-                "コミュニケーション戦略の確立"
-            ]
-        }
-        return recommendations.get(project_type, [
-            "全カテゴリをバランスよく検討",
-            "プロジェクト固有のリスクを特定",
-            "ステークホルダー分析の実施"
-        ])
+        return list(_PROJECT_RECOMMENDATIONS.get(project_type, _DEFAULT_RECOMMENDATIONS))
 
     def identify_risks(self, analysis_id: str, category: str, subcategory: str,
                       custom_risks: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -295,33 +376,33 @@ class RBS:
         analysis = self.analyses[analysis_id]
         
         # カテゴリの検証
-        try:
-            risk_category = RiskCategory(category)
-        except ValueError:
+        risk_category = _CATEGORIES_BY_VALUE.get(category)
+        if risk_category is None:
             return {
                 "success": False,
                 "message": f"❌ 無効なリスクカテゴリ: {category}"
             }
 
-        # リスクの追加
-        added_risks = []
-        for risk_data in custom_risks:
-            try:
-                risk = RiskItem(
+        # 全リスクを生成できた場合のみまとめて追加する（途中で失敗しても分析は変更しない）
+        new_risks: List[RiskItem] = []
+        try:
+            for risk_data in custom_risks:
+                new_risks.append(RiskItem(
                     name=risk_data["name"],
                     description=risk_data["description"],
                     category=risk_category,
                     subcategory=subcategory,
                     probability=RiskProbability(risk_data.get("probability", 3)),
                     impact=RiskImpact(risk_data.get("impact", 3))
-                )
-                analysis.add_risk(risk)
-                added_risks.append(risk.to_dict())
-            except Exception as e:
-                return {
-                    "success": False,
-                    "message": f"❌ リスク追加エラー: {str(e)}"
-                }
+                ))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            return {
+                "success": False,
+                "message": f"❌ リスク追加エラー（{len(new_risks) + 1}件目）: {str(e)}"
+            }
+
+        analysis.add_risks(new_risks)
+        added_risks = [risk.to_dict() for risk in new_risks]
 
         return {
             "success": True,
@@ -355,7 +436,7 @@ class RBS:
         matrix = self._create_risk_matrix(analysis.risks)
         
         # 統計情報の計算
-        stats = self._calculate_risk_statistics(analysis.risks)
+        stats = self._calculate_risk_statistics(analysis)
         
         # 優先度別のグループ化
         priority_groups = self._group_risks_by_priority(analysis.risks)
@@ -369,89 +450,85 @@ class RBS:
                 "risk_matrix": matrix,
                 "statistics": stats,
                 "priority_groups": priority_groups,
-                "recommendations": self._generate_risk_recommendations(analysis.risks)
+                "recommendations": self._generate_risk_recommendations(analysis)
             }
         }
 
     def _create_risk_matrix(self, risks: List[RiskItem]) -> Dict[str, Any]:
         """リスクマトリックスの作成"""
-        matrix = {}
-        for prob in range(1, 6):
-            matrix[str(prob)] = {}
-            for impact in range(1, 6):
-                matrix[str(prob)][str(impact)] = []
-
+        # (発生確率, 影響度)ごとにリスクを1回の走査で振り分ける
+        cells: DefaultDict[Tuple[int, int], List[Dict[str, Any]]] = defaultdict(list)
         for risk in risks:
-            prob_key = str(risk.probability.value)
-            impact_key = str(risk.impact.value)
-            matrix[prob_key][impact_key].append({
+            cells[risk.probability, risk.impact].append({
                 "id": risk.id,
                 "name": risk.name,
                 "score": risk.risk_score
             })
 
-        return matrix
+        # 5×5の全セルを含む形で返す（リスクのないセルは空リスト）
+        return {
+            _LEVEL_KEYS[prob]: {
+                _LEVEL_KEYS[impact]: cells.get((prob, impact)) or []
+                for impact in _LEVELS
+            }
+            for prob in _LEVELS
+        }
 
-    def _calculate_risk_statistics(self, risks: List[RiskItem]) -> Dict[str, Any]:
+    def _calculate_risk_statistics(self, analysis: RBSAnalysis) -> Dict[str, Any]:
         """リスク統計の計算"""
+        risks = analysis.risks
         if not risks:
             return {}
 
-        scores = [risk.risk_score for risk in risks]
-        categories = {}
+        # 合計・最大・最小を1回の走査で集計（件数系は分析側で追加時に集計済み）
+        total_score = 0
+        max_score = 0
+        min_score = _MAX_RISK_SCORE
         for risk in risks:
-            cat = risk.category.value
-            if cat not in categories:
-                categories[cat] = 0
-            categories[cat] += 1
+            score = risk.risk_score
+            total_score += score
+            if score > max_score:
+                max_score = score
+            if score < min_score:
+                min_score = score
 
         return {
             "total_risks": len(risks),
-            "average_score": round(sum(scores) / len(scores), 2),
-            "max_score": max(scores),
-            "min_score": min(scores),
-            "high_priority_count": len([r for r in risks if r.risk_score >= 12]),
-            "category_distribution": categories
+            "average_score": round(total_score / len(risks), 2),
+            "max_score": max_score,
+            "min_score": min_score,
+            "high_priority_count": analysis.high_priority_count,
+            "category_distribution": dict(analysis.category_counts)
         }
 
     def _group_risks_by_priority(self, risks: List[RiskItem]) -> Dict[str, List[Dict[str, Any]]]:
         """優先度別リスクグループ化"""
-        groups = {
-            "最高優先": [],
-            "高優先": [],
-            "中優先": [],
-            "低優先": [],
-            "最低優先": []
-        }
+        groups: Dict[str, List[RiskItem]] = {label: [] for _, label in _PRIORITY_THRESHOLDS}
 
         for risk in risks:
-            priority = risk._get_priority_level()
-            groups[priority].append(risk.to_dict())
+            groups[risk._get_priority_level()].append(risk)
 
-        # 各グループを影響度とスコアでソート
-        for priority in groups:
-            groups[priority].sort(key=lambda x: (-x["risk_score"], -x["impact"]["value"]))
-
-        return groups
+        # 各グループをスコアと影響度でソートしてから辞書に変換
+        return {
+            priority: [
+                risk.to_dict()
+                for risk in sorted(group, key=lambda r: (-r.risk_score, -r.impact))
+            ]
+            for priority, group in groups.items()
+        }
 
-    def _generate_risk_recommendations(self, risks: List[RiskItem]) -> List[str]:
+    def _generate_risk_recommendations(self, analysis: RBSAnalysis) -> List[str]:
         """リスク対策推奨事項の生成"""
         recommendations = []
         
-        high_risks = [r for r in risks if r.risk_score >= 12]
-        if high_risks:
-            recommendations.append(f"🚨 {len(high_risks)}件の高優先度リスクに対する即座の対策が必要")
-            
-        category_counts = {}
-        for risk in risks:
-            cat = risk.category.value
-            category_counts[cat] = category_counts.get(cat, 0) + 1
+        if analysis.high_priority_count:
+            recommendations.append(f"🚨 {analysis.high_priority_count}件の高優先度リスクに対する即座の対策が必要")
             
-        max_category = max(category_counts, key=category_counts.get) if category_counts else None
-        if max_category:
+        if analysis.category_counts:
+            max_category, _ = analysis.category_counts.most_common(1)[0]
             recommendations.append(f"📊 {max_category}に集中したリスク対策を検討")
 
-        if len(risks) > 10:
+        if len(analysis.risks) > 10:
             recommendations.append("📋 リスク数が多いため、優先度に基づく段階的な対策を推奨")
         
         recommendations.extend([
@@ -477,7 +554,7 @@ class RBS:
             "data": {
                 **analysis.to_dict(),
                 "risks": [risk.to_dict() for risk in analysis.risks],
-                "risk_summary": self._calculate_risk_statistics(analysis.risks) if analysis.risks else {}
+                "risk_summary": self._calculate_risk_statistics(analysis)
             }
         }
 
@@ -490,9 +567,8 @@ class RBS:
                 "data": {"analyses": []}
             }
 
-        # 分析オブジェクトを作成日時でソート（新しい順）
-        sorted_analyses = sorted(self.analyses.values(), key=lambda x: x.created_at, reverse=True)
-        analyses_list = [analysis.to_dict() for analysis in sorted_analyses]
+        # 分析は作成時にのみ登録されるため、登録順の逆がそのまま新しい順になる
+        analyses_list = [analysis.to_dict() for analysis in reversed(self.analyses.values())]
 
         return {
             "success": True,
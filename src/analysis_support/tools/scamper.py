@@ -1,6 +1,8 @@
 """SCAMPER法ツール実装."""
 
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -17,9 +19,28 @@ class SCAMPERTechnique(Enum):
     REVERSE = "Reverse"
 
 
+# MCPツールのスキーマで受け付ける技法名（英語・日本語）
+TECHNIQUE_NAMES: List[str] = [
+    "substitute", "combine", "adapt", "modify", "put_to_other_use", "eliminate", "reverse",
+    "代替", "結合", "応用", "変更", "転用", "除去", "逆転"
+]
+
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _format_timestamp_ns(timestamp_ns: int) -> str:
+    """ナノ秒のUNIX時刻を表示用の文字列に変換する."""
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime(timestamp_ns / 1e9))
+
+
 class SCAMPERIdea:
     """SCAMPERアイデアクラス."""
     
+    __slots__ = (
+        "id", "technique", "idea", "explanation", "feasibility_score", "impact_score", "created_at_ns"
+    )
+    
     def __init__(
         self, 
         idea_id: str, 
@@ -33,22 +54,218 @@ class SCAMPERIdea:
         self.explanation = explanation
         self.feasibility_score: Optional[int] = None
         self.impact_score: Optional[int] = None
-        self.created_at = datetime.now()
+        self.created_at_ns = time.time_ns()
+    
+    @property
+    def created_at(self) -> datetime:
+        """作成日時."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
 
 
 class SCAMPERSession:
     """SCAMPERセッションクラス."""
     
+    __slots__ = (
+        "id", "topic", "current_situation", "context", "ideas",
+        "active_technique", "session_notes", "created_at_ns", "updated_at_ns", "_created_at_text",
+        "ideas_by_text", "ideas_by_id",
+        "_count_by_tech", "_eval_count_by_tech", "_feas_sum_by_tech", "_impact_sum_by_tech"
+    )
+    
     def __init__(self, session_id: str, topic: str, current_situation: str, context: str = ""):
         self.id = session_id
         self.topic = topic
         self.current_situation = current_situation
         self.context = context
         self.ideas: List[SCAMPERIdea] = []
+        # 評価時の検索用索引（同じ文面のアイデアは最初に記録したものを対象とする）
+        self.ideas_by_text: Dict[str, SCAMPERIdea] = {}
+        self.ideas_by_id: Dict[str, SCAMPERIdea] = {}
+        # 技法別の件数・評価件数・スコア合計（追加・評価時に更新し、統計のたびに全件を走査しない）
+        self._count_by_tech: Dict[SCAMPERTechnique, int] = dict.fromkeys(SCAMPERTechnique, 0)
+        self._eval_count_by_tech: Dict[SCAMPERTechnique, int] = dict.fromkeys(SCAMPERTechnique, 0)
+        self._feas_sum_by_tech: Dict[SCAMPERTechnique, int] = dict.fromkeys(SCAMPERTechnique, 0)
+        self._impact_sum_by_tech: Dict[SCAMPERTechnique, int] = dict.fromkeys(SCAMPERTechnique, 0)
         self.active_technique: Optional[SCAMPERTechnique] = None
         self.session_notes: List[str] = []
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # 時刻は整数で保持し、文字列化は表示するときまで遅らせる
+        self.created_at_ns = time.time_ns()
+        self.updated_at_ns = self.created_at_ns
+        self._created_at_text: Optional[str] = None
+    
+    def touch(self) -> None:
+        """更新日時を現在時刻にする."""
+        self.updated_at_ns = time.time_ns()
+    
+    @property
+    def created_at(self) -> datetime:
+        """作成日時."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+    
+    @property
+    def updated_at(self) -> datetime:
+        """更新日時."""
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9)
+    
+    @property
+    def created_at_text(self) -> str:
+        """表示用の作成日時（作成日時は変わらないため初回の結果を再利用する）."""
+        if self._created_at_text is None:
+            self._created_at_text = _format_timestamp_ns(self.created_at_ns)
+        return self._created_at_text
+    
+    @property
+    def updated_at_text(self) -> str:
+        """表示用の更新日時."""
+        return _format_timestamp_ns(self.updated_at_ns)
+
+    def add_idea(self, idea: SCAMPERIdea) -> None:
+        """アイデアを追加し、検索用索引を更新する."""
+        self.ideas.append(idea)
+        self.ideas_by_text.setdefault(idea.idea, idea)
+        self.ideas_by_id[idea.id] = idea
+        self._count_by_tech[idea.technique] += 1
+
+    def evaluate_idea(self, idea: SCAMPERIdea, feasibility: int, impact: int) -> None:
+        """アイデアに評価を設定し、技法別の集計を更新する（再評価時は前回の評価を置き換える）."""
+        technique = idea.technique
+        if idea.feasibility_score is None:
+            self._eval_count_by_tech[technique] += 1
+        else:
+            self._feas_sum_by_tech[technique] -= idea.feasibility_score
+            self._impact_sum_by_tech[technique] -= idea.impact_score or 0
+        idea.feasibility_score = feasibility
+        idea.impact_score = impact
+        self._feas_sum_by_tech[technique] += feasibility
+        self._impact_sum_by_tech[technique] += impact
+
+    def technique_counts(self) -> Dict[SCAMPERTechnique, int]:
+        """アイデアが記録された技法ごとの件数."""
+        return {technique: count for technique, count in self._count_by_tech.items() if count}
+
+    def technique_stats(self) -> Dict[str, Dict[str, Any]]:
+        """技法別の件数・評価件数・平均スコアを追加・評価時の集計から返す."""
+        technique_stats: Dict[str, Dict[str, Any]] = {}
+        
+        for technique in SCAMPERTechnique:
+            evaluated = self._eval_count_by_tech[technique]
+            stats: Dict[str, Any] = {
+                "total_ideas": self._count_by_tech[technique],
+                "evaluated_ideas": evaluated
+            }
+            
+            if evaluated:
+                stats["avg_feasibility"] = self._feas_sum_by_tech[technique] / evaluated
+                stats["avg_impact"] = self._impact_sum_by_tech[technique] / evaluated
+                stats["avg_total_score"] = stats["avg_feasibility"] + stats["avg_impact"]
+            else:
+                stats["avg_feasibility"] = 0
+                stats["avg_impact"] = 0
+                stats["avg_total_score"] = 0
+            
+            technique_stats[technique.value] = stats
+        
+        return technique_stats
+
+
+# 技法ガイド（全インスタンスで共有する読み取り専用データ。応答には _guide_copy でコピーを渡す）
+_TECHNIQUE_GUIDES: Mapping[SCAMPERTechnique, Mapping[str, Any]] = MappingProxyType({
+    SCAMPERTechnique.SUBSTITUTE: MappingProxyType({
+        "name_jp": "代替",
+        "description": "何かを別のものに置き換える",
+        "guide_questions": (
+            "何を他のものと置き換えられますか？",
+            "どの材料や要素を代替できますか？",
+            "他の場所や時間に置き換えられますか？"
+        )
+    }),
+    SCAMPERTechnique.COMBINE: MappingProxyType({
+        "name_jp": "結合",
+        "description": "異なる要素を組み合わせる",
+        "guide_questions": (
+            "どの要素を組み合わせられますか？",
+            "どのプロセスを統合できますか？",
+            "どの機能を一つにまとめられますか？"
+        )
+    }),
+    SCAMPERTechnique.ADAPT: MappingProxyType({
+        "name_jp": "応用",
+        "description": "他のアイデアを適用する",
+        "guide_questions": (
+            "他の分野で似たような問題はどう解決されていますか？",
+            "自然界から学べることはありますか？",
+            "過去の成功例を参考にできますか？"
+        )
+    }),
+    SCAMPERTechnique.MODIFY: MappingProxyType({
+        "name_jp": "変更",
+        "description": "形や属性を変更する",
+        "guide_questions": (
+            "何を拡大または縮小できますか？",
+            "何を強調または弱化できますか？",
+            "形や色を変えられますか？"
+        )
+    }),
+    SCAMPERTechnique.PUT_TO_OTHER_USE: MappingProxyType({
+        "name_jp": "転用",
+        "description": "他の用途に転用する",
+        "guide_questions": (
+            "他にどんな用途がありますか？",
+            "副産物を活用できますか？",
+            "別の市場で使えますか？"
+        )
+    }),
+    SCAMPERTechnique.ELIMINATE: MappingProxyType({
+        "name_jp": "除去",
+        "description": "不要な部分を除去する",
+        "guide_questions": (
+            "何を削除または除去できますか？",
+            "どの機能を簡素化できますか？",
+            "どの手順を省略できますか？"
+        )
+    }),
+    SCAMPERTechnique.REVERSE: MappingProxyType({
+        "name_jp": "逆転",
+        "description": "順序や役割を逆転する",
+        "guide_questions": (
+            "順序を逆にできますか？",
+            "役割を交換できますか？",
+            "逆の視点から考えるとどうですか？"
+        )
+    })
+})
+
+
+def _guide_copy(technique: SCAMPERTechnique) -> Dict[str, Any]:
+    """応答用に技法ガイドのコピーを作成する."""
+    guide = _TECHNIQUE_GUIDES[technique]
+    return {
+        "name_jp": guide["name_jp"],
+        "description": guide["description"],
+        "guide_questions": list(guide["guide_questions"])
+    }
+
+
+def _build_technique_mapping() -> Dict[str, SCAMPERTechnique]:
+    """受け付ける技法名（英語名・小文字・アンダースコア区切り・日本語名）から技法へのマッピングを作成する."""
+    mapping = {}
+    for technique in SCAMPERTechnique:
+        # 英語名（完全一致とlower case）
+        mapping[technique.value.lower()] = technique
+        mapping[technique.value] = technique
+        
+        # アンダースコア区切りのバリエーション
+        underscore_version = technique.value.lower().replace(" ", "_")
+        mapping[underscore_version] = technique
+        
+        # 日本語名
+        mapping[_TECHNIQUE_GUIDES[technique]["name_jp"]] = technique
+    
+    return mapping
+
+
+# 技法名のマッピング（インポート時に一度だけ構築する）
+_TECHNIQUE_MAPPING: Dict[str, SCAMPERTechnique] = _build_technique_mapping()
 
 
 class SCAMPER:
@@ -57,8 +274,8 @@ class SCAMPER:
     def __init__(self) -> None:
         """SCAMPER法マネージャーを初期化."""
         self._sessions: Dict[str, SCAMPERSession] = {}
-        self._technique_guides = self._initialize_technique_guides()
-        self._technique_mapping = self._initialize_technique_mapping()
+        self._technique_guides = _TECHNIQUE_GUIDES
+        self._technique_mapping = _TECHNIQUE_MAPPING
     
     def start_session(
         self, 
@@ -139,7 +356,7 @@ class SCAMPER:
         
         session = self._sessions[session_id]
         session.active_technique = normalized_technique
-        session.updated_at = datetime.now()
+        session.touch()
         
         # アイデアを記録
         if explanations is None:
@@ -150,7 +367,7 @@ class SCAMPER:
             idea_id = str(uuid.uuid4())
             explanation = explanations[i] if i < len(explanations) else ""
             scamper_idea = SCAMPERIdea(idea_id, normalized_technique, idea, explanation)
-            session.ideas.append(scamper_idea)
+            session.add_idea(scamper_idea)
             added_ideas.append({
                 "id": idea_id,
                 "idea": idea,
@@ -166,7 +383,7 @@ class SCAMPER:
             "message": f"✅ {normalized_technique.value}技法で{len(ideas)}個のアイデアを記録しました",
             "technique": normalized_technique.value,
             "added_ideas": added_ideas,
-            "technique_guide": self._technique_guides[normalized_technique],
+            "technique_guide": _guide_copy(normalized_technique),
             "session_stats": self._get_session_stats(session)
         }
     
@@ -180,10 +397,10 @@ class SCAMPER:
         
         Args:
             session_id: SCAMPERセッションのID
-            idea_evaluations: アイデア評価のリスト
+            idea_evaluations: アイデア評価のリスト（対象はアイデアID "id" または文面 "idea" で指定）
             
         Returns:
-            評価結果、ランキング、技法別統計
+            評価結果、ランキング、技法別統計（対象が見つからない評価は unmatched_evaluations として返し、success は False）
         """
         if session_id not in self._sessions:
             return {
@@ -195,24 +412,30 @@ class SCAMPER:
         
         # アイデアに評価を適用
         evaluated_ideas = []
+        unmatched_evaluations = []
         for evaluation in idea_evaluations:
-            idea_text = evaluation["idea"]
             feasibility = evaluation["feasibility"]
             impact = evaluation["impact"]
             
-            # 該当するアイデアを検索
-            for idea in session.ideas:
-                if idea.idea == idea_text:
-                    idea.feasibility_score = feasibility
-                    idea.impact_score = impact
-                    evaluated_ideas.append({
-                        "idea": idea.idea,
-                        "technique": idea.technique.value,
-                        "feasibility": feasibility,
-                        "impact": impact,
-                        "total_score": feasibility + impact
-                    })
-                    break
+            # 該当するアイデアを検索（IDの指定があればIDを優先）
+            idea_id = evaluation.get("id")
+            if idea_id is not None:
+                matched = session.ideas_by_id.get(idea_id)
+            else:
+                matched = session.ideas_by_text.get(evaluation.get("idea", ""))
+            if matched is None:
+                unmatched_evaluations.append(evaluation)
+                continue
+            
+            session.evaluate_idea(matched, feasibility, impact)
+            evaluated_ideas.append({
+                "id": matched.id,
+                "idea": matched.idea,
+                "technique": matched.technique.value,
+                "feasibility": feasibility,
+                "impact": impact,
+                "total_score": feasibility + impact
+            })
         
         # ランキング作成（合計スコア順）
         evaluated_ideas.sort(key=lambda x: x["total_score"], reverse=True)
@@ -220,13 +443,18 @@ class SCAMPER:
         # 技法別統計
         technique_stats = self._calculate_technique_stats(session)
         
-        session.updated_at = datetime.now()
+        session.touch()
         session.session_notes.append(f"{len(evaluated_ideas)}個のアイデアを評価")
         
+        message = f"📊 {len(evaluated_ideas)}個のアイデアを評価しました"
+        if unmatched_evaluations:
+            message = f"❌ {len(unmatched_evaluations)}件の評価対象のアイデアが見つかりません（{len(evaluated_ideas)}個は評価済み）"
+        
         return {
-            "success": True,
-            "message": f"📊 {len(evaluated_ideas)}個のアイデアを評価しました",
+            "success": not unmatched_evaluations,
+            "message": message,
             "evaluation_results": evaluated_ideas,
+            "unmatched_evaluations": unmatched_evaluations,
             "top_ideas": evaluated_ideas[:5],
             "technique_statistics": technique_stats,
             "evaluation_summary": {
@@ -254,8 +482,8 @@ class SCAMPER:
         
         session = self._sessions[session_id]
         
-        # 最新アイデア（最新5件）
-        recent_ideas = sorted(session.ideas, key=lambda x: x.created_at, reverse=True)[:5]
+        # 最新アイデア（最新5件）。アイデアは SCAMPERSession.add_idea で記録順に末尾へ追加されるため末尾を逆順に取る
+        recent_ideas = session.ideas[-5:][::-1]
         recent_ideas_data = [
             {
                 "idea": idea.idea,
@@ -276,8 +504,8 @@ class SCAMPER:
             "technique_statistics": self._calculate_technique_stats(session),
             "recent_ideas": recent_ideas_data,
             "session_notes": session.session_notes,
-            "created_at": session.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            "updated_at": session.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+            "created_at": session.created_at_text,
+            "updated_at": session.updated_at_text
         }
     
     def list_sessions(self) -> Dict[str, Any]:
@@ -287,26 +515,32 @@ class SCAMPER:
         Returns:
             セッション一覧（ID、トピック、アイデア数、日時）
         """
+        if not self._sessions:
+            return {
+                "success": True,
+                "message": "💡 SCAMPERセッション一覧（0件）",
+                "sessions": []
+            }
+        
         sessions_list = []
         
-        for session_id, session in self._sessions.items():
+        # 更新日時の降順
+        sessions = sorted(self._sessions.values(), key=lambda x: x.updated_at_ns, reverse=True)
+        for session in sessions:
             # トピックを30文字で切り詰め
             topic_summary = session.topic
             if len(topic_summary) > 30:
                 topic_summary = topic_summary[:27] + "..."
             
             sessions_list.append({
-                "id": session_id,
+                "id": session.id,
                 "topic": topic_summary,
                 "total_ideas": len(session.ideas),
-                "techniques_used": len(set(idea.technique for idea in session.ideas)),
-                "created_at": session.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                "updated_at": session.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+                "techniques_used": len(session.technique_counts()),
+                "created_at": session.created_at_text,
+                "updated_at": session.updated_at_text
             })
         
-        # 更新日時の降順でソート
-        sessions_list.sort(key=lambda x: str(x["updated_at"]), reverse=True)
-        
         return {
             "success": True,
             "message": f"💡 SCAMPERセッション一覧（{len(sessions_list)}件）",
@@ -337,7 +571,7 @@ class SCAMPER:
         # 各技法のガイド質問を提供
         technique_prompts = {}
         for technique in SCAMPERTechnique:
-            technique_prompts[technique.value] = self._technique_guides[technique]
+            technique_prompts[technique.value] = _guide_copy(technique)
         
         return {
             "success": True,
@@ -355,103 +589,17 @@ class SCAMPER:
             "next_steps": "apply_technique を使って、各技法ごとにアイデアを記録してください"
         }
     
-    def _initialize_technique_guides(self) -> Dict[SCAMPERTechnique, Dict[str, Any]]:
-        """技法ガイドを初期化する."""
-        return {
-            SCAMPERTechnique.SUBSTITUTE: {
-                "name_jp": "代替",
-                "description": "何かを別のものに置き換える",
-                "guide_questions": [
-                    "何を他のものと置き換えられますか？",
-                    "どの材料や要素を代替できますか？",
-                    "他の場所や時間に置き換えられますか？"
-                ]
-            },
-            SCAMPERTechnique.COMBINE: {
-                "name_jp": "結合",
-                "description": "異なる要素を組み合わせる",
-                "guide_questions": [
-                    "どの要素を組み合わせられますか？",
-                    "どのプロセスを統合できますか？",
-                    "どの機能を一つにまとめられますか？"
-                ]
-            },
-            SCAMPERTechnique.ADAPT: {
-                "name_jp": "応用",
-                "description": "他のアイデアを適用する",
-                "guide_questions": [
-                    "他の分野で似たような問題はどう解決されていますか？",
-                    "自然界から学べることはありますか？",
-                    "過去の成功例を参考にできますか？"
-                ]
-            },
-            SCAMPERTechnique.MODIFY: {
-                "name_jp": "変更",
-                "description": "形や属性を変更する",
-                "guide_questions": [
-                    "何を拡大または縮小できますか？",
-                    "何を強調または弱化できますか？",
-                    "形や色を変えられますか？"
-                ]
-            },
-            SCAMPERTechnique.PUT_TO_OTHER_USE: {
-                "name_jp": "転用",
-                "description": "他の用途に転用する",
-                "guide_questions": [
-                    "他にどんな用途がありますか？",
-                    "副産物を活用できますか？",
-                    "別の市場で使えますか？"
-                ]
-            },
-            SCAMPERTechnique.ELIMINATE: {
-                "name_jp": "除去",
-                "description": "不要な部分を除去する",
-                "guide_questions": [
-                    "何を削除または除去できますか？",
-                    "どの機能を簡素化できますか？",
-                    "どの手順を省略できますか？"
-                ]
-            },
-            SCAMPERTechnique.REVERSE: {
-                "name_jp": "逆転",
-                "description": "順序や役割を逆転する",
-                "guide_questions": [
-                    "順序を逆にできますか？",
-                    "役割を交換できますか？",
-                    "逆の視点から考えるとどうですか？"
-                ]
-            }
-        }
-    
-    def _initialize_technique_mapping(self) -> Dict[str, SCAMPERTechnique]:
-        """技法名のマッピングを初期化する."""
-        mapping = {}
-        for technique in SCAMPERTechnique:
-            # 英語名（完全一致とlower case）
-            mapping[technique.value.lower()] = technique
-            mapping[technique.value] = technique
-            
-            # アンダースコア区切りのバリエーション
-            underscore_version = technique.value.lower().replace(" ", "_")
-            mapping[underscore_version] = technique
-            
-            # 日本語名
-            guide = self._technique_guides[technique]
-            mapping[guide["name_jp"]] = technique
-        
-        return mapping
-    
     def _normalize_technique(self, technique: str) -> Optional[SCAMPERTechnique]:
-        """技法名を正規化する."""
-        technique_lower = technique.lower()
-        return self._technique_mapping.get(technique_lower) or self._technique_mapping.get(technique)
+        """技法名を正規化する（表記どおりの名前は1回の検索で解決する）."""
+        if not technique:
+            return None
+        return self._technique_mapping.get(technique) or self._technique_mapping.get(technique.lower())
     
     def _get_session_stats(self, session: SCAMPERSession) -> Dict[str, Any]:
         """セッション統計を取得する."""
-        technique_counts: Dict[str, int] = {}
-        for idea in session.ideas:
-            technique_name = idea.technique.value
-            technique_counts[technique_name] = technique_counts.get(technique_name, 0) + 1
+        technique_counts = {
+            technique.value: count for technique, count in session.technique_counts().items()
+        }
         
         return {
             "total_ideas": len(session.ideas),
@@ -461,29 +609,4 @@ class SCAMPER:
     
     def _calculate_technique_stats(self, session: SCAMPERSession) -> Dict[str, Any]:
         """技法別統計を計算する."""
-        technique_stats: Dict[str, Dict[str, Any]] = {}
-        
-        for technique in SCAMPERTechnique:
-            ideas = [idea for idea in session.ideas if idea.technique == technique]
-            
-            evaluated_ideas = [idea for idea in ideas if idea.feasibility_score is not None]
-            
-            stats: Dict[str, Any] = {
-                "total_ideas": len(ideas),
-                "evaluated_ideas": len(evaluated_ideas)
-            }
-            
-            if evaluated_ideas:
-                feasibility_scores = [idea.feasibility_score for idea in evaluated_ideas if idea.feasibility_score is not None]
-                impact_scores = [idea.impact_score for idea in evaluated_ideas if idea.impact_score is not None]
-                stats["avg_feasibility"] = sum(feasibility_scores) / len(feasibility_scores) if feasibility_scores else 0
-                stats["avg_impact"] = sum(impact_scores) / len(impact_scores) if impact_scores else 0
-                stats["avg_total_score"] = stats["avg_feasibility"] + stats["avg_impact"]
-            else:
-                stats["avg_feasibility"] = 0
-                stats["avg_impact"] = 0
-                stats["avg_total_score"] = 0
-            
-            technique_stats[technique.value] = stats
-        
-        return technique_stats
\ No newline at end of file
+        return session.technique_stats()
@@ -190,6 +190,13 @@ class WhyAnalysis:
         Returns:
             分析一覧（ID、問題概要、進捗、作成日）
         """
+        if not self._analyses:
+            return {
+                "success": True,
+                "message": "📋 5Why分析一覧（0件）",
+                "analyses": []
+            }
+        
         analyses_list = []
         
         for analysis_id, analysis in self._analyses.items():
@@ -2,7 +2,7 @@
 
 import pytest
 
-from analysis_support.tools.mece import MECE, MECEViolationType
+from analysis_support.tools.mece import MECE, MECEViolationType, MAX_OVERLAPS, _category_explanations
 
 
 class TestMECE:
@@ -145,6 +145,17 @@ class TestMECE:
         result = self.analyzer.create_mece_structure("一般的な課題", "auto")
         assert result["framework"] == "内外"
     
+    def test_create_structure_results_are_independent(self) -> None:
+        """返された構造を変更しても以降の結果に影響しないことのテスト."""
+        first = self.analyzer.create_mece_structure("独立性確認", "3C")
+        expected = self.analyzer.create_mece_structure("独立性確認", "3C")
+        
+        first["structure"]["categories"].append("追加カテゴリ")
+        first["structure"]["explanations"].clear()
+        first["usage_tips"].clear()
+        
+        assert self.analyzer.create_mece_structure("独立性確認", "3C") == expected
+    
     def test_create_structure_invalid_framework(self) -> None:
         """無効なフレームワークでの構造提案テスト."""
         result = self.analyzer.create_mece_structure("テスト", "invalid_framework")
@@ -160,6 +171,43 @@ class TestMECE:
         # 何らかの重複が検出されることを確認
         assert isinstance(overlaps, list)
     
+    def test_overlap_detection_merges_shared_keywords(self) -> None:
+        """複数の共通キーワードを持つペアが1件にまとめられることのテスト."""
+        categories = ["online customer support", "offline customer support", "product design"]
+        overlaps = self.analyzer._find_overlaps(categories)
+        
+        assert overlaps == [(
+            "online customer support",
+            "offline customer support",
+            "共通キーワード「customer」「support」を含む"
+        )]
+    
+    def test_overlap_detection_deduplicates_repeated_categories(self) -> None:
+        """同名カテゴリが繰り返されても同じペアを重複して報告しないテスト."""
+        categories = ["sales team", "sales team", "sales office"]
+        overlaps = self.analyzer._find_overlaps(categories)
+        
+        assert [(a, b) for a, b, _ in overlaps] == [
+            ("sales team", "sales team"),
+            ("sales team", "sales office")
+        ]
+    
+    def test_overlap_detection_is_case_insensitive(self) -> None:
+        """大文字・小文字や字形の違いを無視して重複を検出するテスト."""
+        overlaps = self.analyzer._find_overlaps(["Straße Team", "STRASSE office"])
+        
+        assert overlaps == [("Straße Team", "STRASSE office", "共通キーワード「strasse」を含む")]
+    
+    def test_overlap_detection_stops_at_limit(self) -> None:
+        """重複ペアの検出が上限件数で打ち切られることのテスト."""
+        categories = [f"shared keyword {i}" for i in range(20)]  # 190ペアすべてが重複
+        
+        assert len(self.analyzer._find_overlaps(categories)) == MAX_OVERLAPS
+        assert len(self.analyzer._find_overlaps(categories, max_overlaps=3)) == 3
+        
+        result = self.analyzer.analyze_categories("上限確認", categories)
+        assert any(f"{MAX_OVERLAPS}件以上" in note for note in result["analysis_notes"])
+    
     def test_gap_detection_logic(self) -> None:
         """漏れ検出ロジックのテスト."""
         topic = "ビジネス分析"
@@ -169,13 +217,20 @@ class TestMECE:
         assert isinstance(gaps, list)
         # ビジネス関連トピックなので何らかのギャップが検出される可能性が高い
     
+    def test_gap_detection_skipped_for_non_business_topic(self) -> None:
+        """ビジネス関連でないトピックでは漏れを検出しないことのテスト."""
+        assert self.analyzer._find_gaps("趣味の整理", ["読書", "運動"]) == []
+        assert self.analyzer._find_gaps("業務改善", ["読書", "運動"]) == [
+            "時間の観点", "場所の観点", "人の観点", "方法の観点", "理由の観点", "コストの観点"
+        ]
+    
     def test_category_explanations_generation(self) -> None:
         """カテゴリ説明生成のテスト."""
         topic = "デジタル戦略"
         framework = "4P"
         categories = self.analyzer._frameworks[framework]
         
-        explanations = self.analyzer._generate_category_explanations(topic, framework, categories)
+        explanations = _category_explanations(topic, framework)
         
         assert len(explanations) == len(categories)
         for category in categories:
@@ -245,4 +300,21 @@ class TestMECE:
         assert "usage_tips" in result
         tips = result["usage_tips"]
         assert len(tips) > 0
-        assert all(isinstance(tip, str) for tip in tips)
\ No newline at end of file
+        assert all(isinstance(tip, str) for tip in tips)
+    
+    def test_analysis_classes_use_slots(self) -> None:
+        """分析結果クラスが__slots__を使用していることのテスト."""
+        from analysis_support.tools.mece import MECEAnalysis, MECECategory
+        
+        for instance in (MECEAnalysis("test_id", "トピック", ["A"]), MECECategory("A")):
+            assert not hasattr(instance, "__dict__")
+    
+    def test_analysis_created_at(self) -> None:
+        """作成日時が参照時に日時として得られることのテスト."""
+        from datetime import datetime
+        from analysis_support.tools.mece import MECEAnalysis
+        
+        before = datetime.now()
+        analysis = MECEAnalysis("test_id", "トピック", ["A"])
+        
+        assert before <= analysis.created_at <= datetime.now()
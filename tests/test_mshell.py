@@ -211,6 +211,16 @@ class TestMShell:
         assert "element_scores" in evaluation
         assert "average_interface_score" in evaluation
 
+    def test_recommendations_list_missing_elements_in_order(self):
+        """未分析要素が定義順に推奨事項へ列挙されることのテスト"""
+        analysis_id = self.mshell.create_analysis("未分析テスト", "推奨確認")["data"]["analysis_id"]
+        self.mshell.analyze_element(analysis_id, "Software", ["問題"], 2)
+        self.mshell.analyze_element(analysis_id, "Environment", ["問題"], 2)
+
+        recommendations = self.mshell.evaluate_system(analysis_id)["data"]["recommendations"]
+
+        assert "📋 未分析要素（Machine, Hardware, Liveware-Central, Liveware-Other）の分析を推奨" in recommendations
+
     def test_evaluate_system_no_data(self):
         """データなしでのシステム評価テスト"""
         create_result = self.mshell.create_analysis("テストシステム", "テスト目的")
@@ -275,6 +285,50 @@ class TestMShell:
         assert len(result["data"]["interface_analyses"]) == 1
         assert "analysis_summary" in result["data"]
 
+    def test_get_analysis_summary_totals(self):
+        """分析サマリーの集計値のテスト"""
+        analysis_id = self.mshell.create_analysis("集計テスト", "データ確認")["data"]["analysis_id"]
+        self.mshell.analyze_element(analysis_id, "Machine", ["問題1", "問題2"], 2, ["改善案"])
+        self.mshell.analyze_element(analysis_id, "Software", ["問題3"], 4, ["改善案1", "改善案2"])
+        self.mshell.analyze_interface(analysis_id, "Machine", "Software", ["連携問題"], 7)
+        self.mshell.analyze_interface(analysis_id, "Machine", "Hardware", ["配置問題"], 4)
+
+        summary = self.mshell.get_analysis(analysis_id)["data"]["analysis_summary"]
+
+        assert summary["completion_rate"] == "2/6要素"
+        assert summary["total_findings"] == 3
+        assert summary["total_recommendations"] == 3
+        assert summary["severity_distribution"] == {"軽微": 0, "中程度": 1, "重要": 0, "致命的": 1}
+        assert summary["interface_quality_avg"] == 5.5
+
+    def test_get_analysis_without_details(self):
+        """個別結果を省略した分析取得のテスト"""
+        analysis_id = self.mshell.create_analysis("概要テスト", "データ確認")["data"]["analysis_id"]
+        self.mshell.analyze_element(analysis_id, "Machine", ["問題"], 4)
+        self.mshell.analyze_interface(analysis_id, "Machine", "Software", ["連携問題"], 3)
+
+        result = self.mshell.get_analysis(analysis_id, include_details=False)
+
+        assert result["success"] is True
+        data = result["data"]
+        assert "element_analyses" not in data
+        assert "interface_analyses" not in data
+        assert data["element_count"] == 1
+        assert data["interface_count"] == 1
+        assert data["critical_issues"] == 1
+        assert data["analysis_summary"]["total_findings"] == 1
+
+    def test_oldest_analysis_evicted_over_limit(self):
+        """保持上限を超えると最も古い分析が破棄されることのテスト"""
+        mshell = MShell(max_analyses=2)
+        first = mshell.create_analysis("システム1", "目的1")["data"]["analysis_id"]
+        second = mshell.create_analysis("システム2", "目的2")["data"]["analysis_id"]
+        third = mshell.create_analysis("システム3", "目的3")["data"]["analysis_id"]
+
+        assert list(mshell.analyses) == [second, third]
+        assert mshell.get_analysis(first)["success"] is False
+        assert mshell.list_analyses()["data"]["total_count"] == 2
+
     def test_get_analysis_invalid_id(self):
         """無効なID指定での分析取得テスト"""
         result = self.mshell.get_analysis("invalid_id")
@@ -395,6 +449,84 @@ class TestMShell:
         assert len(interface_problems) == 1
         assert interface_problems[0].interaction_quality == 3
 
+    def test_analysis_classes_use_slots(self):
+        """分析結果クラスが__slots__を使用していることのテスト"""
+        instances = (
+            ElementAnalysis(MShellElement.MACHINE, ["問題"]),
+            InterfaceAnalysis(MShellElement.MACHINE, MShellElement.SOFTWARE, ["問題"]),
+            MShellAnalysis("テスト", "確認")
+        )
+
+        for instance in instances:
+            assert not hasattr(instance, "__dict__")
+
+    def test_timestamps_available_as_datetime(self):
+        """日時が参照時にdatetimeとして得られ、表示用文字列と一致することのテスト"""
+        from datetime import datetime
+
+        before = datetime.now().replace(microsecond=0)
+        analysis = MShellAnalysis("テスト", "確認")
+        element = ElementAnalysis(MShellElement.MACHINE, ["問題"])
+        analysis.add_element_analysis(element)
+
+        for moment, text in (
+            (analysis.created_at, analysis.created_at_text),
+            (analysis.updated_at, analysis.updated_at_text),
+            (element.analyzed_at, element.analyzed_at_text)
+        ):
+            assert before <= moment <= datetime.now()
+            assert moment.strftime('%Y-%m-%d %H:%M:%S') == text
+        assert analysis.created_at <= analysis.updated_at
+
+    def test_issue_counts_follow_replaced_elements(self):
+        """要素分析の上書き時に問題件数が正しく更新されることのテスト"""
+        analysis = MShellAnalysis("件数テスト", "機能確認")
+
+        analysis.add_element_analysis(ElementAnalysis(MShellElement.MACHINE, ["問題"], AnalysisSeverity.CRITICAL))
+        analysis.add_element_analysis(ElementAnalysis(MShellElement.SOFTWARE, ["問題"], AnalysisSeverity.CRITICAL))
+        assert analysis.critical_count == 2
+
+        # 同じ要素を再分析すると前回の結果は置き換わる
+        analysis.add_element_analysis(ElementAnalysis(MShellElement.MACHINE, ["解消"], AnalysisSeverity.LOW))
+        assert analysis.critical_count == len(analysis.get_critical_issues()) == 1
+
+        analysis.add_interface_analysis(InterfaceAnalysis(MShellElement.MACHINE, MShellElement.SOFTWARE, ["問題"], 5))
+        analysis.add_interface_analysis(InterfaceAnalysis(MShellElement.MACHINE, MShellElement.HARDWARE, [], 6))
+        assert analysis.interface_problem_count == len(analysis.get_interface_problems()) == 1
+
+        data = analysis.to_dict()
+        assert data["critical_issues"] == 1
+        assert data["interface_problems"] == 1
+
+    def test_available_checkpoints_are_independent_copies(self):
+        """返されたチェックポイントを変更しても他の分析やテンプレートに影響しないことのテスト"""
+        analysis_id = self.mshell.create_analysis("テスト", "確認")["data"]["analysis_id"]
+        result = self.mshell.analyze_element(analysis_id, "Machine", ["問題"])
+        checkpoints = result["data"]["available_checkpoints"]
+        assert "設計・機能" in checkpoints
+        expected = {category: list(items) for category, items in checkpoints.items()}
+
+        checkpoints["追加カテゴリ"] = ["追加"]
+        checkpoints["設計・機能"].append("追加")
+
+        other = MShell()
+        other_id = other.create_analysis("別テスト", "確認")["data"]["analysis_id"]
+        other_checkpoints = other.analyze_element(other_id, "Machine", ["問題"])["data"]["available_checkpoints"]
+        assert other_checkpoints == expected
+        assert "追加カテゴリ" not in other.analysis_templates[MShellElement.MACHINE]
+
+    def test_element_descriptions_are_independent_copies(self):
+        """返された要素の説明を変更しても以降の分析に影響しないことのテスト"""
+        descriptions = self.mshell.create_analysis("テスト", "確認")["data"]["element_descriptions"]
+        expected = dict(descriptions)
+        assert len(expected) == len(MShellElement)
+
+        descriptions["Machine"] = "変更"
+        descriptions["追加"] = "追加"
+
+        other_descriptions = MShell().create_analysis("別テスト", "確認")["data"]["element_descriptions"]
+        assert other_descriptions == expected
+
     def test_analysis_templates_initialization(self):
         """分析テンプレート初期化のテスト"""
         templates = self.mshell.analysis_templates
@@ -436,6 +568,16 @@ class TestMShell:
         assert len(checkpoints) > 0
         assert any("制御" in cp or "フィードバック" in cp for cp in checkpoints)
 
+    def test_interface_checkpoints_order_independent(self):
+        """要素の指定順に関係なく同じチェックポイントが提示されることのテスト"""
+        analysis_id = self.mshell.create_analysis("テストシステム", "テスト目的")["data"]["analysis_id"]
+
+        forward = self.mshell.analyze_interface(analysis_id, "Machine", "Software", ["遅延"], 5)
+        backward = self.mshell.analyze_interface(analysis_id, "Software", "Machine", ["遅延"], 5)
+
+        assert forward["data"]["suggested_checkpoints"]
+        assert forward["data"]["suggested_checkpoints"] == backward["data"]["suggested_checkpoints"]
+
     def test_comprehensive_mshell_workflow(self):
         """包括的なm-SHELLワークフローのテスト"""
         # 1. 分析作成
@@ -496,7 +638,7 @@ class TestMShell:
         
         for severity_enum, expected_label in severities:
             element = ElementAnalysis(MShellElement.MACHINE, ["テスト"], severity_enum)
-            assert element._get_severity_label() == expected_label
+            assert element.to_dict()["severity"]["label"] == expected_label
         
         # 品質レベルのテスト
         quality_levels = [
@@ -512,6 +654,16 @@ class TestMShell:
             )
             assert interface._get_quality_level() == expected_level
 
+    def test_overall_level_boundaries(self):
+        """総合評価レベルの境界値のテスト"""
+        levels = [
+            (10, "優秀"), (8, "優秀"), (7.99, "良好"), (6, "良好"),
+            (4, "普通"), (2, "要改善"), (1.99, "危険"), (0, "危険")
+        ]
+
+        for score, expected_level in levels:
+            assert self.mshell._get_overall_level(score) == expected_level
+
     def test_system_evaluation_edge_cases(self):
         """システム評価のエッジケーステスト"""
         create_result = self.mshell.create_analysis("エッジケーステスト", "境界値確認")
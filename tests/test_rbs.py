@@ -1,6 +1,7 @@
 """Tests for PMBOK RBS (Risk Breakdown Structure)."""
 
 import pytest
+from datetime import datetime
 from src.analysis_support.tools.rbs import RBS, RiskCategory, RiskProbability, RiskImpact, RiskItem, RBSAnalysis
 
 
@@ -24,6 +25,21 @@ class TestRBS:
         assert "rbs_structure" in result["data"]
         assert "recommended_focus" in result["data"]
 
+    def test_structure_tree_is_independent_per_analysis(self):
+        """RBS構造ツリーの内容が正しく、変更しても他の分析やテンプレートに影響しないことのテスト"""
+        first = self.rbs.create_structure("プロジェクト1", "IT・システム開発")["data"]["rbs_structure"]
+        first["技術的リスク"]["subcategories"]["技術要件"]["risk_examples"].append("追加")
+        first["外部リスク"]["total_examples"] = 0
+        second = RBS().create_structure("プロジェクト2", "組織変革")["data"]["rbs_structure"]
+
+        assert list(second) == [category.value for category in RiskCategory]
+        assert second["外部リスク"]["total_examples"] > 0
+        assert len(second["技術的リスク"]["subcategories"]["技術要件"]["risk_examples"]) == 3
+        assert len(self.rbs.risk_templates[RiskCategory.TECHNICAL]["技術要件"]) == 3
+        technical = second["技術的リスク"]
+        assert technical["total_examples"] == 9
+        assert technical["subcategories"]["技術要件"]["count"] == 3
+
     def test_create_structure_with_context(self):
         """コンテキスト付きRBS構造作成のテスト"""
         result = self.rbs.create_structure(
@@ -69,6 +85,13 @@ class TestRBS:
         focus = result["data"]["recommended_focus"]
         assert any("組織リスク" in item or "抵抗" in item for item in focus)
 
+        # 未定義のタイプは既定の推奨事項。返されたリストを変更しても次回に影響しない
+        focus = self.rbs.create_structure("その他", "未定義タイプ")["data"]["recommended_focus"]
+        assert "全カテゴリをバランスよく検討" in focus
+        focus.clear()
+        focus = self.rbs.create_structure("その他2", "未定義タイプ")["data"]["recommended_focus"]
+        assert len(focus) == 3
+
     def test_identify_risks_basic(self):
         """基本的なリスク識別のテスト"""
         # まずRBS構造を作成
@@ -122,6 +145,22 @@ class TestRBS:
         assert "❌" in result["message"]
         assert "無効なリスクカテゴリ" in result["message"]
 
+    def test_identify_risks_is_atomic(self):
+        """不正なリスクが含まれる場合に1件も追加されないことのテスト"""
+        analysis_id = self.rbs.create_structure("テストプロジェクト", "IT・システム開発")["data"]["analysis_id"]
+        risks = [
+            {"name": "正常なリスク", "description": "説明", "probability": 3, "impact": 3},
+            {"name": "確率が範囲外", "description": "説明", "probability": 9, "impact": 3}
+        ]
+
+        result = self.rbs.identify_risks(analysis_id, "技術的リスク", "品質保証", risks)
+
+        assert result["success"] is False
+        assert "2件目" in result["message"]
+        analysis = self.rbs.analyses[analysis_id]
+        assert analysis.risks == []
+        assert analysis.category_counts == {}
+
     def test_evaluate_risks_basic(self):
         """基本的なリスク評価のテスト"""
         # RBS構造作成とリスク追加
@@ -193,6 +232,12 @@ class TestRBS:
         assert len(matrix["5"]["5"]) == 1
         assert matrix["5"]["5"][0]["name"] == "高確率高影響"
 
+        # リスクのないセルも含めた5×5の全セルが存在することを確認
+        assert list(matrix) == ["1", "2", "3", "4", "5"]
+        assert all(list(row) == ["1", "2", "3", "4", "5"] for row in matrix.values())
+        assert matrix["3"]["3"] == []
+        assert sum(len(cell) for row in matrix.values() for cell in row.values()) == 3
+
     def test_priority_grouping(self):
         """優先度別グループ化のテスト"""
         structure_result = self.rbs.create_structure("テストプロジェクト", "IT・システム開発")
@@ -220,6 +265,20 @@ class TestRBS:
         assert groups["最高優先"][0]["name"] == "最高優先"
         assert groups["高優先"][0]["name"] == "高優先"
 
+    def test_priority_group_ordering(self):
+        """優先度グループ内がスコア・影響度の降順に並ぶことのテスト"""
+        analysis_id = self.rbs.create_structure("テストプロジェクト", "IT・システム開発")["data"]["analysis_id"]
+        risks = [
+            {"name": "スコア16・影響度4", "description": "説明", "probability": 4, "impact": 4},
+            {"name": "スコア20・影響度4", "description": "説明", "probability": 5, "impact": 4},
+            {"name": "スコア20・影響度5", "description": "説明", "probability": 4, "impact": 5}
+        ]
+        self.rbs.identify_risks(analysis_id, "技術的リスク", "品質保証", risks)
+
+        group = self.rbs.evaluate_risks(analysis_id)["data"]["priority_groups"]["最高優先"]
+
+        assert [risk["name"] for risk in group] == ["スコア20・影響度5", "スコア20・影響度4", "スコア16・影響度4"]
+
     def test_risk_statistics_calculation(self):
         """リスク統計計算のテスト"""
         structure_result = self.rbs.create_structure("テストプロジェクト", "IT・システム開発")
@@ -327,6 +386,76 @@ class TestRBS:
         assert risk_dict["probability"]["label"] == "低い"
         assert risk_dict["impact"]["label"] == "非常に重大"
 
+    def test_risk_item_priority_levels(self):
+        """リスクスコアと優先度の対応テスト"""
+        cases = [
+            (RiskProbability.VERY_LOW, RiskImpact.MEDIUM, "最低優先"),   # 3
+            (RiskProbability.LOW, RiskImpact.LOW, "低優先"),             # 4
+            (RiskProbability.LOW, RiskImpact.HIGH, "中優先"),            # 8
+            (RiskProbability.MEDIUM, RiskImpact.HIGH, "高優先"),         # 12
+            (RiskProbability.HIGH, RiskImpact.HIGH, "最高優先"),         # 16
+            (RiskProbability.VERY_HIGH, RiskImpact.VERY_HIGH, "最高優先")  # 25
+        ]
+
+        for probability, impact, expected in cases:
+            risk = RiskItem("リスク", "説明", RiskCategory.TECHNICAL, "サブ", probability, impact)
+            assert risk.to_dict()["priority"] == expected
+
+    def test_probability_and_impact_are_integers(self):
+        """発生確率・影響度が整数として扱えることのテスト"""
+        risk = RiskItem("リスク", "説明", RiskCategory.TECHNICAL, "サブ", RiskProbability.HIGH, RiskImpact.LOW)
+
+        assert RiskProbability.HIGH == 4
+        assert type(risk.risk_score) is int
+        assert risk.risk_score == 8
+        assert type(risk.to_dict()["impact"]["value"]) is int
+
+    def test_risk_item_to_dict_levels(self):
+        """全レベルの発生確率・影響度が値とラベルで辞書化されることのテスト"""
+        for level, label in zip(RiskImpact, ("非常に軽微", "軽微", "中程度", "重大", "非常に重大")):
+            risk = RiskItem("リスク", "説明", RiskCategory.TECHNICAL, "サブ", RiskProbability(level.value), level)
+            data = risk.to_dict()
+            assert data["impact"] == {"value": level.value, "label": label}
+            assert data["probability"]["value"] == level.value
+
+    def test_risk_item_to_dict_returns_independent_copies(self):
+        """RiskItem.to_dictの戻り値を変更しても次回の結果や他のリスクに影響しないことのテスト"""
+        risk = RiskItem("リスク", "説明", RiskCategory.TECHNICAL, "サブ")
+        other = RiskItem("別リスク", "説明", RiskCategory.TECHNICAL, "サブ")
+        expected = risk.to_dict()
+
+        data = risk.to_dict()
+        data["name"] = "変更"
+        data["probability"]["label"] = "変更"
+        data["impact"]["value"] = 99
+
+        assert risk.to_dict() == expected
+        assert other.to_dict()["probability"] == {"value": 3, "label": "中程度"}
+        assert other.to_dict()["impact"] == {"value": 3, "label": "中程度"}
+
+    def test_analysis_timestamps(self):
+        """作成・更新日時が時刻と表示文字列の両方で取得できることのテスト"""
+        before = datetime.now().replace(microsecond=0)
+        analysis = RBSAnalysis("テスト", "IT・システム開発")
+        created_at = analysis.created_at
+        analysis.add_risk(RiskItem("リスク", "説明", RiskCategory.TECHNICAL, "サブ"))
+
+        assert before <= created_at <= analysis.updated_at <= datetime.now()
+        data = analysis.to_dict()
+        assert data["created_at"] == created_at.strftime('%Y-%m-%d %H:%M:%S')
+        assert data["updated_at"] == analysis.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+        assert analysis.risks[0].to_dict()["created_at"] == analysis.risks[0].created_at.strftime('%Y-%m-%d %H:%M:%S')
+
+    def test_analysis_classes_use_slots(self):
+        """リスク・分析クラスが__slots__を使用していることのテスト"""
+        instances = (
+            RiskItem("リスク", "説明", RiskCategory.TECHNICAL, "サブ"),
+            RBSAnalysis("テスト", "IT・システム開発")
+        )
+
+        for instance in instances:
+            assert not hasattr(instance, "__dict__")
+
     def test_rbs_analysis_risk_management(self):
         """RBSAnalysisクラスのリスク管理テスト"""
         analysis = RBSAnalysis("テストプロジェクト", "IT・システム開発", "テストコンテキスト")
@@ -354,6 +483,15 @@ class TestRBS:
         assert high_priority[0].name == "高リスク"
         assert high_priority[0].risk_score == 20  # 4 * 5 = 20
 
+        # 追加時に集計されたカテゴリ別件数
+        assert analysis.category_counts == {"技術的リスク": 1, "組織リスク": 1, "外部リスク": 1}
+        assert analysis.high_priority_count == 1
+        assert analysis.to_dict()["high_priority_count"] == 1
+
+        # 取得したリストを変更しても分析の索引には影響しない
+        tech_risks.clear()
+        assert len(analysis.get_risks_by_category(RiskCategory.TECHNICAL)) == 1
+
     def test_comprehensive_rbs_workflow(self):
         """包括的なRBSワークフローのテスト"""
         # 1. RBS構造作成
@@ -420,6 +558,18 @@ class TestRBS:
         # 基本的な推奨事項
         assert any("定期的なリスク評価" in rec for rec in recommendations)
 
+    def test_risk_recommendations_focus_category(self):
+        """最もリスクの多いカテゴリが推奨事項に含まれることのテスト"""
+        analysis_id = self.rbs.create_structure("テストプロジェクト", "IT・システム開発")["data"]["analysis_id"]
+        self.rbs.identify_risks(analysis_id, "技術的リスク", "技術要件",
+                                [{"name": "技術", "description": "説明"}])
+        self.rbs.identify_risks(analysis_id, "外部リスク", "市場環境",
+                                [{"name": f"外部{i}", "description": "説明"} for i in range(2)])
+
+        recommendations = self.rbs.evaluate_risks(analysis_id)["data"]["recommendations"]
+
+        assert "📊 外部リスクに集中したリスク対策を検討" in recommendations
+
     def test_long_project_name_handling(self):
         """長いプロジェクト名の処理テスト"""
         long_name = "非常に長いプロジェクト名" * 10
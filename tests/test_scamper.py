@@ -3,7 +3,7 @@
 import pytest
 from datetime import datetime
 
-from analysis_support.tools.scamper import SCAMPER, SCAMPERTechnique
+from analysis_support.tools.scamper import SCAMPER, SCAMPERTechnique, TECHNIQUE_NAMES
 
 
 class TestSCAMPER:
@@ -128,6 +128,7 @@ class TestSCAMPER:
         
         assert result["success"] is True
         assert len(result["evaluation_results"]) == 2
+        assert result["unmatched_evaluations"] == []
         assert "top_ideas" in result
         assert "technique_statistics" in result
         assert "evaluation_summary" in result
@@ -136,6 +137,28 @@ class TestSCAMPER:
         top_idea = result["top_ideas"][0]
         assert top_idea["total_score"] == 16  # 7 + 9
     
+    def test_evaluate_ideas_by_id(self) -> None:
+        """アイデアIDによる評価と、重複した文面・未登録アイデアの扱いのテスト."""
+        session_id = self.analyzer.start_session("効率化", "作業効率を上げたい")["session_id"]
+        first = self.analyzer.apply_technique(session_id, "substitute", ["自動化"])["added_ideas"][0]
+        second = self.analyzer.apply_technique(session_id, "combine", ["自動化"])["added_ideas"][0]
+
+        evaluations = [
+            {"id": second["id"], "feasibility": 5, "impact": 5},
+            {"idea": "自動化", "feasibility": 8, "impact": 8},
+            {"idea": "未登録のアイデア", "feasibility": 1, "impact": 1}
+        ]
+        result = self.analyzer.evaluate_ideas(session_id, evaluations)
+
+        # 対象が見つからない評価は黙って捨てずに返し、失敗として扱う
+        assert result["success"] is False
+        assert "1件" in result["message"]
+        assert result["unmatched_evaluations"] == [evaluations[2]]
+        results = result["evaluation_results"]
+        assert [item["id"] for item in results] == [first["id"], second["id"]]
+        assert results[0]["technique"] == "Substitute"
+        assert results[1]["technique"] == "Combine"
+
     def test_evaluate_ideas_invalid_session(self) -> None:
         """無効なセッションでの評価テスト."""
         evaluations = [{"idea": "テスト", "feasibility": 5, "impact": 5}]
@@ -164,6 +187,17 @@ class TestSCAMPER:
         assert "recent_ideas" in result
         assert "session_notes" in result
     
+    def test_get_session_recent_ideas_order(self) -> None:
+        """最新アイデアが新しい順に最大5件返されることのテスト."""
+        session_id = self.analyzer.start_session("テスト", "テスト状況")["session_id"]
+        self.analyzer.apply_technique(session_id, "substitute", [f"アイデア{i}" for i in range(4)])
+        self.analyzer.apply_technique(session_id, "reverse", ["アイデア4", "アイデア5", "アイデア6"])
+        
+        recent_ideas = self.analyzer.get_session(session_id)["recent_ideas"]
+        
+        assert [idea["idea"] for idea in recent_ideas] == ["アイデア6", "アイデア5", "アイデア4", "アイデア3", "アイデア2"]
+        assert recent_ideas[0]["technique"] == "Reverse"
+    
     def test_get_session_invalid_id(self) -> None:
         """無効なIDでのセッション取得テスト."""
         result = self.analyzer.get_session("invalid_id")
@@ -198,6 +232,21 @@ class TestSCAMPER:
         assert "created_at" in session_info
         assert "updated_at" in session_info
     
+    def test_list_sessions_sorted_by_updated_at(self) -> None:
+        """セッション一覧が更新日時の降順で、日時が表示形式であることのテスト."""
+        before = datetime.now().replace(microsecond=0)
+        first_id = self.analyzer.start_session("セッション1", "状況1")["session_id"]
+        second_id = self.analyzer.start_session("セッション2", "状況2")["session_id"]
+        self.analyzer.apply_technique(first_id, "substitute", ["アイデア"])
+        
+        sessions = self.analyzer.list_sessions()["sessions"]
+        
+        assert [session["id"] for session in sessions] == [first_id, second_id]
+        session = self.analyzer._sessions[first_id]
+        assert before <= session.created_at <= session.updated_at <= datetime.now()
+        assert sessions[0]["created_at"] == session.created_at.strftime('%Y-%m-%d %H:%M:%S')
+        assert sessions[0]["updated_at"] == session.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+    
     def test_generate_comprehensive_ideas(self) -> None:
         """包括的アイデア生成のテスト."""
         topic = "リモートワーク環境改善"
@@ -225,8 +274,28 @@ class TestSCAMPER:
         assert self.analyzer._normalize_technique("代替") == SCAMPERTechnique.SUBSTITUTE
         assert self.analyzer._normalize_technique("結合") == SCAMPERTechnique.COMBINE
         
+        # 大文字・空白区切り
+        assert self.analyzer._normalize_technique("SUBSTITUTE") == SCAMPERTechnique.SUBSTITUTE
+        assert self.analyzer._normalize_technique("Put to other use") == SCAMPERTechnique.PUT_TO_OTHER_USE
+        assert self.analyzer._normalize_technique("PUT_TO_OTHER_USE") == SCAMPERTechnique.PUT_TO_OTHER_USE
+        
         # 無効な技法名
         assert self.analyzer._normalize_technique("invalid") is None
+        assert self.analyzer._normalize_technique("") is None
+    
+    def test_technique_tables_shared_across_instances(self) -> None:
+        """技法ガイド・マッピングがインスタンス間で共有されることのテスト."""
+        other = SCAMPER()
+        
+        assert other._technique_mapping is self.analyzer._technique_mapping
+        assert other._technique_guides is self.analyzer._technique_guides
+    
+    def test_schema_technique_names_are_valid(self) -> None:
+        """スキーマで受け付ける技法名がすべて正規化できることのテスト."""
+        normalized = {self.analyzer._normalize_technique(name) for name in TECHNIQUE_NAMES}
+        
+        assert None not in normalized
+        assert normalized == set(SCAMPERTechnique)
     
     def test_session_stats_calculation(self) -> None:
         """セッション統計計算のテスト."""
@@ -268,6 +337,31 @@ class TestSCAMPER:
         assert substitute_stats["avg_feasibility"] == 7.0  # (8 + 6) / 2
         assert substitute_stats["avg_impact"] == 8.0  # (7 + 9) / 2
         assert substitute_stats["avg_total_score"] == 15.0  # 7.0 + 8.0
+
+    def test_technique_statistics_after_reevaluation(self) -> None:
+        """再評価時に前回の評価が置き換えられることのテスト."""
+        session_id = self.analyzer.start_session("統計テスト", "テスト状況")["session_id"]
+        self.analyzer.apply_technique(session_id, "substitute", ["アイデア1", "アイデア2"])
+        self.analyzer.evaluate_ideas(session_id, [{"idea": "アイデア1", "feasibility": 2, "impact": 2}])
+        result = self.analyzer.evaluate_ideas(session_id, [
+            {"idea": "アイデア1", "feasibility": 8, "impact": 6},
+            {"idea": "アイデア2", "feasibility": 4, "impact": 10}
+        ])
+        
+        substitute_stats = result["technique_statistics"]["Substitute"]
+        assert substitute_stats["evaluated_ideas"] == 2
+        assert substitute_stats["avg_feasibility"] == 6.0
+        assert substitute_stats["avg_impact"] == 8.0
+        assert result["technique_statistics"]["Combine"]["total_ideas"] == 0
+    
+    def test_session_classes_use_slots(self) -> None:
+        """アイデア・セッションクラスが__slots__を使用していることのテスト."""
+        session_id = self.analyzer.start_session("テスト", "テスト状況")["session_id"]
+        self.analyzer.apply_technique(session_id, "substitute", ["アイデア"])
+        session = self.analyzer._sessions[session_id]
+        
+        for instance in (session, session.ideas[0]):
+            assert not hasattr(instance, "__dict__")
     
     def test_long_topic_truncation(self) -> None:
         """長いトピックの切り詰めテスト."""
@@ -282,6 +376,24 @@ class TestSCAMPER:
         if len(long_topic) > 30:
             assert session_info["topic"].endswith("...")
     
+    def test_returned_guides_are_independent_copies(self) -> None:
+        """返された技法ガイドを変更しても他のインスタンスや以降の結果に影響しないことのテスト."""
+        session_id = self.analyzer.start_session("テスト", "テスト状況")["session_id"]
+        guide = self.analyzer.apply_technique(session_id, "substitute", ["アイデア"])["technique_guide"]
+        guide["guide_questions"].append("追加の質問")
+        guide["description"] = "変更"
+        prompts = self.analyzer.generate_comprehensive_ideas("テスト", "テスト状況")["technique_prompts"]
+        prompts["Combine"]["guide_questions"].clear()
+        
+        other = SCAMPER()
+        other_session_id = other.start_session("別テスト", "テスト状況")["session_id"]
+        fresh = other.apply_technique(other_session_id, "substitute", ["アイデア"])["technique_guide"]
+        fresh_prompts = other.generate_comprehensive_ideas("別テスト", "テスト状況")["technique_prompts"]
+        
+        assert len(fresh["guide_questions"]) == 3
+        assert fresh["description"] == "何かを別のものに置き換える"
+        assert len(fresh_prompts["Combine"]["guide_questions"]) == 3
+    
     def test_technique_guides_initialization(self) -> None:
         """技法ガイド初期化のテスト."""
         guides = self.analyzer._technique_guides
@@ -1,10 +1,14 @@
 """MCP Analysis Support Server の統合テスト."""
 
+import json
+import threading
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-from analysis_support.server import server, call_tool, list_tools
+from analysis_support import server as server_module
+from analysis_support.server import server, call_tool, list_tools, DISPATCH
 
 
 class TestAnalysisSupportServer:
@@ -15,7 +19,7 @@ class TestAnalysisSupportServer:
         """利用可能なツール一覧取得のテスト."""
         tools = await list_tools()
         
-        assert len(tools) == 28  # 全MCPツール数
+        assert len(tools) == 29  # 全MCPツール数
         
         # 各ツールカテゴリが含まれていることを確認
         tool_names = [tool.name for tool in tools]
@@ -59,6 +63,9 @@ class TestAnalysisSupportServer:
         assert "mshell_evaluate_system" in tool_names
         assert "mshell_get_analysis" in tool_names
         assert "mshell_list_analyses" in tool_names
+        
+        # 一括実行ツール
+        assert "batch_execute" in tool_names
     
     @pytest.mark.asyncio
     async def test_why_analysis_start_tool(self) -> None:
@@ -73,10 +80,10 @@ class TestAnalysisSupportServer:
         assert len(result) == 1
         assert result[0]["type"] == "text"
         
-        # 結果を評価形式で解析
+        # 結果をJSON形式で解析
         response_text = result[0]["text"]
         assert "success" in response_text
-        assert "True" in response_text
+        assert '"success":true' in response_text
         assert "analysis_id" in response_text
     
     @pytest.mark.asyncio
@@ -87,7 +94,7 @@ class TestAnalysisSupportServer:
         start_result = await call_tool("why_analysis_start", start_args)
         
         # analysis_idを抽出（簡易実装）
-        response_dict = eval(start_result[0]["text"])
+        response_dict = json.loads(start_result[0]["text"])
         analysis_id = response_dict["analysis_id"]
         
         # 2. 回答追加
@@ -101,7 +108,7 @@ class TestAnalysisSupportServer:
         assert len(answer_result) == 1
         response_text = answer_result[0]["text"]
         assert "success" in response_text
-        assert "True" in response_text
+        assert '"success":true' in response_text
         
         # 3. 分析状況取得
         get_args = {"analysis_id": analysis_id}
@@ -132,7 +139,7 @@ class TestAnalysisSupportServer:
         assert len(result) == 1
         response_text = result[0]["text"]
         assert "success" in response_text
-        assert "True" in response_text
+        assert '"success":true' in response_text
         assert "mece_evaluation" in response_text
     
     @pytest.mark.asyncio
@@ -148,7 +155,7 @@ class TestAnalysisSupportServer:
         assert len(result) == 1
         response_text = result[0]["text"]
         assert "success" in response_text
-        assert "True" in response_text
+        assert '"success":true' in response_text
         assert "structure" in response_text
         assert "SWOT" in response_text
     
@@ -164,7 +171,7 @@ class TestAnalysisSupportServer:
         start_result = await call_tool("scamper_start_session", start_args)
         
         # session_idを抽出
-        response_dict = eval(start_result[0]["text"])
+        response_dict = json.loads(start_result[0]["text"])
         session_id = response_dict["session_id"]
         
         # 2. 技法適用
@@ -179,7 +186,7 @@ class TestAnalysisSupportServer:
         assert len(apply_result) == 1
         response_text = apply_result[0]["text"]
         assert "success" in response_text
-        assert "True" in response_text
+        assert '"success":true' in response_text
         
         # 3. アイデア評価
         eval_args = {
@@ -225,7 +232,7 @@ class TestAnalysisSupportServer:
         assert len(result) == 1
         response_text = result[0]["text"]
         assert "success" in response_text
-        assert "True" in response_text
+        assert '"success":true' in response_text
         assert "technique_prompts" in response_text
         assert "comprehensive_approach" in response_text
     
@@ -237,7 +244,7 @@ class TestAnalysisSupportServer:
         assert len(result) == 1
         response_text = result[0]["text"]
         assert "success" in response_text
-        assert "False" in response_text
+        assert '"success":false' in response_text
         assert "未知のツール" in response_text
     
     @pytest.mark.asyncio
@@ -261,7 +268,7 @@ class TestAnalysisSupportServer:
             "current_situation": "テスト状況"
         }
         start_result = await call_tool("scamper_start_session", start_args)
-        response_dict = eval(start_result[0]["text"])
+        response_dict = json.loads(start_result[0]["text"])
         session_id = response_dict["session_id"]
         
         # 日本語技法名で適用
@@ -275,7 +282,7 @@ class TestAnalysisSupportServer:
         assert len(result) == 1
         response_text = result[0]["text"]
         assert "success" in response_text
-        assert "True" in response_text
+        assert '"success":true' in response_text
     
     @pytest.mark.asyncio
     async def test_mece_auto_framework_selection(self) -> None:
@@ -303,7 +310,7 @@ class TestAnalysisSupportServer:
         why_start = await call_tool("why_analysis_start", {
             "problem": "顧客満足度が低下している"
         })
-        why_response = eval(why_start[0]["text"])
+        why_response = json.loads(why_start[0]["text"])
         analysis_id = why_response["analysis_id"]
         
         # 回答を追加して根本原因まで進む
@@ -333,12 +340,12 @@ class TestAnalysisSupportServer:
             "topic": "顧客満足度向上",
             "current_situation": "根本原因は予算不足による研修不足"
         })
-        scamper_response = eval(scamper_start[0]["text"])
+        scamper_response = json.loads(scamper_start[0]["text"])
         session_id = scamper_response["session_id"]
         
         # 全ての分析ツールが正常に動作することを確認
         assert why_response["success"] is True
-        mece_response = eval(mece_result[0]["text"])
+        mece_response = json.loads(mece_result[0]["text"])
         assert mece_response["success"] is True
         assert scamper_response["success"] is True
     
@@ -357,10 +364,10 @@ class TestAnalysisSupportServer:
         })
         
         # 各セッションが独立して動作することを確認
-        why1_response = eval(why_session1[0]["text"])
-        why2_response = eval(why_session2[0]["text"])
-        scamper1_response = eval(scamper_session1[0]["text"])
-        scamper2_response = eval(scamper_session2[0]["text"])
+        why1_response = json.loads(why_session1[0]["text"])
+        why2_response = json.loads(why_session2[0]["text"])
+        scamper1_response = json.loads(scamper_session1[0]["text"])
+        scamper2_response = json.loads(scamper_session2[0]["text"])
         
         # 全セッションのIDがユニークであることを確認
         ids = [
@@ -390,4 +397,303 @@ class TestAnalysisSupportServer:
             
             # 必須パラメータがある場合の確認
             if "required" in schema:
-                assert isinstance(schema["required"], list)
\ No newline at end of file
+                assert isinstance(schema["required"], list)
+    
+    def test_dispatch_table_covers_all_tools(self) -> None:
+        """ディスパッチテーブルが全ツールを網羅していることのテスト."""
+        import asyncio
+        tools = asyncio.run(list_tools())
+        
+        tool_names = {tool.name for tool in tools}
+        assert set(DISPATCH.keys()) == tool_names - {"batch_execute"}
+        assert server_module.VALID_NAMES == tool_names
+    
+    def test_schema_enums_shared_across_tools(self) -> None:
+        """複数ツールで使う列挙値リストが共有されていることのテスト."""
+        schemas = {tool.name: tool.inputSchema["properties"] for tool in server_module.TOOLS}
+        
+        interface = schemas["mshell_analyze_interface"]
+        assert interface["element1"]["enum"] is interface["element2"]["enum"]
+        assert interface["element1"]["enum"] is schemas["mshell_analyze_element"]["element"]["enum"]
+        assert schemas["mece_create_structure"]["framework"]["enum"][1:] == list(
+            server_module.FRAMEWORKS
+        )
+    
+    @pytest.mark.asyncio
+    async def test_list_tools_returns_cached_response(self) -> None:
+        """ツール一覧が呼び出しごとに再構築されないことのテスト."""
+        first = await list_tools()
+        second = await list_tools()
+        
+        assert first is second
+        assert isinstance(first, tuple)
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute(self) -> None:
+        """一括実行ツールのテスト."""
+        arguments = {
+            "operations": [
+                {"name": "why_analysis_start", "arguments": {"problem": "一括問題"}},
+                {"name": "swot_analysis", "arguments": {"topic": "一括テーマ"}},
+                {"name": "invalid_tool_name", "arguments": {}}
+            ]
+        }
+        
+        result = await call_tool("batch_execute", arguments)
+        
+        assert len(result) == 1
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict["success"] is False
+        assert response_dict["succeeded"] == 2
+        assert response_dict["failed"] == 1
+        assert [r["name"] for r in response_dict["results"]] == [
+            "why_analysis_start", "swot_analysis", "invalid_tool_name"
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_stop_on_error(self) -> None:
+        """一括実行のエラー時中止のテスト."""
+        arguments = {
+            "operations": [
+                {"name": "why_analysis_start", "arguments": {}},
+                {"name": "swot_analysis", "arguments": {"topic": "実行されない"}}
+            ],
+            "stop_on_error": True
+        }
+        
+        result = await call_tool("batch_execute", arguments)
+        
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict["success"] is False
+        assert len(response_dict["results"]) == 1
+        assert response_dict["skipped"] == 1
+        assert "エラー" in response_dict["results"][0]["message"]
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_unexpected_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """一括実行中の1操作で想定外の例外が起きても他の操作の結果が返されることのテスト."""
+        def handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            raise KeyError("missing")
+        
+        monkeypatch.setitem(DISPATCH, "why_analysis_start", handler)
+        arguments = {
+            "operations": [
+                {"name": "swot_analysis", "arguments": {"topic": "一括テーマ"}},
+                {"name": "why_analysis_start", "arguments": {"problem": "例外"}},
+                {"name": "mece_create_structure", "arguments": {"topic": "一括MECE"}}
+            ]
+        }
+        
+        result = await call_tool("batch_execute", arguments)
+        
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict["succeeded"] == 2
+        assert response_dict["failed"] == 1
+        failed = response_dict["results"][1]
+        assert failed["success"] is False
+        assert "KeyError" in failed["message"]
+        assert response_dict["results"][0]["result"]["success"] is True
+        assert response_dict["results"][2]["result"]["success"] is True
+    
+    @pytest.mark.asyncio
+    async def test_json_serialization_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """orjson未インストール時に標準jsonで応答を生成するテスト."""
+        monkeypatch.setattr(server_module, "HAS_ORJSON", False)
+        
+        result = await call_tool("swot_analysis", {"topic": "標準JSON"})
+        
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict["success"] is True
+        assert "標準JSON" in result[0]["text"]  # ensure_ascii=False
+    
+    @pytest.mark.asyncio
+    async def test_tools_run_on_worker_thread(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """ツールがイベントループとは別のワーカースレッドで実行されることのテスト."""
+        thread_names: List[str] = []
+        
+        def handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            thread_names.append(threading.current_thread().name)
+            return {"success": True}
+        
+        monkeypatch.setitem(DISPATCH, "why_analysis_start", handler)
+        await call_tool("why_analysis_start", {"problem": "スレッド確認"})
+        
+        assert len(thread_names) == 1
+        assert thread_names[0].startswith("analysis-support")
+        assert thread_names[0] != threading.current_thread().name
+    
+    @pytest.mark.asyncio
+    async def test_analysis_error_returns_message(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """AnalysisErrorのメッセージがそのままエラー応答になることのテスト."""
+        def handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            raise server_module.AnalysisError("❌ 既知のエラー")
+        
+        monkeypatch.setitem(DISPATCH, "why_analysis_start", handler)
+        result = await call_tool("why_analysis_start", {"problem": "エラー確認"})
+        
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict == {"success": False, "message": "❌ 既知のエラー"}
+    
+    @pytest.mark.asyncio
+    async def test_unexpected_error_is_propagated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """想定外の例外が握りつぶされずに送出されることのテスト."""
+        def handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            raise RuntimeError("不具合")
+        
+        monkeypatch.setitem(DISPATCH, "why_analysis_start", handler)
+        with pytest.raises(RuntimeError):
+            await call_tool("why_analysis_start", {"problem": "エラー確認"})
+    
+    def test_serialize_result_with_non_string_keys(self) -> None:
+        """文字列以外のキーを含む結果もJSONに変換できることのテスト."""
+        text = server_module._serialize_result({"success": True, "scores": {1: "低", 5: "高"}})
+        
+        assert json.loads(text) == {"success": True, "scores": {"1": "低", "5": "高"}}
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_for_pure_tools(self) -> None:
+        """状態を持たないツールの結果キャッシュのテスト."""
+        first = await call_tool("swot_analysis", {"topic": "キャッシュテーマ"})
+        second = await call_tool("swot_analysis", {"topic": "キャッシュテーマ"})
+        
+        assert first[0]["text"] == second[0]["text"]
+        assert ("swot_analysis", None, '{"topic": "キャッシュテーマ"}') in server_module._RESULT_CACHE
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_invalidated_by_state_change(self) -> None:
+        """状態変更ツール実行時に読み取りキャッシュが破棄されることのテスト."""
+        before = json.loads((await call_tool("why_analysis_list", {}))[0]["text"])
+        
+        start = json.loads((await call_tool("why_analysis_start", {"problem": "キャッシュ破棄"}))[0]["text"])
+        after = json.loads((await call_tool("why_analysis_list", {}))[0]["text"])
+        
+        assert len(after["analyses"]) == len(before["analyses"]) + 1
+        assert start["analysis_id"] in [a["id"] for a in after["analyses"]]
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_invalidated_per_target(self) -> None:
+        """状態変更時に対象IDと一覧のキャッシュのみ破棄されることのテスト."""
+        first = json.loads((await call_tool("why_analysis_start", {"problem": "対象A"}))[0]["text"])
+        second = json.loads((await call_tool("why_analysis_start", {"problem": "対象B"}))[0]["text"])
+        await call_tool("why_analysis_get", {"analysis_id": first["analysis_id"]})
+        await call_tool("why_analysis_get", {"analysis_id": second["analysis_id"]})
+        await call_tool("rbs_list_analyses", {})
+        
+        await call_tool("why_analysis_add_answer", {
+            "analysis_id": first["analysis_id"], "level": 0, "answer": "回答"
+        })
+        
+        cached = {(key[0], key[1]) for key in server_module._RESULT_CACHE}
+        assert ("why_analysis_get", first["analysis_id"]) not in cached
+        assert ("why_analysis_get", second["analysis_id"]) in cached
+        assert ("rbs_list_analyses", None) in cached
+        
+        refreshed = json.loads((await call_tool(
+            "why_analysis_get", {"analysis_id": first["analysis_id"]}
+        ))[0]["text"])
+        assert "回答" in json.dumps(refreshed, ensure_ascii=False)
+
+    @pytest.mark.asyncio
+    async def test_result_cache_invalidated_by_creation(self) -> None:
+        """作成系ツール実行時に同種の取得結果のキャッシュも破棄されることのテスト."""
+        created = json.loads((await call_tool("mshell_create_analysis", {
+            "system_name": "破棄対象", "analysis_purpose": "上限確認"
+        }))[0]["text"])
+        analysis_id = created["data"]["analysis_id"]
+        await call_tool("mshell_get_analysis", {"analysis_id": analysis_id})
+
+        await call_tool("mshell_create_analysis", {"system_name": "新規", "analysis_purpose": "上限確認"})
+
+        cached = {(key[0], key[1]) for key in server_module._RESULT_CACHE}
+        assert ("mshell_get_analysis", analysis_id) not in cached
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_response_is_reused(self) -> None:
+        """未知のツールへの応答が再構築されないことのテスト."""
+        first = await call_tool("another_invalid_tool", {})
+        second = await call_tool("another_invalid_tool", {})
+        
+        assert first is second
+        assert "another_invalid_tool" in first[0]["text"]
+    
+    def test_analyzer_instantiated_once(self) -> None:
+        """分析ツールが初回利用時に一度だけ生成されることのテスト."""
+        from analysis_support.tools.rbs import RBS
+        
+        analyzer = server_module._get_analyzer(RBS)
+        
+        assert server_module._analyzers[RBS] is analyzer
+        assert server_module._get_analyzer(RBS) is analyzer
+    
+    def test_session_state_uses_slots(self) -> None:
+        """セッション状態クラスが__slots__を使用していることのテスト."""
+        from analysis_support.tools.scamper import SCAMPERSession
+        from analysis_support.tools.rbs import RBSAnalysis
+        from analysis_support.tools.mshell import MShellAnalysis
+        
+        sessions = [
+            SCAMPERSession("id", "トピック", "状況"),
+            RBSAnalysis("プロジェクト", "IT・システム開発"),
+            MShellAnalysis("システム", "目的")
+        ]
+        
+        for session in sessions:
+            assert hasattr(session, "__slots__")
+            assert not hasattr(session, "__dict__")
+    
+    @pytest.mark.asyncio
+    async def test_missing_required_arguments(self) -> None:
+        """必須パラメータ不足時に例外を経由せずエラー応答を返すテスト."""
+        result = await call_tool("scamper_start_session", {"topic": "トピックのみ"})
+        
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict["success"] is False
+        assert "current_situation" in response_dict["message"]
+        assert "topic" not in response_dict["message"]
+    
+    @pytest.mark.asyncio
+    async def test_invalid_argument_type(self) -> None:
+        """スキーマに合わない引数の型がパラメータエラーになることのテスト."""
+        result = await call_tool("mshell_analyze_element", {
+            "analysis_id": "dummy",
+            "element": "Machine",
+            "findings": ["発見事項"],
+            "severity": 9
+        })
+        
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict["success"] is False
+        assert response_dict["message"].startswith("❌ パラメータエラー: severity:")
+    
+    @pytest.mark.asyncio
+    async def test_scamper_evaluation_requires_target(self) -> None:
+        """アイデア評価でIDも文面も指定しない場合にパラメータエラーとなることのテスト."""
+        result = await call_tool("scamper_evaluate_ideas", {
+            "session_id": "dummy",
+            "idea_evaluations": [{"feasibility": 5, "impact": 5}]
+        })
+        
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict["success"] is False
+        assert "パラメータエラー" in response_dict["message"]
+        assert "idea_evaluations.0" in response_dict["message"]
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_validates_operation_arguments(self) -> None:
+        """一括実行内の各操作の引数も検証されることのテスト."""
+        result = await call_tool("batch_execute", {
+            "operations": [
+                {"name": "mece_create_structure", "arguments": {"topic": "検証", "framework": "未対応"}}
+            ]
+        })
+        
+        response_dict = json.loads(result[0]["text"])
+        assert response_dict["failed"] == 1
+        assert "framework" in response_dict["results"][0]["message"]
+    
+    def test_initialization_options_cached(self) -> None:
+        """初期化オプションが再構築されないことのテスト."""
+        options = server_module._initialization_options()
+        
+        assert options.server_name == "analysis-support"
+        assert server_module._initialization_options() is options